@@ -0,0 +1,87 @@
+"""
+Benchmark del arranque de la CLI.
+
+Mide, en procesos nuevos, el tiempo hasta la primera línea de salida de
+'cli.py status', 'cli.py status --json' y 'cli.py --help' (mediana de
+varias ejecuciones), junto al de un intérprete vacío como referencia, y
+comprueba que ninguna orden importa PyQt5. Objetivo: status < 50 ms.
+
+Uso:
+    python benchmarks/bench_cli_startup.py [--runs N] [--budget MS]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(ROOT, 'cli.py')
+STATUS_BUDGET_MS = 50
+
+# Comprueba tras ejecutar la CLI que no se ha cargado nada de la interfaz
+PYQT_PROBE = r'''
+import runpy, sys
+sys.argv = [sys.argv[1], 'status']
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+except SystemExit:
+    pass
+print(any(name.startswith('PyQt5') for name in sys.modules))
+'''
+
+
+def first_output_ms(args, env):
+    """Tiempo (ms) desde el lanzamiento hasta la primera línea de salida."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable] + args, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, env=env)
+    process.stdout.readline()
+    elapsed = (time.perf_counter() - start) * 1000
+    process.communicate()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget', type=float, default=STATUS_BUDGET_MS)
+    args = parser.parse_args()
+
+    # Directorio personal aislado para no tocar el diario del usuario
+    home = tempfile.mkdtemp(prefix='energypy-cli-')
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+    try:
+        cases = [
+            ('intérprete vacío', ['-c', 'print()']),
+            ('status', [CLI, 'status']),
+            ('status --json', [CLI, 'status', '--json']),
+            ('--help', [CLI, '--help']),
+        ]
+        # Una ejecución previa genera los .pyc, como tras la instalación
+        first_output_ms([CLI, 'status'], env)
+
+        results = {}
+        for label, case_args in cases:
+            samples = [first_output_ms(case_args, env) for _ in range(args.runs)]
+            results[label] = statistics.median(samples)
+            print(f"{label:<18} mediana {results[label]:7.2f} ms   mín {min(samples):7.2f} ms")
+
+        probe = subprocess.run([sys.executable, '-c', PYQT_PROBE, CLI], env=env,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        pyqt_loaded = probe.stdout.decode().strip().splitlines()[-1] == 'True'
+        print(f"PyQt5 importado: {pyqt_loaded}")
+
+        if pyqt_loaded or results['status'] > args.budget:
+            print(f"FALLO: status supera {args.budget:.0f} ms o carga PyQt5")
+            sys.exit(1)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
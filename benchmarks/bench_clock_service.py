@@ -0,0 +1,119 @@
+"""
+Benchmark de los despertares del reloj de la interfaz.
+
+Comprueba con Qt en modo offscreen que:
+  * la aplicación completa (MainController) en reposo no recibe ningún
+    evento de temporizador de Qt;
+  * con una acción pendiente y la ventana visible hay un tick por segundo,
+    alineado con el cambio del segundo mostrado;
+  * con la ventana oculta y sin bandeja que actualizar (como en offscreen)
+    no hay ningún tick; con bandeja solo se despierta cuando cambia el icono
+    (ver bench_tray_render.py).
+
+Uso:
+    python benchmarks/bench_clock_service.py [--seconds N]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-clock-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QElapsedTimer, QEvent, QObject
+from PyQt5.QtWidgets import QApplication
+
+from controllers.main_controller import MainController
+
+
+class TimerEventCounter(QObject):
+    """Cuenta todos los eventos de temporizador que entrega la aplicación."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Timer:
+            self.count += 1
+        return False
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+def run_for(app, seconds):
+    """Procesa eventos de Qt durante el tiempo indicado."""
+    elapsed = QElapsedTimer()
+    elapsed.start()
+    while elapsed.elapsed() < seconds * 1000:
+        app.processEvents()
+        app.thread().msleep(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=float, default=3)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    counter = TimerEventCounter()
+    app.installEventFilter(counter)
+
+    controller = BenchController()
+    controller.start()
+    clock = controller.clock_service
+    failures = []
+
+    # Reposo: sin acciones pendientes no debe armarse ningún temporizador
+    run_for(app, 0.5)
+    counter.count = 0
+    run_for(app, args.seconds)
+    print(f"reposo:        {counter.count} eventos de temporizador, "
+          f"{clock.wakeups} ticks, {clock.wakeups_per_minute()} despertares/min")
+    if counter.count or clock.wakeups:
+        failures.append("hay despertares en reposo")
+
+    # Cuenta regresiva visible: un tick por segundo alineado con el segundo
+    # mostrado (la acción se adopta sin emitir ningún comando del sistema)
+    controller.system_model.adopt_scheduled_action('shutdown', 3600.4)
+    controller.update_countdown()
+    deadline = controller.system_model.get_scheduled_info()['deadline']
+    offsets = []
+    clock.tick.connect(lambda: offsets.append((deadline - clock.clock()) % 1.0))
+    run_for(app, args.seconds)
+    # Distancia (ms) al instante en que cambia el segundo mostrado
+    lags = [(1.0 - offset) * 1000 for offset in offsets]
+    print(f"visible:       {len(offsets)} ticks en {args.seconds:.0f} s, retraso tras la "
+          f"frontera de segundo {min(lags):.1f}-{max(lags):.1f} ms")
+    if abs(len(offsets) - args.seconds) > 1 or max(lags) > 50:
+        failures.append("ticks no alineados con el segundo")
+
+    # Ventana oculta en la bandeja: ningún tick aunque haya una acción pendiente
+    controller.main_view.hide()
+    before = clock.wakeups
+    run_for(app, args.seconds)
+    print(f"oculta:        {clock.wakeups - before} ticks con una acción pendiente")
+    if clock.wakeups != before or clock.is_active():
+        failures.append("hay ticks con la ventana oculta")
+
+    controller.system_model.drop_system_jobs()
+    controller.system_model.journal.close()
+    clock.stop()
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    if failures:
+        print(f"FALLO: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark de la latencia que sufre el hilo que lanza un comando del sistema.
+
+Compara la ejecución síncrona anterior (subprocess.run en el slot de Qt) con
+el encolado en CommandExecutor, usando un comando lento que simula un
+`shutdown` colgado. El presupuesto es un fotograma (16,7 ms). Comprueba
+además que los comandos terminan en el orden en que se encolaron.
+
+Uso:
+    python benchmarks/bench_command_executor.py [--runs N] [--command-delay S]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.command_executor import CommandExecutor
+
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--command-delay', type=float, default=0.3)
+    args = parser.parse_args()
+
+    command = [sys.executable, '-c', f'import time; time.sleep({args.command_delay})']
+
+    # Ejecución síncrona (comportamiento anterior)
+    start = time.perf_counter()
+    subprocess.run(command)
+    sync_ms = (time.perf_counter() - start) * 1000
+
+    # Ejecución en segundo plano
+    executor = CommandExecutor(max_pending=args.runs)
+    finished = threading.Semaphore(0)
+    order = []
+
+    def on_result(result):
+        order.append(result['context'])
+        finished.release()
+
+    executor.add_listener(on_result)
+    latencies = []
+    for i in range(args.runs):
+        start = time.perf_counter()
+        executor.run_command('bench', command, timeout=args.command_delay * 10, context=i)
+        latencies.append((time.perf_counter() - start) * 1000)
+    for _ in range(args.runs):
+        finished.acquire()
+    executor.shutdown()
+
+    worst = max(latencies)
+    print(f"síncrono:  {sync_ms:8.3f} ms bloqueando el hilo de la interfaz")
+    print(
+        f"ejecutor:  media={statistics.mean(latencies):.3f} ms  "
+        f"max={worst:.3f} ms ({args.runs} comandos encolados)"
+    )
+    in_order = order == list(range(args.runs))
+    print(f"orden de ejecución: {'el de encolado' if in_order else 'ALTERADO'}")
+    if not in_order:
+        print("FALLO: los comandos no se ejecutan en el orden en que se encolan")
+        sys.exit(1)
+    if worst > FRAME_BUDGET_MS:
+        print(f"FALLO: se supera el presupuesto de {FRAME_BUDGET_MS:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark de la configuración por capas.
+
+En un directorio personal aislado, con tres archivos del equipo (valores
+predeterminados y una clave bloqueada) y una variable de entorno, mide:
+  * el coste de get_config(clave) sobre la vista combinada precalculada
+    frente a resolver cada consulta recorriendo las capas (ChainMap);
+  * las combinaciones de capas durante una sesión típica: consultas,
+    cambios del usuario y avisos del vigilante sin cambios reales, frente a
+    un cambio del administrador;
+  * el tiempo de carga del modelo con las capas.
+Comprueba además la precedencia de las capas y el bloqueo de claves.
+
+Uso:
+    python benchmarks/bench_config_layers.py [--lookups N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from collections import ChainMap
+
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-layers-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.config_model import ENV_PREFIX, ConfigModel
+
+KEYS = ('theme', 'language', 'show_notifications', 'minimize_to_tray',
+        'foreign_schedule_policy', 'last_used_time_value')
+
+
+def write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def lookup_ns(get, lookups):
+    """Nanosegundos por consulta (mediana de 5 tandas)."""
+    runs = []
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for i in range(lookups):
+            get(KEYS[i % len(KEYS)])
+        runs.append((time.perf_counter_ns() - start) / lookups)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lookups', type=int, default=200000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    system_dir = os.path.join(os.environ['HOME'], 'etc-energypy')
+    os.makedirs(system_dir)
+    write_json(os.path.join(system_dir, '10-empresa.json'),
+               {'defaults': {'language': 'en', 'theme': 'dark'}})
+    write_json(os.path.join(system_dir, '20-seguridad.json'),
+               {'locked': {'foreign_schedule_policy': 'cancel'}})
+    write_json(os.path.join(system_dir, '30-equipo.json'),
+               {'defaults': {'minimize_to_tray': False}})
+    os.environ[ENV_PREFIX + 'SHOW_NOTIFICATIONS'] = 'false'
+
+    loads = []
+    for _ in range(20):
+        start = time.perf_counter()
+        model = ConfigModel(flush_delay=0, system_dir=system_dir)
+        loads.append((time.perf_counter() - start) * 1000)
+
+    # Resolución en cada consulta: mismas capas, sin vista precalculada
+    chain = ChainMap(model._locked, model._env, model._user, model.default_config)
+    cached = lookup_ns(model.get_config, args.lookups)
+    chained = lookup_ns(chain.__getitem__, args.lookups)
+
+    # Sesión típica: consultas, cambios del usuario y avisos sin cambios reales
+    model = ConfigModel(flush_delay=0, system_dir=system_dir)
+    for i in range(1000):
+        model.get_config(KEYS[i % len(KEYS)])
+    with model.batch():
+        model.set_config('theme', 'light')
+        model.set_config('last_used_time_value', 45)
+    for _ in range(10):
+        model.reload()
+    session_merges = model.merges
+    # Un administrador cambia un archivo del equipo
+    write_json(os.path.join(system_dir, '30-equipo.json'),
+               {'defaults': {'minimize_to_tray': False}, 'locked': {'theme': 'dark'}})
+    changes = model.reload()
+    model.reload()
+    admin_merges = model.merges - session_merges
+
+    with open(model.config_file, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    checks = {
+        'predeterminado del equipo': model.get_config('language') == 'en',
+        'variable de entorno': model.get_config('show_notifications') is False,
+        'clave bloqueada': (not model.set_config('foreign_schedule_policy', 'adopt')
+                            and model.get_config('foreign_schedule_policy') == 'cancel'),
+        'bloqueo nuevo del administrador': changes == {'theme': 'dark'} and model.is_locked('theme'),
+        'archivo del usuario solo con sus valores': saved == {'theme': 'light',
+                                                             'last_used_time_value': 45},
+    }
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+
+    print(f"carga del modelo con 3 archivos del equipo: {statistics.median(loads):.2f} ms")
+    print(f"get_config: {cached:.0f} ns/consulta con la vista combinada, "
+          f"{chained:.0f} ns recorriendo las capas")
+    print(f"combinaciones: {session_merges} en la sesión (1000 consultas, 2 cambios, "
+          f"10 avisos sin cambios), {admin_merges} tras el cambio del administrador")
+    for name, ok in checks.items():
+        print(f"  {name}: {'sí' if ok else 'NO'}")
+
+    if session_merges != 1 or admin_merges != 1 or cached >= chained or not all(checks.values()):
+        print("FALLO: la configuración por capas no se resuelve o no se cachea como se espera")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
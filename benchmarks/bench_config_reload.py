@@ -0,0 +1,162 @@
+"""
+Benchmark de la recarga en caliente de la configuración.
+
+Con Qt en modo offscreen y un directorio personal aislado, arranca la
+aplicación y sustituye config.json desde fuera como lo haría una
+herramienta de administración (archivo temporal y renombrado). Mide:
+  * la latencia desde la sustitución hasta que el cambio está aplicado,
+    con inotify y con el sondeo de respaldo;
+  * el coste de aplicar solo las claves cambiadas frente a recargar toda
+    la interfaz (tema, textos y valores de la vista);
+  * las comprobaciones del sondeo durante 10 minutos sin cambios, con el
+    intervalo creciente frente a un intervalo fijo de 1 s.
+Comprueba además que las escrituras propias no se notifican como cambios.
+
+Uso:
+    python benchmarks/bench_config_reload.py [--changes N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-reload-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from controllers.main_controller import MainController
+from utils.file_watcher import FileWatcher
+
+IDLE_SECONDS = 600
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+def external_write(path, **changes):
+    """Sustituye config.json como una herramienta externa."""
+    config = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    config.update(changes)
+    with open(f'{path}.fleet', 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=4)
+    os.replace(f'{path}.fleet', path)
+
+
+def wait_applied(app, controller, key, value, timeout=40):
+    """Procesa eventos hasta que la clave tiene el valor; devuelve ms o None."""
+    start = time.perf_counter()
+    while controller.config.get(key) != value:
+        app.processEvents()
+        if time.perf_counter() - start > timeout:
+            return None
+        time.sleep(0.0005)
+    return (time.perf_counter() - start) * 1000
+
+
+def polling_checks(seconds):
+    """Comprobaciones del sondeo con intervalo creciente en un periodo sin cambios."""
+    watcher = FileWatcher(os.path.join(os.environ['HOME'], 'nada.json'), use_inotify=False)
+    elapsed, checks = 0.0, 0
+    while elapsed < seconds:
+        elapsed += watcher.next_interval()
+        watcher.check()
+        checks += 1
+    return checks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--changes', type=int, default=10)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    controller = BenchController()
+    controller.start()
+    while controller.config_watcher is None:
+        app.processEvents()
+    logging.disable(logging.INFO)
+    model = controller.config_model
+    notified = []
+    model.add_change_listener(notified.append)
+
+    # Latencia con el mecanismo elegido (inotify en Linux)
+    latencies = []
+    for i in range(args.changes):
+        theme = 'dark' if controller.config['theme'] == 'light' else 'light'
+        external_write(model.config_file, theme=theme)
+        latencies.append(wait_applied(app, controller, 'theme', theme))
+    applied_theme = controller.theme_engine.current_theme == controller.config['theme']
+
+    # Escrituras propias: no deben notificarse
+    notified.clear()
+    model.set_config('last_used_time_value', 42)
+    model.flush()
+    deadline = time.perf_counter() + 0.3
+    while time.perf_counter() < deadline:
+        app.processEvents()
+    own_echo = len(notified)
+
+    # Coste de aplicar solo el delta frente a recargar toda la interfaz
+    delta, full = [], []
+    for i in range(args.changes):
+        start = time.perf_counter()
+        controller._on_config_changed({'minimize_to_tray': bool(i % 2)})
+        delta.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        controller.theme_engine.current_theme = None
+        controller._load_theme()
+        controller._reload_ui_texts()
+        controller._load_config_to_view()
+        full.append((time.perf_counter() - start) * 1000)
+
+    # Latencia con el sondeo de respaldo (intervalo mínimo tras cada cambio)
+    controller.config_notifier.setEnabled(False)
+    controller.config_watcher = FileWatcher(model.config_file, use_inotify=False)
+    controller._schedule_config_poll()
+    polled = []
+    for i in range(3):
+        time.sleep(0.01)
+        theme = 'dark' if controller.config['theme'] == 'light' else 'light'
+        external_write(model.config_file, theme=theme)
+        polled.append(wait_applied(app, controller, 'theme', theme))
+
+    checks = polling_checks(IDLE_SECONDS)
+    controller.system_model.journal.close()
+    controller.clock_service.stop()
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+
+    print(f"inotify: mediana {statistics.median(latencies):.1f} ms hasta aplicar el tema "
+          f"({args.changes} cambios)")
+    print(f"sondeo:  máx. {max(polled) / 1000:.2f} s hasta aplicar el tema "
+          f"(intervalo mínimo {controller.config_watcher.min_interval:.0f} s)")
+    print(f"aplicar solo el delta: {statistics.median(delta):.3f} ms; "
+          f"recargar toda la interfaz: {statistics.median(full):.1f} ms")
+    print(f"comprobaciones del sondeo en {IDLE_SECONDS // 60} min sin cambios: {checks} "
+          f"(intervalo fijo de 1 s: {IDLE_SECONDS})")
+    print(f"avisos por escrituras propias: {own_echo}")
+
+    del app
+    if (None in latencies or None in polled or not applied_theme or own_echo
+            or statistics.median(delta) >= statistics.median(full) or checks >= IDLE_SECONDS):
+        print("FALLO: la recarga en caliente no aplica los cambios o aplica de más")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
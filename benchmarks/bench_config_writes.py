@@ -0,0 +1,139 @@
+"""
+Benchmark de las escrituras de configuración por acción del usuario.
+
+Reproduce sobre ConfigModel, en un directorio personal aislado, los cambios
+de configuración de tres acciones: programar (4 claves), guardar la
+configuración (5 claves) y una ráfaga de 10 cambios de tema. Compara:
+  * antes: una reescritura directa de config.json por cada clave;
+  * lote: batch() con guardado inmediato (flush_delay=0), una escritura
+    atómica (temporal, fsync y renombrado) por acción;
+  * lote diferido: batch() con el guardado agrupado en segundo plano; la
+    latencia es la que ve el hilo de la interfaz.
+
+Informa de las escrituras del archivo y de la latencia mediana por acción, y
+comprueba que el archivo final es válido y no quedan temporales.
+
+Uso:
+    python benchmarks/bench_config_writes.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-config-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.config_model import DEFAULT_FLUSH_DELAY, ConfigModel
+
+
+def schedule_click(set_config, i):
+    set_config('last_used_action', 'restart' if i % 2 else 'shutdown')
+    set_config('last_used_tab', 0)
+    set_config('last_used_time_value', 30 + i)
+    set_config('last_used_time_unit', 'minutes')
+
+
+def save_settings(set_config, i):
+    set_config('language', 'es')
+    set_config('show_notifications', bool(i % 2))
+    set_config('minimize_to_tray', True)
+    set_config('start_minimized', False)
+    set_config('foreign_schedule_policy', 'adopt')
+
+
+def theme_burst(set_config, i):
+    for toggle in range(10):
+        set_config('theme', 'dark' if (i + toggle) % 2 else 'light')
+
+
+ACTIONS = (('programar', schedule_click), ('guardar ajustes', save_settings),
+           ('10 cambios de tema', theme_burst))
+
+
+class LegacyWriter:
+    """Escritura anterior: el archivo completo con indent=4 por cada clave."""
+
+    def __init__(self, model):
+        self.model = model
+        self.writes = 0
+
+    def set_config(self, key, value):
+        self.model.config[key] = value
+        with open(self.model.config_file, 'w', encoding='utf-8') as f:
+            json.dump(self.model.config, f, indent=4)
+        self.writes += 1
+
+
+def measure_legacy(action, repeat):
+    writer = LegacyWriter(ConfigModel(flush_delay=0))
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        action(writer.set_config, i)
+        times.append((time.perf_counter() - start) * 1000)
+    return writer.writes / repeat, statistics.median(times)
+
+
+def measure_batched(action, repeat, flush_delay):
+    model = ConfigModel(flush_delay=flush_delay)
+    model.writes = 0
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        with model.batch():
+            action(model.set_config, i)
+        times.append((time.perf_counter() - start) * 1000)
+        if flush_delay:
+            # Acciones separadas por más que el retardo de agrupación
+            time.sleep(flush_delay * 1.5)
+    model.close()
+    return model.writes / repeat, statistics.median(times), model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--delay', type=float, default=DEFAULT_FLUSH_DELAY / 5)
+    args = parser.parse_args()
+
+    print(f"{'':<20}{'antes':>18}{'lote':>18}{'lote diferido':>20}")
+    failures = []
+    for name, action in ACTIONS:
+        legacy_writes, legacy_ms = measure_legacy(action, args.repeat)
+        batch_writes, batch_ms, _ = measure_batched(action, args.repeat, 0)
+        deferred_writes, deferred_ms, model = measure_batched(action, args.repeat, args.delay)
+        print(f"{name:<20}{legacy_writes:>5.0f} esc. {legacy_ms:>6.2f}ms"
+              f"{batch_writes:>5.0f} esc. {batch_ms:>6.2f}ms"
+              f"{deferred_writes:>7.0f} esc. {deferred_ms:>6.3f}ms")
+        if batch_writes > 1 or deferred_writes > 1 or deferred_ms >= legacy_ms:
+            failures.append(name)
+
+    # Ráfaga de acciones seguidas: el guardado diferido las agrupa todas
+    model = ConfigModel()
+    model.writes = 0
+    for i in range(20):
+        schedule_click(model.set_config, i)
+    pending = model.writes
+    time.sleep(model.flush_delay * 2)
+    print(f"20 clics seguidos sin lote: {pending} escrituras al momento, "
+          f"{model.writes} tras {model.flush_delay:.1f} s")
+
+    with open(model.config_file, 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    leftovers = [name for name in os.listdir(model.config_dir) if name.endswith('.tmp')]
+    config_ok = saved['last_used_time_value'] == 30 + 19 and not leftovers
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    if failures or model.writes != 1 or not config_ok:
+        print(f"FALLO: escrituras de configuración no agrupadas ({', '.join(failures)})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
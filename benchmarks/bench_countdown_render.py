@@ -0,0 +1,148 @@
+"""
+Benchmark del camino de un tick de la cuenta regresiva.
+
+Compara, sobre la ventana principal y el modelo del sistema reales en modo
+offscreen, el tick anterior (dos get_scheduled_info() y un
+get_remaining_time() por tick, y setText, setValue y setEnabled siempre) con
+update_countdown(), que consulta el modelo una vez y solo envía a Qt las
+propiedades que cambian. Se adopta una acción de una hora y se avanza el
+reloj de la fuente de tiempo un segundo por tick, de modo que ambos caminos
+ven la misma cuenta regresiva. Se mide el tiempo de CPU por tick (mejor de
+varias rondas alternas) y se exige una reducción mínima.
+
+Uso:
+    python benchmarks/bench_countdown_render.py [--seconds N] [--rounds N]
+        [--min-reduction F]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-countdown-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from controllers.main_controller import MainController
+
+# Reducción mínima de CPU por tick exigida (fracción)
+MIN_CPU_REDUCTION = 0.20
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+def legacy_tick(controller):
+    """Tick anterior al modelo de vista, sobre la API actual del modelo."""
+    system_model = controller.system_model
+    view = controller.main_view
+    if not view or not system_model.get_scheduled_info():
+        return
+
+    remaining = system_model.get_remaining_time()
+    if remaining is not None:
+        hours, remainder = divmod(remaining, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        view.remaining_time_label.setText(f"{hours:02d}:{minutes:02d}:{seconds:02d}")
+
+        info = system_model.get_scheduled_info()
+        total_seconds = info['original_seconds']
+        if total_seconds > 0:
+            progress = int(((total_seconds - remaining) / total_seconds) * 100)
+            view.progress_bar.setValue(progress)
+
+        if remaining == 0:
+            view.schedule_button.setEnabled(True)
+            view.cancel_button.setEnabled(False)
+            view.tab_widget.setEnabled(True)
+            view.shutdown_radio.setEnabled(True)
+            view.restart_radio.setEnabled(True)
+        view.tab_widget.setEnabled(True)
+
+
+class FakeClock:
+    """Reloj manual para la fuente de tiempo: avanza un segundo por tick."""
+
+    def __init__(self, start):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+
+def run_countdown(app, clock, seconds, tick):
+    """Recorre una cuenta regresiva completa y mide la CPU consumida.
+
+    Returns:
+        float: Segundos de CPU del recorrido
+    """
+    origin = clock.now
+    start = time.process_time()
+    for elapsed in range(seconds):
+        clock.now = origin + elapsed
+        tick()
+    cpu = time.process_time() - start
+    clock.now = origin
+    app.processEvents()
+    return cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=int, default=3600)
+    parser.add_argument('--rounds', type=int, default=9)
+    parser.add_argument('--min-reduction', type=float, default=MIN_CPU_REDUCTION)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    controller = BenchController()
+    controller.start()
+    system_model = controller.system_model
+
+    # Reloj manual; sin umbral de salto, para que avanzarlo no se tome por
+    # un cambio del reloj de pared (check() se sigue ejecutando igual)
+    time_source = system_model.time_source
+    clock = FakeClock(time_source.now())
+    time_source._clock = time_source._awake = clock
+    time_source.jump_threshold = float('inf')
+    system_model.adopt_scheduled_action('shutdown', args.seconds)
+    controller.update_countdown()
+
+    view_model = controller.countdown
+    legacy_cpu = model_cpu = float('inf')
+    for _ in range(args.rounds):
+        legacy_cpu = min(legacy_cpu, run_countdown(
+            app, clock, args.seconds, lambda: legacy_tick(controller)))
+        updates_before = view_model.widget_updates
+        model_cpu = min(model_cpu, run_countdown(
+            app, clock, args.seconds, controller.update_countdown))
+        model_calls = view_model.widget_updates - updates_before
+
+    ticks = args.seconds
+    reduction = 1 - model_cpu / legacy_cpu
+    print(f"{'':<16}{'µs CPU/tick':>14}")
+    print(f"{'anterior':<16}{legacy_cpu / ticks * 1e6:>14.1f}")
+    print(f"{'modelo de vista':<16}{model_cpu / ticks * 1e6:>14.1f}")
+    print(f"llamadas a Qt por tick: 3 antes, {model_calls / ticks:.2f} ahora")
+    print(f"reducción de CPU: {100 * reduction:.0f}% (mínimo {100 * args.min_reduction:.0f}%)")
+
+    system_model.drop_system_jobs()
+    system_model.journal.close()
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    if reduction < args.min_reduction:
+        print("FALLO: el tick del modelo de vista no reduce lo suficiente la CPU")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Benchmark de la huella del daemon sin interfaz gráfica.
+
+Arranca el DaemonController en un proceso hijo, lo detiene tras un breve
+periodo y comprueba que no se ha importado PyQt5 y que la memoria residual
+máxima (RSS) queda por debajo del objetivo de 20 MB.
+
+Uso:
+    python benchmarks/bench_daemon_footprint.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RSS_BUDGET_MB = 20
+
+CHILD = r'''
+import json, resource, sys, threading, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+from controllers.daemon_controller import DaemonController
+daemon = DaemonController()
+threading.Timer(0.5, daemon.stop).start()
+daemon.run()
+print(json.dumps({
+    'pyqt_loaded': any(name.startswith('PyQt5') for name in sys.modules),
+    'maxrss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    'modules': len(sys.modules),
+    'elapsed': time.perf_counter() - start,
+}))
+'''
+
+
+def main():
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD, ROOT],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True
+    )
+    result = json.loads(completed.stdout.decode().strip().splitlines()[-1])
+    rss_mb = result['maxrss_kb'] / 1024
+    print(f"PyQt5 importado: {result['pyqt_loaded']}")
+    print(f"RSS máximo: {rss_mb:.1f} MB (objetivo < {RSS_BUDGET_MB} MB)")
+    print(f"módulos cargados: {result['modules']}")
+
+    if result['pyqt_loaded'] or rss_mb > RSS_BUDGET_MB:
+        print("FALLO: el daemon supera su presupuesto")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
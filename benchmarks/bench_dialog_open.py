@@ -0,0 +1,148 @@
+"""
+Benchmark de la latencia de apertura de los diálogos.
+
+Mide, con Qt en modo offscreen, el tiempo desde la orden de abrir los
+diálogos de configuración, ayuda y acerca de hasta su primer pintado:
+  * antes: se construye un diálogo nuevo en cada apertura (incluido el
+    setHtml del contenido de ayuda);
+  * después: MainController importa el módulo en el primer uso y mantiene
+    una única instancia que solo se refresca.
+
+Se informa de la primera apertura (que incluye la importación diferida) y
+de la mediana de las siguientes.
+
+Uso:
+    python benchmarks/bench_dialog_open.py [--opens N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-dialogs-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QApplication, QDialog
+
+from controllers.main_controller import MainController
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+class FirstPaint(QObject):
+    """Detecta el primer pintado de un diálogo y cierra los modales."""
+
+    def __init__(self):
+        super().__init__()
+        self.painted = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.painted is None and isinstance(obj, QDialog):
+            self.painted = time.perf_counter()
+            if obj.isModal():
+                QTimer.singleShot(0, obj.reject)
+        return False
+
+
+def measure(app, watcher, open_dialog):
+    """Milisegundos desde la orden de apertura hasta el primer pintado."""
+    watcher.painted = None
+    start = time.perf_counter()
+    dialog = open_dialog()
+    while watcher.painted is None:
+        app.processEvents()
+    elapsed = (watcher.painted - start) * 1000
+    if dialog is not None:
+        dialog.close()
+    app.processEvents()
+    return elapsed
+
+
+def legacy_openers(controller):
+    """Aperturas anteriores: un diálogo nuevo en cada clic."""
+    from views.help_view import AboutView, HelpView
+    from views.settings_view import SettingsView
+
+    def settings():
+        dialog = SettingsView(controller.main_view, controller.i18n, controller.config_model)
+        dialog.exec_()
+
+    def help_():
+        dialog = HelpView(controller.main_view, controller.i18n)
+        dialog.show()
+        return dialog
+
+    def about():
+        dialog = AboutView(controller.main_view, controller.i18n)
+        dialog.show()
+        return dialog
+
+    return {'configuración': settings, 'ayuda': help_, 'acerca de': about}
+
+
+def cached_openers(controller):
+    """Aperturas actuales a través del controlador."""
+    return {
+        'configuración': controller.show_settings,
+        'ayuda': lambda: controller.show_help() or controller.help_view,
+        'acerca de': lambda: controller.show_about() or controller.about_view,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--opens', type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    watcher = FirstPaint()
+    app.installEventFilter(watcher)
+    controller = BenchController()
+    # La ayuda se prepara tras el primer pintado; antes no debe importarse nada
+    eager = [name for name in ('views.settings_view', 'views.help_view') if name in sys.modules]
+    print(f"módulos de diálogos importados antes del primer pintado: {', '.join(eager) or 'ninguno'}")
+    controller.start()
+    app.processEvents()
+    # Sin registros de cada apertura en la salida del benchmark
+    logging.disable(logging.INFO)
+
+    # Primero el camino nuevo, para que su primera apertura incluya la importación
+    results = {}
+    for label, openers in (('después', cached_openers(controller)),
+                           ('antes', legacy_openers(controller))):
+        for name, open_dialog in openers.items():
+            times = [measure(app, watcher, open_dialog) for _ in range(args.opens)]
+            results[(label, name)] = (times[0], statistics.median(times[1:]))
+
+    print(f"{'':<16}{'antes 1.ª':>11}{'antes med.':>12}{'después 1.ª':>13}{'después med.':>14}")
+    failures = []
+    for name in ('configuración', 'ayuda', 'acerca de'):
+        before_first, before = results[('antes', name)]
+        after_first, after = results[('después', name)]
+        print(f"{name:<16}{before_first:>9.1f}ms{before:>10.1f}ms{after_first:>11.1f}ms{after:>12.1f}ms")
+        if after >= before:
+            failures.append(name)
+
+    controller.system_model.journal.close()
+    controller.clock_service.stop()
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    if eager or failures:
+        print(f"FALLO: importación anticipada o apertura no más rápida ({', '.join(failures)})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
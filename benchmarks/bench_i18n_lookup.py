@@ -0,0 +1,147 @@
+"""
+Micro-benchmark de I18n.get_text.
+
+Compara la búsqueda anterior (dos .get anidados y str.format en cada
+llamada) con la actual (catálogo del idioma resuelto en set_language y
+textos compilados una vez por clave) en:
+  * textos sin formato (menús, botones);
+  * textos con uno y dos campos (validación y confirmación);
+  * la notificación de programar, con la variante plural de la duración;
+  * un texto con variantes de género y número.
+Comprueba que los textos formateados coinciden con los de la versión
+anterior y que las variantes elegidas son las correctas.
+
+Uso:
+    python benchmarks/bench_i18n_lookup.py [--calls N]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import string
+import sys
+import tempfile
+import time
+
+# Directorio personal aislado para no tocar la caché del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-lookup-')
+os.environ['XDG_CACHE_HOME'] = os.path.join(os.environ['HOME'], '.cache')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.i18n import I18n, compile_message
+
+GREETING = {
+    'female': {'one': 'Tiene {count} acción pendiente, señora',
+               'other': 'Tiene {count} acciones pendientes, señora'},
+    'male': {'one': 'Tiene {count} acción pendiente, señor',
+             'other': 'Tiene {count} acciones pendientes, señor'},
+    '=0': 'No tiene acciones pendientes',
+    'other': 'Acciones pendientes: {count}',
+}
+
+
+class LegacyI18n:
+    """Búsqueda anterior, sobre los mismos catálogos."""
+
+    def __init__(self, i18n):
+        self.translations = i18n.translations
+        self.current_language = i18n.current_language
+        self.default_language = i18n.default_language
+
+    def get_text(self, key, **kwargs):
+        lang_dict = self.translations.get(
+            self.current_language,
+            self.translations.get(self.default_language, {})
+        )
+        text = lang_dict.get(key, key)
+        if kwargs:
+            try:
+                return text.format(**kwargs)
+            except KeyError:
+                return text
+        return text
+
+
+def per_call_ns(call, calls):
+    """Nanosegundos por llamada (mediana de 5 tandas)."""
+    runs = []
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            call()
+        runs.append((time.perf_counter_ns() - start) / calls)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=200000)
+    args = parser.parse_args()
+
+    i18n = I18n('es', disk_cache=False)
+    legacy = LegacyI18n(i18n)
+    new, old = i18n.get_text, legacy.get_text
+
+    cases = (
+        ('sin formato', lambda get: get('schedule_button')),
+        ('1 campo', lambda get: get('validation_max_value', max=99)),
+        ('2 campos', lambda get: get('confirm_message', action='apagar', time='30 minutos')),
+    )
+    print(f"{'':<22}{'antes':>10}{'después':>10}")
+    failures = []
+    for name, case in cases:
+        before = per_call_ns(lambda: case(old), args.calls)
+        after = per_call_ns(lambda: case(new), args.calls)
+        print(f"{name:<22}{before:>8.0f}ns{after:>8.0f}ns")
+        if after >= before or case(old) != case(new):
+            failures.append(name)
+
+    def notification(get):
+        return get('notification_scheduled', action=get('action_shutdown'),
+                   when=get('in_minutes', count=30))
+
+    def notification_legacy(get):
+        # Sin variantes: la unidad se añadía como texto aparte
+        return get('confirm_message', action=get('action_shutdown'),
+                   time=f"30 {get('minutes').lower()}")
+
+    before = per_call_ns(lambda: notification_legacy(old), args.calls)
+    after = per_call_ns(lambda: notification(new), args.calls)
+    print(f"{'notificación':<22}{before:>8.0f}ns{after:>8.0f}ns  (con variante plural)")
+
+    greeting = compile_message(GREETING, 'es')
+    forms_ns = per_call_ns(lambda: greeting.render({'count': 2, 'gender': 'female'}), args.calls)
+    print(f"{'género y número':<22}{'':>10}{forms_ns:>8.0f}ns")
+
+    # Todos los textos del catálogo formateados igual que antes
+    formatter = string.Formatter()
+    for key, text in i18n.translations['es'].items():
+        if not isinstance(text, str):
+            continue
+        fields = {name: 'x' for _, name, _, _ in formatter.parse(text) if name}
+        if fields and old(key, **fields) != new(key, **fields):
+            failures.append(key)
+
+    expected = {
+        (1, 'female'): 'Tiene 1 acción pendiente, señora',
+        (3, 'male'): 'Tiene 3 acciones pendientes, señor',
+        (0, 'female'): 'No tiene acciones pendientes',
+        (5, None): 'Acciones pendientes: 5',
+    }
+    for (count, gender), text in expected.items():
+        if greeting.render({'count': count, 'gender': gender}) != text:
+            failures.append(f'variante {count}/{gender}')
+    plural = [new('in_minutes', count=n) for n in (1, 2)]
+    print(f"variantes: {plural[0]!r}, {plural[1]!r}, {notification(new)!r}")
+    if plural != ['dentro de 1 minuto', 'dentro de 2 minutos']:
+        failures.append('plural')
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+
+    if failures:
+        print(f"FALLO: búsqueda más lenta o textos distintos ({', '.join(failures)})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
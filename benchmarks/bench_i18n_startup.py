@@ -0,0 +1,112 @@
+"""
+Benchmark de la carga de traducciones al arrancar.
+
+En un directorio personal aislado compara la creación de I18n:
+  * antes: se leen e interpretan los JSON de todos los idiomas;
+  * en frío: solo el idioma activo, sin caché (primer arranque);
+  * en caliente: solo el idioma activo, desde la caché marshal.
+Informa de los JSON de traducción abiertos (gancho de auditoría), los JSON
+interpretados y el tiempo mediano. Comprueba que los demás idiomas se cargan
+al seleccionarlos, que un JSON con otra fecha pero el mismo contenido se
+sigue cargando de la caché y que nunca se escribe en resources/.
+
+Uso:
+    python benchmarks/bench_i18n_startup.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+# Directorio personal aislado para no tocar la caché del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-i18n-')
+os.environ['XDG_CACHE_HOME'] = os.path.join(os.environ['HOME'], '.cache')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.i18n import LANGUAGES, TRANSLATIONS_DIR, I18n
+from utils.paths import get_resource_path
+from utils.resources import read_text
+
+translations_dir = os.path.join(get_resource_path(TRANSLATIONS_DIR), '')
+resources_dir = os.path.join(get_resource_path(''), '')
+opened, written = [], []
+
+
+def audit(event, args):
+    if event == 'open' and isinstance(args[0], str):
+        if args[0].startswith(translations_dir):
+            opened.append(args[0])
+        if args[0].startswith(resources_dir) and isinstance(args[1], str) and set('wax+') & set(args[1]):
+            written.append(args[0])
+
+
+def legacy_load():
+    """Carga anterior: todos los idiomas, leyendo e interpretando cada JSON."""
+    return {lang: json.loads(read_text(f'{TRANSLATIONS_DIR}/{lang}.json')) for lang in LANGUAGES}
+
+
+def measure(create, runs):
+    """(JSON abiertos por creación, mediana en ms)."""
+    times = []
+    del opened[:]
+    for _ in range(runs):
+        start = time.perf_counter()
+        create()
+        times.append((time.perf_counter() - start) * 1000)
+    return len(opened) / runs, statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=50)
+    args = parser.parse_args()
+    sys.addaudithook(audit)
+
+    cache_dir = os.path.join(os.environ['HOME'], 'cache')
+    results = {
+        'antes': measure(legacy_load, args.runs) + (len(LANGUAGES),),
+        'en frío': measure(lambda: I18n('es', disk_cache=False), args.runs) + (1,),
+    }
+    I18n('es', cache_dir=cache_dir)
+    warm = I18n('es', cache_dir=cache_dir)
+    results['en caliente'] = measure(lambda: I18n('es', cache_dir=cache_dir), args.runs) + (warm.parsed,)
+
+    # El otro idioma se carga al seleccionarlo
+    loaded_at_start = list(warm.translations)
+    warm.set_language('en')
+    on_demand = list(warm.translations)
+
+    # Un JSON con otra fecha y el mismo contenido se reconoce por su hash
+    I18n('en', cache_dir=cache_dir)
+    source = get_resource_path(f'{TRANSLATIONS_DIR}/en.json')
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    try:
+        touched = I18n('en', cache_dir=cache_dir)
+    finally:
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+
+    print(f"{'':<12}{'JSON abiertos':>14}{'JSON interpretados':>20}{'mediana':>11}")
+    for name, (opens, ms, parsed) in results.items():
+        print(f"{name:<12}{opens:>14.0f}{parsed:>20}{ms:>9.3f}ms")
+    print(f"idiomas cargados al arrancar: {', '.join(loaded_at_start)}; "
+          f"tras seleccionar 'en': {', '.join(on_demand)}")
+    print(f"JSON con otra fecha y el mismo contenido: {touched.parsed} interpretados, "
+          f"{touched.cache_hits} desde la caché")
+    print(f"escrituras en resources/: {len(written)}")
+
+    if (results['en caliente'][2] or results['en caliente'][0] or loaded_at_start != ['es']
+            or on_demand != ['es', 'en'] or touched.parsed or written
+            or results['en caliente'][1] >= results['antes'][1]):
+        print("FALLO: las traducciones no se cargan de forma diferida o desde la caché")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
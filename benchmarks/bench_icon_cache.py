@@ -0,0 +1,145 @@
+"""
+Benchmark de la caché de iconos.
+
+Obtiene, con Qt en modo offscreen, los rásteres que necesitan la ventana
+principal y el diálogo de acerca de, y compara:
+  * antes: QIcon/QPixmap construidos desde el SVG en cada vista (y el icono
+    del tema o el logotipo escalados con SmoothTransformation);
+  * IconService en frío: sin caché, rasteriza los SVG y escribe los PNG;
+  * IconService desde disco: un servicio nuevo (como en un arranque
+    posterior) que carga los PNG sin interpretar ningún SVG;
+  * IconService en memoria: la misma instancia, sin volver a rasterizar.
+
+Comprueba además que cambiar de idioma actualiza la bandeja sin crear otro
+QSystemTrayIcon.
+
+Uso:
+    python benchmarks/bench_icon_cache.py [--rounds N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-icons-')
+os.environ['XDG_CACHE_HOME'] = os.path.join(os.environ['HOME'], '.cache')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+
+from controllers.main_controller import MainController
+from utils.icon_service import IconService
+from utils.paths import get_resource_path
+
+# Iconos que usan las vistas: (archivo, tamaños lógicos)
+ICONS = (
+    ('app_icon.svg', (16, 32, 64)),
+    ('shutdown_icon.svg', (16,)),
+    ('restart_icon.svg', (16,)),
+    ('cancel_icon.svg', (16,)),
+)
+PIXMAPS = (('theme_icon.svg', 24), ('app_icon.svg', 64))
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+def legacy_build():
+    """Rásteres tal y como los obtenían las vistas antes."""
+    for name, sizes in ICONS:
+        icon = QIcon(get_resource_path(os.path.join('icons', name)))
+        for size in sizes:
+            icon.pixmap(size, size)
+    for name, size in PIXMAPS:
+        QPixmap(get_resource_path(os.path.join('icons', name))).scaled(
+            size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation
+        )
+
+
+def service_build(service):
+    """Rásteres a través del servicio de iconos."""
+    for name, sizes in ICONS:
+        icon = service.icon(name, sizes)
+        for size in sizes:
+            icon.pixmap(size, size)
+    for name, size in PIXMAPS:
+        service.pixmap(name, size)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def check_tray_language_change():
+    """Número de QSystemTrayIcon tras varios cambios de idioma."""
+    controller = BenchController()
+    controller.start()
+    app = QApplication.instance()
+    while controller.main_view.tray_icon is None:
+        app.processEvents()
+    for language in ('en', 'es', 'en'):
+        controller.i18n.set_language(language)
+        controller._reload_ui_texts()
+    trays = controller.main_view.findChildren(QSystemTrayIcon)
+    tooltip_ok = controller.main_view.tray_icon.toolTip() == controller.i18n.get_text("tray_tooltip")
+    controller.system_model.journal.close()
+    controller.clock_service.stop()
+    return len(trays), tooltip_ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rounds', type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    logging.disable(logging.INFO)
+    legacy, cold, disk, memory = [], [], [], []
+    for _ in range(args.rounds):
+        cache_dir = tempfile.mkdtemp(prefix='energypy-icon-cache-')
+        legacy.append(timed(legacy_build))
+        cold_service = IconService(cache_dir)
+        cold.append(timed(service_build, cold_service))
+        disk_service = IconService(cache_dir)
+        disk.append(timed(service_build, disk_service))
+        memory.append(timed(service_build, disk_service))
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    rasters = sum(len(sizes) for _, sizes in ICONS) + len(PIXMAPS)
+    print(f"{rasters} rásteres por construcción de las vistas (mediana de {args.rounds} rondas)")
+    print(f"antes (SVG en cada vista):  {statistics.median(legacy):7.2f} ms")
+    print(f"servicio en frío:           {statistics.median(cold):7.2f} ms "
+          f"({cold_service.rasterized} SVG rasterizados)")
+    print(f"servicio desde disco:       {statistics.median(disk):7.2f} ms "
+          f"({disk_service.disk_hits} PNG leídos, {disk_service.rasterized} SVG rasterizados)")
+    print(f"servicio en memoria:        {statistics.median(memory):7.3f} ms")
+
+    trays, tooltip_ok = check_tray_language_change()
+    print(f"bandejas tras tres cambios de idioma: {trays}")
+
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    del app
+    if (disk_service.rasterized or statistics.median(disk) >= statistics.median(legacy)
+            or statistics.median(memory) >= statistics.median(disk)
+            or trays != 1 or not tooltip_ok):
+        print("FALLO: la caché de iconos no evita rasterizar o se recrea la bandeja")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
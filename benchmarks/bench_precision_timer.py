@@ -0,0 +1,85 @@
+"""
+Benchmark del error de disparo del temporizador de precisión.
+
+Mide, sobre muchas ejecuciones, cuánto se desvía el disparo real de la fecha
+límite solicitada, comparando PrecisionTimer con threading.Timer y con el
+truncado a minutos que usaba el comando `shutdown` en Linux/macOS.
+
+Uso:
+    python benchmarks/bench_precision_timer.py [--runs N] [--max-delay S]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.precision_timer import PrecisionTimer, timerfd_available
+
+
+def measure(factory, delays):
+    """Mide el error de disparo (ms) de cada retardo con la fábrica dada."""
+    errors = []
+    for delay in delays:
+        done = threading.Event()
+        result = {}
+        deadline = time.monotonic() + delay
+
+        def fire():
+            result['at'] = time.monotonic()
+            done.set()
+
+        factory(delay, fire)
+        done.wait(delay + 5)
+        errors.append((result['at'] - deadline) * 1000)
+    return errors
+
+
+def thread_timer(delay, callback):
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+def summary(name, errors):
+    errors = sorted(errors)
+    p99 = errors[min(len(errors) - 1, int(len(errors) * 0.99))]
+    print(
+        f"{name:<28} media={statistics.mean(errors):8.3f} ms  "
+        f"p50={statistics.median(errors):8.3f} ms  p99={p99:8.3f} ms  "
+        f"max={errors[-1]:8.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=200)
+    parser.add_argument('--max-delay', type=float, default=0.2)
+    args = parser.parse_args()
+
+    random.seed(1234)
+    delays = [random.uniform(0.01, args.max_delay) for _ in range(args.runs)]
+
+    print(f"{args.runs} ejecuciones, retardos de 10 ms a {args.max_delay * 1000:.0f} ms")
+    print(f"timerfd disponible: {timerfd_available()}")
+    summary('threading.Timer', measure(thread_timer, delays))
+    summary('PrecisionTimer (sleep)', measure(
+        lambda d, cb: PrecisionTimer(d, cb, use_timerfd=False), delays
+    ))
+    if timerfd_available():
+        summary('PrecisionTimer (timerfd)', measure(PrecisionTimer, delays))
+
+    # Error teórico del comando anterior: `shutdown +{seconds // 60}`
+    requests = [random.randint(1, 7200) for _ in range(args.runs)]
+    truncation = [((s // 60) * 60 - s) * 1000 for s in requests]
+    summary('shutdown +min (truncado)', truncation)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark de la E/S de recursos en un arranque en frío.
+
+Lanza varias veces un proceso nuevo que carga, con Qt en modo offscreen,
+los recursos del arranque (traducciones, tema, iconos de la ventana
+principal e icono de la aplicación) y mide:
+  * antes: archivos sueltos de resources/ (ENERGYPY_RESOURCES=files);
+  * después: el archivo binario de recursos (ENERGYPY_RESOURCES=bundle),
+    generado antes con utils.resources.compile_resources y registrado con
+    QResource.registerResource, como en la aplicación empaquetada.
+
+Informa de los archivos abiertos desde Python dentro de resources/ (gancho
+de auditoría), de las llamadas de lectura y los bytes leídos por el proceso
+(/proc/self/io, solo Linux; incluye las lecturas de Qt, pero no las páginas
+del archivo de recursos proyectado en memoria) y del tiempo, que incluye el
+registro del archivo de recursos. Con la caché de páginas caliente el tiempo
+lo domina la rasterización de los SVG y ambos caminos quedan dentro del
+ruido; el benchmark exige la mejora de E/S (ninguna apertura y al menos un
+25% menos de llamadas de lectura) y que el arranque no sea más lento. Las cachés en disco de iconos y
+traducciones se desactivan para que cada arranque interprete los SVG y los
+JSON, como el primero tras instalar.
+
+Uso:
+    python benchmarks/bench_resource_io.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# Reducción mínima exigida de las llamadas de lectura (fracción)
+MIN_READ_REDUCTION = 0.25
+# Margen de ruido tolerado en el tiempo del arranque (fracción)
+TIME_TOLERANCE = 0.10
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código del proceso medido: imprime una línea JSON con los contadores
+CHILD = r'''
+import json, os, sys, time
+sys.path.insert(0, os.environ['BENCH_ROOT'])
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication
+app = QApplication(sys.argv[:1])
+from utils import resources
+from utils.i18n import I18n
+from utils.icon_service import IconService
+from utils.theme_engine import ThemeEngine
+
+resources_dir = os.path.join(os.environ['BENCH_ROOT'], 'resources', '')
+opened = []
+def audit(event, args):
+    if event == 'open' and isinstance(args[0], str) and args[0].startswith(resources_dir):
+        opened.append(args[0])
+sys.addaudithook(audit)
+
+def io_counters():
+    try:
+        with open('/proc/self/io') as f:
+            fields = dict(line.split(': ') for line in f.read().splitlines())
+        return int(fields['syscr']), int(fields['rchar'])
+    except OSError:
+        return 0, 0
+
+calls, chars = io_counters()
+start = time.perf_counter()
+I18n(disk_cache=False)
+ThemeEngine().apply('light', app)
+icons = IconService(disk_cache=False)
+icons.icon('app_icon.svg', (16, 32, 64))
+for name in ('shutdown_icon.svg', 'restart_icon.svg', 'cancel_icon.svg'):
+    icons.icon(name)
+icons.pixmap('theme_icon.svg', 24)
+QIcon(resources.resource_location(resources.window_icon_file())).pixmap(32, 32)
+elapsed = (time.perf_counter() - start) * 1000
+end_calls, end_chars = io_counters()
+# Las ":/" de la hoja de estilo obligan a que el archivo esté registrado
+print(json.dumps({'bundled': resources.is_bundled(), 'opens': len(opened),
+                  'syscr': end_calls - calls, 'rchar': end_chars - chars, 'ms': elapsed}))
+'''
+
+
+def run_once(source, home):
+    """Carga los recursos en un proceso nuevo y devuelve sus contadores."""
+    env = dict(os.environ, HOME=home, USERPROFILE=home, QT_QPA_PLATFORM='offscreen',
+               ENERGYPY_RESOURCES=source, BENCH_ROOT=ROOT)
+    result = subprocess.run([sys.executable, '-c', CHILD], env=env, cwd=home,
+                            capture_output=True, text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith('{'):
+            return json.loads(line)
+    print(result.stderr[-2000:])
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    from utils.resources import compile_resources, resource_file
+
+    existed = os.path.exists(resource_file())
+    output, count = compile_resources(resource_file())
+    size = os.path.getsize(output)
+    home = tempfile.mkdtemp(prefix='energypy-resources-')
+    try:
+        results = {'files': [], 'bundle': []}
+        # Primera ejecución descartada: caché de .pyc del proceso hijo
+        run_once('files', home)
+        run_once('bundle', home)
+        # Ejecuciones alternas, para que la deriva de la máquina afecte a ambos
+        for _ in range(args.runs):
+            for source, runs in results.items():
+                runs.append(run_once(source, home))
+        for source, runs in results.items():
+            if None in runs:
+                print(f"FALLO: el proceso de medida terminó con error ({source})")
+                sys.exit(1)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+        if not existed:
+            os.remove(output)
+
+    print(f"archivo de recursos: {count} archivos, {size / 1024:.0f} KiB")
+    print(f"{'':<10}{'aperturas':>10}{'lecturas':>10}{'KiB leídos':>12}{'mediana':>11}{'mínimo':>10}")
+    for source, label in (('files', 'antes'), ('bundle', 'después')):
+        runs = results[source]
+        print(f"{label:<10}{runs[0]['opens']:>10}{statistics.median(r['syscr'] for r in runs):>10.0f}"
+              f"{statistics.median(r['rchar'] for r in runs) / 1024:>12.1f}"
+              f"{statistics.median(r['ms'] for r in runs):>9.1f}ms"
+              f"{min(r['ms'] for r in runs):>8.1f}ms")
+
+    before, after = results['files'], results['bundle']
+    if (not all(r['bundled'] for r in after) or any(r['bundled'] for r in before)
+            or after[0]['opens'] != 0 or before[0]['opens'] == 0):
+        print("FALLO: los recursos no se leen del archivo compilado")
+        sys.exit(1)
+    reads_before = statistics.median(r['syscr'] for r in before)
+    reads_after = statistics.median(r['syscr'] for r in after)
+    if reads_after > reads_before * (1 - MIN_READ_REDUCTION):
+        print("FALLO: el archivo de recursos no reduce las llamadas de lectura")
+        sys.exit(1)
+    if statistics.median(r['ms'] for r in after) > statistics.median(r['ms'] for r in before) * (1 + TIME_TOLERANCE):
+        print("FALLO: el arranque con el archivo de recursos es más lento")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark del diario de acciones programadas.
+
+Mide el tiempo de reproducción de un diario con muchos eventos históricos
+(objetivo: 100k eventos muy por debajo de 100 ms; se toma la mejor de
+varias cargas, porque el ruido de la máquina dura procesos enteros), el coste de arranque tras
+compactar y el coste por evento anexado con fsync agrupado frente a un fsync
+por evento.
+
+Uso:
+    python benchmarks/bench_schedule_journal.py [--events N] [--rounds N]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.schedule_journal import ScheduleJournal
+
+REPLAY_BUDGET_MS = 100
+
+
+def write_history(path, events):
+    """Escribe un diario sintético con programaciones y cancelaciones."""
+    random.seed(42)
+    now = time.time()
+    live = []
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(events):
+            if live and random.random() < 0.5:
+                f.write(f"C\t{live.pop(random.randrange(len(live)))}\n")
+            else:
+                key = f"{i:x}.{i}"
+                live.append(key)
+                action = random.choice(('shutdown', 'restart'))
+                f.write(f"S\t{key}\t{action}\t{now + random.uniform(60, 86400):.3f}\t3600\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--events', type=int, default=100_000)
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='energypy-journal-')
+    try:
+        base = os.path.join(workdir, 'schedule')
+        write_history(f"{base}.journal", args.events)
+
+        # Reproducción completa (sin compactación automática)
+        times = []
+        for _ in range(args.rounds):
+            journal = ScheduleJournal(base, compact_every=args.events * 2)
+            start = time.perf_counter()
+            state = journal.load()
+            times.append((time.perf_counter() - start) * 1000)
+        replay_ms = min(times)
+        print(f"reproducción de {args.events} eventos: {replay_ms:.2f} ms "
+              f"(mediana {statistics.median(times):.2f} ms, {len(state)} vivas)")
+
+        # Arranque tras compactar: instantánea + cola vacía
+        journal.compact()
+        journal.close()
+        start = time.perf_counter()
+        ScheduleJournal(base).load()
+        print(f"arranque tras compactar: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        # Coste por evento anexado
+        for label, delay in (('fsync agrupado', 0.5), ('fsync por evento', 0)):
+            journal = ScheduleJournal(os.path.join(workdir, label.replace(' ', '_')),
+                                      fsync_delay=delay)
+            start = time.perf_counter()
+            for i in range(500):
+                journal.record_schedule(f"k{i}", 'shutdown', time.time() + 60, 60)
+                if delay == 0:
+                    journal.flush()
+            journal.close()
+            print(f"{label:<18} {(time.perf_counter() - start) * 1000 / 500:.4f} ms/evento")
+
+        if replay_ms > REPLAY_BUDGET_MS:
+            print(f"FALLO: la reproducción supera {REPLAY_BUDGET_MS} ms")
+            sys.exit(1)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark del coste por operación de los backends de apagado.
+
+Compara lanzar un proceso por operación (lo que hace SubprocessBackend; se
+mide con `true` para no apagar el equipo) con LogindBackend, que reutiliza
+una conexión D-Bus. El backend de logind se prueba contra un sustituto de
+logind publicado en el bus de sesión, por lo que debe ejecutarse dentro de
+una sesión D-Bus:
+
+    dbus-run-session -- python benchmarks/bench_shutdown_backends.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.shutdown_backends import (
+    LOGIND_BUS_NAME, LOGIND_INTERFACE, LOGIND_OBJECT_PATH, LogindBackend
+)
+from utils.command_executor import run_command
+
+
+def serve_logind_standin(ready):
+    """Publica en el bus de sesión un sustituto mínimo de logind."""
+    from jeepney import HeaderFields, MessageType, new_error, new_method_return
+    from jeepney.bus_messages import message_bus
+    from jeepney.io.blocking import open_dbus_connection
+
+    connection = open_dbus_connection(bus='SESSION')
+    connection.send_and_get_reply(message_bus.RequestName(LOGIND_BUS_NAME))
+    scheduled = {}
+    ready.set()
+    while True:
+        message = connection.receive()
+        if message.header.message_type != MessageType.method_call:
+            continue
+        fields = message.header.fields
+        if fields.get(HeaderFields.interface) != LOGIND_INTERFACE:
+            connection.send(new_error(message, 'org.freedesktop.DBus.Error.UnknownMethod'))
+            continue
+        member = fields.get(HeaderFields.member)
+        if member == 'ScheduleShutdown':
+            scheduled['mode'], scheduled['usec'] = message.body
+            connection.send(new_method_return(message))
+        elif member == 'CancelScheduledShutdown':
+            cancelled = bool(scheduled)
+            scheduled.clear()
+            connection.send(new_method_return(message, 'b', (cancelled,)))
+        else:
+            connection.send(new_error(message, 'org.freedesktop.DBus.Error.UnknownMethod'))
+
+
+def timed(operation, runs):
+    """Ejecuta la operación varias veces y devuelve las latencias en ms."""
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = operation()
+        latencies.append((time.perf_counter() - start) * 1000)
+        if not result['ok']:
+            raise RuntimeError(result['error'])
+    return latencies
+
+
+def summary(name, latencies):
+    print(
+        f"{name:<26} media={statistics.mean(latencies):7.3f} ms  "
+        f"p50={statistics.median(latencies):7.3f} ms  max={max(latencies):7.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=200)
+    args = parser.parse_args()
+
+    if not os.environ.get('DBUS_SESSION_BUS_ADDRESS'):
+        print("Se necesita un bus de sesión: ejecutar con dbus-run-session")
+        sys.exit(1)
+
+    ready = threading.Event()
+    threading.Thread(target=serve_logind_standin, args=(ready,), daemon=True).start()
+    ready.wait(5)
+
+    backend = LogindBackend(bus='SESSION', object_path=LOGIND_OBJECT_PATH)
+    summary('subprocess (fork+exec)', timed(lambda: run_command(['true']), args.runs))
+    summary('logind schedule', timed(lambda: backend.schedule('shutdown', 90), args.runs))
+    summary('logind cancel', timed(backend.cancel, args.runs))
+    backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark del tiempo hasta el primer pintado de la ventana principal.
+
+Lanza varias veces main.py --profile-startup=exit con Qt en modo offscreen
+y un directorio personal aislado, y mide desde el lanzamiento del proceso
+hasta que el perfilador informa del primer pintado. Falla si la mediana
+supera el presupuesto. Con --verbose muestra el informe completo de la
+última ejecución (fases e importaciones).
+
+Uso:
+    python benchmarks/bench_startup_paint.py [--runs N] [--budget MS] [--verbose]
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, 'main.py')
+# Presupuesto (ms) desde el lanzamiento del proceso hasta el primer pintado
+DEFAULT_BUDGET_MS = 350
+PAINT_LINE = re.compile(r'tiempo hasta el primer pintado: ([\d.]+) ms')
+
+
+def run_once(home):
+    """Lanza la aplicación perfilada hasta el primer pintado.
+
+    Returns:
+        tuple: (ms desde el lanzamiento, ms según el perfilador, informe)
+    """
+    env = dict(os.environ, HOME=home, USERPROFILE=home, QT_QPA_PLATFORM='offscreen')
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, MAIN, '--profile-startup=exit'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, env=env, text=True
+    )
+    report = []
+    wall = internal = None
+    try:
+        for line in process.stderr:
+            report.append(line.rstrip('\n'))
+            match = PAINT_LINE.search(line)
+            if match:
+                wall = (time.perf_counter() - start) * 1000
+                internal = float(match.group(1))
+                break
+        process.wait(timeout=30)
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+    return wall, internal, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix='energypy-startup-')
+    try:
+        # Primera ejecución descartada: crea la configuración y la caché de .pyc
+        run_once(home)
+        walls, internals = [], []
+        for _ in range(args.runs):
+            wall, internal, report = run_once(home)
+            if wall is None:
+                print('\n'.join(report[-20:]))
+                print("FALLO: la aplicación no llegó al primer pintado")
+                sys.exit(1)
+            walls.append(wall)
+            internals.append(internal)
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+    if args.verbose:
+        print('\n'.join(report))
+    median = statistics.median(walls)
+    print(f"primer pintado desde el lanzamiento: mediana {median:.1f} ms "
+          f"(mín. {min(walls):.1f}, máx. {max(walls):.1f}; {args.runs} ejecuciones)")
+    print(f"primer pintado según el perfilador: mediana {statistics.median(internals):.1f} ms")
+    print(f"presupuesto: {args.budget:.0f} ms")
+    if median > args.budget:
+        print("FALLO: el tiempo hasta el primer pintado supera el presupuesto")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark de la latencia al cambiar de tema.
+
+Alterna entre el tema claro y el oscuro sobre la ventana principal real,
+con Qt en modo offscreen, y mide hasta el repintado:
+  * antes: leer el archivo .qss del disco y pasarlo sin procesar a
+    QApplication.setStyleSheet en cada cambio;
+  * después: ThemeEngine.apply, con las dos hojas de estilo procesadas de
+    antemano y aplicadas a las ventanas raíz en lugar de a QApplication.
+
+La mayor parte de cada cambio es el repulido de los widgets dentro de Qt; al
+cambiar la hoja de cada ventana raíz solo se repule su árbol, una vez por
+widget. También mide reaplicar el tema ya activo (lo que ocurre al arrancar
+con el tema oscuro, cuando el switch emite su cambio), que con el motor es
+gratis. El benchmark falla si el cambio con el motor no reduce la latencia
+al menos un 20% o si reaplicar el mismo tema no es inmediato.
+
+Uso:
+    python benchmarks/bench_theme_toggle.py [--toggles N] [--min-reduction F]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+# Directorio personal aislado para no tocar la configuración del usuario
+os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp(prefix='energypy-theme-')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from controllers.main_controller import MainController
+from utils.paths import get_resource_path
+
+# Reducción mínima exigida de la latencia de un cambio de tema (fracción)
+MIN_REDUCTION = 0.20
+
+
+class BenchController(MainController):
+    """Controlador sin el aviso modal de permisos de administrador."""
+
+    def _check_admin_permissions(self):
+        pass
+
+
+def legacy_apply(app, theme):
+    """Cambio de tema anterior: lectura del archivo en cada cambio."""
+    with open(get_resource_path(os.path.join('styles', f'{theme}.qss')), 'r', encoding='utf-8') as f:
+        app.setStyleSheet(f.read())
+
+
+def measure(app, apply, toggles):
+    """Mediana (ms) de un cambio de tema hasta procesar el repintado."""
+    times = []
+    for index in range(toggles):
+        theme = 'dark' if index % 2 == 0 else 'light'
+        start = time.perf_counter()
+        apply(theme)
+        app.processEvents()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--toggles', type=int, default=40)
+    parser.add_argument('--min-reduction', type=float, default=MIN_REDUCTION)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    controller = BenchController()
+    controller.start()
+    app.processEvents()
+    engine = controller.theme_engine
+
+    def engine_apply(theme):
+        engine.apply(theme, app)
+
+    # El camino anterior primero: las hojas por ventana del motor lo
+    # ralentizarían. Cada camino con su calentamiento
+    measure(app, lambda theme: legacy_apply(app, theme), 4)
+    legacy = measure(app, lambda theme: legacy_apply(app, theme), args.toggles)
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        legacy_apply(app, 'light')
+    legacy_same = (time.perf_counter() - start)
+
+    # Como al arrancar: el tema inicial se aplica a nivel de aplicación
+    engine.current_theme = None
+    engine.apply('light', app)
+    engine.preload(('light', 'dark'))
+    measure(app, engine_apply, 4)
+    cached = measure(app, engine_apply, args.toggles)
+
+    engine.apply('light', app)
+    start = time.perf_counter()
+    for _ in range(1000):
+        engine.apply('light', app)
+    same_theme = (time.perf_counter() - start)
+
+    sizes = {theme: len(engine.stylesheet(theme)) for theme in ('light', 'dark')}
+    print(f"hoja de estilo procesada: {sizes['light']} / {sizes['dark']} caracteres (claro / oscuro)")
+    print(f"antes:    {legacy:.2f} ms por cambio (mediana de {args.toggles})")
+    print(f"después:  {cached:.2f} ms por cambio ({100 * (cached / legacy - 1):+.0f}%)")
+    print(f"reaplicar el mismo tema: antes {legacy_same:.2f} ms, después {same_theme * 1000:.2f} µs")
+
+    controller.system_model.journal.close()
+    controller.clock_service.stop()
+    shutil.rmtree(os.environ['HOME'], ignore_errors=True)
+    if cached > legacy * (1 - args.min_reduction) or same_theme * 1000 > 0.01 * legacy:
+        print("FALLO: el motor de temas no mejora el cambio de tema")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
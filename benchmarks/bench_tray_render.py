@@ -0,0 +1,92 @@
+"""
+Benchmark del icono de la bandeja con la cuenta regresiva.
+
+Recorre, con Qt en modo offscreen, una cuenta regresiva sintética y compara:
+  * el renderizado directo (renderizar el SVG del icono y maquetar el texto
+    con drawText en cada segundo);
+  * TrayCountdownRenderer, que solo regenera el icono cuando cambia el valor
+    mostrado y compone fondo, anillo y glifos copiando pixmaps en caché.
+
+Informa de los iconos generados y del tiempo de cada camino. El camino
+directo es muy lento, así que se mide sobre una muestra de ticks y se
+extrapola al total.
+
+Uso:
+    python benchmarks/bench_tray_render.py [--seconds N] [--sample N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication
+
+from utils.paths import get_resource_path
+from views.tray_renderer import TRAY_ICON_SIZE, TrayCountdownRenderer, tray_text
+
+
+def direct_render(icon_path, remaining, total):
+    """Renderizado sin cachés: SVG, anillo y texto en cada llamada."""
+    size = TRAY_ICON_SIZE
+    pixmap = QIcon(icon_path).pixmap(size, size)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QColor(76, 175, 80))
+    painter.drawArc(4, 4, size - 8, size - 8, 90 * 16, -(total - remaining) * 360 * 16 // total)
+    font = QFont()
+    font.setBold(True)
+    font.setPixelSize(size // 4)
+    painter.setFont(font)
+    painter.setPen(QColor(255, 255, 255))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, tray_text(remaining))
+    painter.end()
+    return QIcon(pixmap)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--seconds', type=int, default=2 * 3600)
+    parser.add_argument('--sample', type=int, default=200)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    icon_path = get_resource_path(os.path.join('icons', 'app_icon.svg'))
+    total = args.seconds
+    countdown = range(total, 0, -1)
+
+    sample = countdown[::max(len(countdown) // args.sample, 1)]
+    start = time.perf_counter()
+    for remaining in sample:
+        direct_render(icon_path, remaining, total)
+    direct_time = (time.perf_counter() - start) * len(countdown) / len(sample)
+
+    start = time.perf_counter()
+    renderer = TrayCountdownRenderer(QIcon(icon_path))
+    for remaining in countdown:
+        renderer.render(remaining, total)
+    cached_time = time.perf_counter() - start
+
+    expected = len({tray_text(remaining) for remaining in countdown})
+    hours_left = max(total - 3599, 0)
+    print(f"cuenta regresiva de {total} s ({total} ticks de 1 s)")
+    print(f"directo:        {total} iconos, {direct_time * 1000:.0f} ms estimados "
+          f"({direct_time / total * 1e6:.0f} µs/icono)")
+    print(f"renderizador:   {renderer.renders} iconos, {cached_time * 1000:.0f} ms "
+          f"({cached_time / max(renderer.renders, 1) * 1e6:.0f} µs/icono)")
+    print(f"con más de una hora pendiente: {len({tray_text(r) for r in range(total, 3599, -1)})} "
+          f"iconos en {hours_left} s (uno por minuto)")
+
+    del app
+    if renderer.renders != expected or cached_time >= direct_time:
+        print("FALLO: el renderizador no se limita a los cambios del valor mostrado")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -51,6 +51,30 @@ def create_resources():
         if not os.path.exists(icon_path):
             print(f"⚠ Advertencia: {icon_file} no encontrado para {platform_name}")
 
+def compile_themes():
+    """Precompila los temas incluidos para que el arranque no procese plantillas."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from utils.theme_engine import compile_themes as compile_theme_files
+    
+    try:
+        for path in compile_theme_files():
+            print(f"✓ Tema precompilado: {path}")
+    except (OSError, ValueError) as e:
+        print(f"❌ Error al precompilar los temas: {e}")
+        sys.exit(1)
+
+def compile_resources():
+    """Empaqueta iconos, estilos y traducciones en el archivo resources.rcc."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from utils.resources import compile_resources as compile_resource_module
+    
+    try:
+        output, count = compile_resource_module()
+        print(f"✓ Recursos empaquetados: {count} archivos en {output}")
+    except (ImportError, OSError) as e:
+        print(f"❌ Error al empaquetar los recursos: {e}")
+        sys.exit(1)
+
 def ensure_spec_file():
     """Verifica si existe el archivo .spec y lo crea si es necesario."""
     spec_file = 'EnergyPy.spec'
@@ -81,7 +105,9 @@ def ensure_spec_file():
         cmd = ['pyinstaller', '--name', 'EnergyPy', '--noconfirm', '--onedir']
         cmd.extend(console_option)
         cmd.extend(icon_option)
-        cmd.extend(['--add-data', f'resources{os.pathsep}resources'])
+        # Los recursos van en resources.rcc (compile_resources), no como
+        # archivos sueltos; utils/resources.py lo registra al arrancar
+        cmd.extend(['--add-data', f'resources.rcc{os.pathsep}.'])
         cmd.append('main.py')
         
         try:
@@ -103,6 +129,12 @@ def build_executable():
     # Verificar recursos
     create_resources()
     
+    # Generar las hojas de estilo de los temas
+    compile_themes()
+    
+    # Empaquetar los recursos (después de los temas, que incluye)
+    compile_resources()
+    
     # Asegurar que existe el archivo .spec
     spec_file = ensure_spec_file()
     
@@ -153,4 +185,12 @@ def build_executable():
         sys.exit(1)
 
 if __name__ == "__main__":
-    build_executable()
\ No newline at end of file
+    if '--themes' in sys.argv[1:] or '--resources' in sys.argv[1:]:
+        # Solo precompilar los temas (por ejemplo, tras editar la plantilla)
+        if '--themes' in sys.argv[1:]:
+            compile_themes()
+        # Solo empaquetar los recursos
+        if '--resources' in sys.argv[1:]:
+            compile_resources()
+    else:
+        build_executable()
\ No newline at end of file
@@ -0,0 +1,28 @@
+"""
+Interfaz de línea de comandos de EnergyPy.
+
+Permite programar, cancelar y consultar acciones desde scripts (cron,
+herramientas de aprovisionamiento...) sin arrancar la interfaz gráfica:
+
+    python cli.py schedule --in 90m --action restart
+    python cli.py schedule --at 23:30
+    python cli.py cancel
+    python cli.py status --json
+"""
+
+import os
+import sys
+
+# Asegurar que los módulos de la aplicación sean encontrados
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from controllers.cli_controller import CliController
+
+
+def main():
+    """Función principal que ejecuta la orden indicada."""
+    sys.exit(CliController().run())
+
+
+if __name__ == "__main__":
+    main()
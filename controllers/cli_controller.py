@@ -0,0 +1,328 @@
+"""
+Controlador de la interfaz de línea de comandos de EnergyPy.
+
+Este módulo implementa las órdenes show, schedule, cancel y status. Si hay
+una instancia de EnergyPy en ejecución (interfaz gráfica o daemon), la orden
+se le reenvía por IPC; si no, se ejecuta localmente sobre los mismos
+modelos y el mismo diario. Para que la primera salida sea inmediata no
+importa nada de PyQt5 y difiere la carga de argparse y de los modelos hasta
+que la orden los necesita.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+# Órdenes que se ejecutan sin interfaz y opciones del analizador; cualquier
+# otro argumento (-platform, -style, -psn_* en macOS...) pertenece a Qt
+CLI_COMMANDS = ('schedule', 'cancel', 'status')
+CLI_OPTIONS = ('-h', '--help')
+
+
+def is_cli_invocation(argv):
+    """Indica si los argumentos corresponden a una orden de la CLI.
+
+    'show' no cuenta: sin instancia en ejecución equivale a abrir la
+    interfaz, que recibe el resto de argumentos.
+
+    Args:
+        argv (list): Argumentos sin el nombre del programa
+
+    Returns:
+        bool: True si la orden debe procesarla CliController
+    """
+    return bool(argv) and (argv[0] in CLI_COMMANDS or argv[0] in CLI_OPTIONS)
+
+
+def _duration(text):
+    """Tipo de argparse para duraciones ('90m', '1h30m', '45s'...)."""
+    import argparse
+    from utils.time_utils import parse_duration
+
+    try:
+        seconds = parse_duration(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    if seconds == 0:
+        raise argparse.ArgumentTypeError("La duración debe ser mayor que cero")
+    return seconds
+
+
+def _clock_time(text):
+    """Tipo de argparse para horas exactas en formato HH:MM."""
+    import argparse
+    from utils.time_utils import validate_time_format
+
+    valid, error = validate_time_format(text)
+    if not valid:
+        raise argparse.ArgumentTypeError(error)
+    return text
+
+
+class CliController:
+    """Controlador de las órdenes de línea de comandos."""
+
+    def __init__(self, stdout=None, stderr=None):
+        """Inicializa el controlador.
+
+        Args:
+            stdout (file, optional): Salida de resultados (por defecto sys.stdout)
+            stderr (file, optional): Salida de errores (por defecto sys.stderr)
+        """
+        self.stdout = stdout or sys.stdout
+        self.stderr = stderr or sys.stderr
+        self._config_dir = None
+        self.commands = {
+            'show': self.cmd_show,
+            'schedule': self.cmd_schedule,
+            'cancel': self.cmd_cancel,
+            'status': self.cmd_status,
+        }
+
+    def run(self, argv=None):
+        """Ejecuta una orden.
+
+        Args:
+            argv (list, optional): Argumentos; por defecto los de sys.argv
+
+        Returns:
+            int: Código de salida
+        """
+        argv = sys.argv[1:] if argv is None else list(argv)
+
+        # Vía rápida: la consulta de estado es la orden más usada desde
+        # scripts y no necesita construir el analizador de argumentos
+        if argv[:1] == ['status'] and set(argv[1:]) <= {'--json'}:
+            return self.cmd_status(json_output='--json' in argv)
+
+        args = self.build_parser().parse_args(argv)
+        if args.command == 'status':
+            return self.cmd_status(json_output=args.json)
+        if args.command == 'schedule':
+            return self.cmd_schedule(args.action, delay=args.delay, at=args.at)
+        return self.commands[args.command]()
+
+    def build_parser(self):
+        """Construye el analizador de argumentos.
+
+        Returns:
+            argparse.ArgumentParser: Analizador configurado
+        """
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            prog='energypy',
+            description="Programa el apagado o reinicio del sistema sin interfaz gráfica"
+        )
+        commands = parser.add_subparsers(dest='command', metavar='COMANDO')
+        commands.required = True
+
+        schedule = commands.add_parser('schedule', help="Programa una acción")
+        when = schedule.add_mutually_exclusive_group(required=True)
+        when.add_argument('--in', dest='delay', type=_duration, metavar='DURACIÓN',
+                          help="Tiempo hasta la acción (por ejemplo 90m, 1h30m, 45s)")
+        when.add_argument('--at', dest='at', type=_clock_time, metavar='HH:MM',
+                          help="Hora exacta de la acción (24h)")
+        schedule.add_argument('--action', choices=('shutdown', 'restart'), default='shutdown',
+                              help="Acción a programar (por defecto: shutdown)")
+
+        commands.add_parser('show', help="Muestra la ventana de la instancia en ejecución")
+        commands.add_parser('cancel', help="Cancela las acciones programadas")
+
+        status = commands.add_parser('status', help="Muestra la acción programada")
+        status.add_argument('--json', action='store_true', help="Salida en formato JSON")
+        return parser
+
+    def cmd_show(self):
+        """Trae al frente la ventana de la instancia en ejecución.
+
+        Returns:
+            int: Código de salida
+        """
+        response = self._forward('show')
+        if response is None:
+            print("No hay ninguna instancia de EnergyPy en ejecución", file=self.stderr)
+            return 1
+        return self._report_error(response, "Error al mostrar la ventana")
+
+    def cmd_schedule(self, action_type, delay=None, at=None):
+        """Programa una acción del sistema.
+
+        Args:
+            action_type (str): 'shutdown' o 'restart'
+            delay (int, optional): Segundos hasta la acción
+            at (str, optional): Hora exacta HH:MM (alternativa a delay)
+
+        Returns:
+            int: Código de salida
+        """
+        args = {'action': action_type}
+        if at is not None:
+            args['at'] = at
+        else:
+            args['seconds'] = delay
+
+        response = self._forward('schedule', args)
+        if response is None:
+            response = self._run_locally('schedule', args)
+        if self._report_error(response, f"Error al programar {action_type}"):
+            return 1
+
+        scheduled_time = datetime.fromisoformat(response['result']['scheduled_time'])
+        print(f"{action_type} programado para {scheduled_time:%Y-%m-%d %H:%M:%S}",
+              file=self.stdout)
+        return 0
+
+    def cmd_cancel(self):
+        """Cancela todas las acciones programadas.
+
+        Returns:
+            int: Código de salida
+        """
+        response = self._forward('cancel')
+        if response is None:
+            response = self._run_locally('cancel', {})
+        if self._report_error(response, "Error al cancelar"):
+            return 1
+
+        print("Acción programada cancelada", file=self.stdout)
+        return 0
+
+    def cmd_status(self, json_output=False):
+        """Muestra la acción programada y las tareas pendientes.
+
+        Args:
+            json_output (bool): Si es True, imprime el estado en JSON
+
+        Returns:
+            int: Código de salida
+        """
+        response = self._forward('status')
+        if response is None:
+            status = self._read_status()
+        elif self._report_error(response, "Error al consultar el estado"):
+            return 1
+        else:
+            status = response['result']
+
+        if json_output:
+            import json
+
+            print(json.dumps(status), file=self.stdout)
+            return 0
+
+        info = status['next']
+        if info is None:
+            print("No hay ninguna acción programada", file=self.stdout)
+            return 0
+
+        from utils.time_utils import format_time_remaining
+
+        scheduled_time = datetime.fromisoformat(info['scheduled_time'])
+        print(f"Acción: {info['action_type']}\n"
+              f"Hora: {scheduled_time:%Y-%m-%d %H:%M:%S}\n"
+              f"Restante: {format_time_remaining(info['remaining_seconds'])}",
+              file=self.stdout)
+        if len(status['jobs']) > 1:
+            print(f"Tareas pendientes: {len(status['jobs'])}", file=self.stdout)
+        return 0
+
+    def _report_error(self, response, prefix):
+        """Imprime el error de una respuesta fallida.
+
+        Returns:
+            int: 1 si la respuesta es un error, 0 en caso contrario
+        """
+        if response['ok']:
+            return 0
+        print(f"{prefix}: {response['error']}", file=self.stderr)
+        return 1
+
+    @property
+    def config_dir(self):
+        """Directorio de configuración del usuario (diario y socket IPC)."""
+        if self._config_dir is None:
+            from utils.paths import get_user_config_dir
+
+            # Solo la ruta: cargar la configuración no hace falta aquí
+            self._config_dir = get_user_config_dir(create=False)
+        return self._config_dir
+
+    def _forward(self, command, args=None):
+        """Reenvía una orden a la instancia en ejecución.
+
+        Returns:
+            dict: Respuesta o None si no hay ninguna instancia en ejecución
+        """
+        from utils.ipc import send_command
+
+        return send_command(self.config_dir, command, args)
+
+    def _open_journal(self):
+        """Abre el diario de acciones programadas compartido con la interfaz.
+
+        Returns:
+            ScheduleJournal: Diario del usuario
+        """
+        from models.schedule_journal import ScheduleJournal
+
+        return ScheduleJournal(os.path.join(self.config_dir, 'schedule'))
+
+    def _read_status(self):
+        """Lee el estado directamente del diario, sin instancia en ejecución.
+
+        Consultar el estado no necesita planificador, temporizadores ni
+        backend: basta con reproducir el diario que mantiene SystemModel.
+
+        Returns:
+            dict: Mismo formato que CommandHandler.status()
+        """
+        journal = self._open_journal()
+        now = time.time()
+        jobs = []
+        for action_type, deadline, duration in sorted(journal.load().values(),
+                                                      key=lambda item: item[1]):
+            if deadline > now:
+                jobs.append({
+                    'action_type': action_type,
+                    'scheduled_time': datetime.fromtimestamp(deadline).isoformat(),
+                    'remaining_seconds': int(deadline - now),
+                    'original_seconds': duration
+                })
+        journal.close()
+        return {'scheduled': bool(jobs), 'next': jobs[0] if jobs else None, 'jobs': jobs}
+
+    def _run_locally(self, command, args):
+        """Ejecuta una orden en este proceso cuando no hay instancia en ejecución.
+
+        Espera a que terminen los comandos del sistema antes de volver, ya
+        que el proceso termina enseguida; la acción queda programada en el
+        sistema y en el diario.
+
+        Args:
+            command (str): Orden ('schedule' o 'cancel')
+            args (dict): Argumentos de la orden
+
+        Returns:
+            dict: Respuesta con el mismo formato que la del IPC
+        """
+        from controllers.command_handler import CommandHandler
+        from models.system_model import SystemModel
+
+        system_model = SystemModel()
+        system_model.attach_journal(self._open_journal())
+        results = []
+        system_model.add_command_listener(results.append)
+        try:
+            response = CommandHandler(system_model).handle(command, args)
+        finally:
+            system_model.executor.shutdown(wait=True)
+            system_model.scheduler.close()
+            system_model.journal.close()
+
+        for result in results:
+            if not result['ok']:
+                error = result['error'] or f"El comando '{result['label']}' ha fallado"
+                return {'ok': False, 'error': error}
+        return response
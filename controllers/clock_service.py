@@ -0,0 +1,139 @@
+"""
+Servicio de reloj central de la interfaz gráfica.
+
+Este módulo sustituye a los temporizadores de 1 Hz siempre activos por un
+único temporizador de un solo disparo que solo se arma mientras hay una
+acción pendiente y la ventana está visible. Cada tick se alinea con el
+instante en que cambia el segundo mostrado de la cuenta regresiva, de modo
+que en reposo no hay ningún despertar. Con la ventana oculta solo se
+despierta cuando cambia el valor que muestra la bandeja (por ejemplo, una
+vez por minuto con más de una hora pendiente), y ninguna vez si no hay
+bandeja que actualizar.
+"""
+
+import time
+from collections import deque
+
+from PyQt5.QtCore import QEvent, QObject, Qt, QTimer, pyqtSignal
+
+# Margen (ms) tras la frontera del segundo para que el valor ya haya cambiado
+TICK_SLACK_MS = 5
+# Ventana (segundos) del contador de despertares por minuto
+WAKEUP_WINDOW = 60
+
+
+class ClockService(QObject):
+    """Reloj de la interfaz que solo despierta cuando hay algo que mostrar."""
+
+    # Se emite en cada frontera de segundo mientras el servicio está activo
+    tick = pyqtSignal()
+
+    def __init__(self, clock=time.monotonic, parent=None):
+        """Inicializa el servicio.
+
+        Args:
+            clock (callable): Reloj monotónico en segundos; debe ser el mismo
+                que el de las fechas límite recibidas en set_pending()
+            parent (QObject, optional): Objeto padre
+        """
+        super().__init__(parent)
+        self.clock = clock
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+        self._pending = False
+        self._visible = True
+        self._deadline = None
+        # Intervalo de ticks con la ventana oculta: callable(segundos_restantes)
+        # o None para no despertar en absoluto
+        self.background_interval = None
+        self.wakeups = 0
+        self._recent_wakeups = deque()
+
+    def set_pending(self, pending, deadline=None):
+        """Indica si hay una acción pendiente que mostrar.
+
+        Args:
+            pending (bool): True si hay una cuenta regresiva en curso
+            deadline (float, optional): Fecha límite en el reloj del servicio;
+                los ticks se alinean con sus fronteras de segundo
+        """
+        self._pending = pending
+        self._deadline = deadline if pending else None
+        self._rearm()
+
+    def set_visible(self, visible):
+        """Indica si la ventana que muestra la cuenta regresiva es visible."""
+        if visible != self._visible:
+            self._visible = visible
+            self._rearm()
+
+    def watch(self, widget):
+        """Sigue la visibilidad de una ventana (mostrar, ocultar, minimizar).
+
+        Args:
+            widget (QWidget): Ventana que muestra la cuenta regresiva
+        """
+        widget.installEventFilter(self)
+        self._visible = widget.isVisible() and not widget.isMinimized()
+        self._rearm()
+
+    def eventFilter(self, obj, event):
+        """Actualiza la visibilidad a partir de los eventos de la ventana."""
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange):
+            visible = obj.isVisible() and not obj.isMinimized()
+            refresh = visible and not self._visible and self._pending
+            self.set_visible(visible)
+            if refresh:
+                # Al volver a mostrarse, refrescar sin esperar al siguiente tick
+                self.tick.emit()
+        return False
+
+    def is_active(self):
+        """Indica si el temporizador está armado."""
+        return self._timer.isActive()
+
+    def wakeups_per_minute(self):
+        """Despertares del temporizador durante el último minuto.
+
+        Returns:
+            int: Número de ticks en los últimos 60 segundos
+        """
+        self._trim_wakeups(self.clock())
+        return len(self._recent_wakeups)
+
+    def stop(self):
+        """Detiene el servicio (por ejemplo, al cerrar la aplicación)."""
+        self._pending = False
+        self._timer.stop()
+
+    def _rearm(self):
+        """Arma o desarma el temporizador según el estado actual."""
+        if not (self._pending and (self._visible or self._background_active())):
+            self._timer.stop()
+        elif not self._timer.isActive():
+            self._timer.start(self._next_delay_ms())
+
+    def _background_active(self):
+        """Indica si hay que despertar con la ventana oculta."""
+        return self.background_interval is not None and self._deadline is not None
+
+    def _next_delay_ms(self):
+        """Milisegundos hasta la próxima frontera del valor mostrado."""
+        reference = self._deadline if self._deadline is not None else 0.0
+        remaining = reference - self.clock()
+        step = 1 if self._visible else self.background_interval(remaining)
+        return int((remaining % step) * 1000) + TICK_SLACK_MS
+
+    def _on_timeout(self):
+        now = self.clock()
+        self.wakeups += 1
+        self._recent_wakeups.append(now)
+        self._trim_wakeups(now)
+        self.tick.emit()
+        self._rearm()
+
+    def _trim_wakeups(self, now):
+        while self._recent_wakeups and self._recent_wakeups[0] <= now - WAKEUP_WINDOW:
+            self._recent_wakeups.popleft()
@@ -0,0 +1,149 @@
+"""
+Manejador de órdenes compartido por la interfaz gráfica, el daemon y la CLI.
+
+Traduce las órdenes del protocolo IPC (show, schedule, cancel, status) a
+llamadas sobre SystemModel y devuelve respuestas serializables en JSON, de
+modo que cualquier cliente obtiene el mismo comportamiento sea cual sea la
+instancia que está en ejecución.
+"""
+
+import logging
+
+from models.system_model import SYSTEM_ACTIONS
+from utils.time_utils import (
+    validate_time_input, validate_time_format, time_string_to_datetime
+)
+
+
+def serialize_info(info):
+    """Convierte la información de una tarea a un diccionario serializable.
+
+    Args:
+        info (dict): Resultado de SystemModel.get_scheduled_info()
+
+    Returns:
+        dict: Misma información con la hora en formato ISO 8601
+    """
+    return {
+        'action_type': info['action_type'],
+        'scheduled_time': info['scheduled_time'].isoformat(),
+        'remaining_seconds': info['remaining_seconds'],
+        'original_seconds': info['original_seconds']
+    }
+
+
+def build_status(jobs):
+    """Construye la respuesta de la orden status.
+
+    Args:
+        jobs (list): Tareas serializadas, ordenadas por fecha límite
+
+    Returns:
+        dict: {'scheduled': bool, 'next': dict o None, 'jobs': list}
+    """
+    return {'scheduled': bool(jobs), 'next': jobs[0] if jobs else None, 'jobs': jobs}
+
+
+class CommandHandler:
+    """Ejecuta las órdenes recibidas sobre el modelo del sistema."""
+
+    def __init__(self, system_model, show_callback=None, on_change=None):
+        """Inicializa el manejador.
+
+        Args:
+            system_model (SystemModel): Modelo del sistema
+            show_callback (callable, optional): Muestra la ventana principal;
+                None si la instancia no tiene interfaz
+            on_change (callable, optional): Se invoca tras programar o cancelar
+        """
+        self.logger = logging.getLogger(__name__)
+        self.system_model = system_model
+        self.show_callback = show_callback
+        self.on_change = on_change
+        self.commands = {
+            'show': self.show,
+            'schedule': self.schedule,
+            'cancel': self.cancel,
+            'status': self.status,
+        }
+
+    def handle(self, command, args):
+        """Despacha una orden.
+
+        Args:
+            command (str): Nombre de la orden
+            args (dict): Argumentos de la orden
+
+        Returns:
+            dict: {'ok': True, 'result': ...} o {'ok': False, 'error': ...}
+        """
+        method = self.commands.get(command)
+        if method is None:
+            return {'ok': False, 'error': f"Orden desconocida: {command}"}
+        try:
+            return {'ok': True, 'result': method(**args)}
+        except (TypeError, ValueError) as e:
+            return {'ok': False, 'error': str(e)}
+
+    def show(self):
+        """Muestra y activa la ventana principal."""
+        if self.show_callback is None:
+            raise ValueError("La instancia en ejecución no tiene interfaz gráfica")
+        self.show_callback()
+        return None
+
+    def schedule(self, action='shutdown', seconds=None, at=None):
+        """Programa una acción del sistema.
+
+        Args:
+            action (str): 'shutdown' o 'restart'
+            seconds (int, optional): Segundos hasta la acción
+            at (str, optional): Hora exacta HH:MM (alternativa a seconds)
+
+        Returns:
+            dict: Información de la acción recién programada
+
+        Raises:
+            ValueError: Si los argumentos no son válidos o el sistema rechaza la acción
+        """
+        if action not in SYSTEM_ACTIONS:
+            raise ValueError(f"Acción no válida: {action}")
+
+        if at is not None:
+            valid, error = validate_time_format(at)
+            if not valid:
+                raise ValueError(error)
+            job_id = self.system_model.schedule_shutdown_at_time(
+                time_string_to_datetime(at), action
+            )
+        else:
+            valid, error = validate_time_input(seconds, 'seconds')
+            if not valid or not seconds:
+                raise ValueError(error or "La duración debe ser mayor que cero")
+            job_id = self.system_model.schedule_shutdown(seconds, action)
+
+        info = self.system_model.get_scheduled_info(job_id) if job_id is not None else None
+        if info is None:
+            # No se pudo programar o el sistema ya la ha rechazado
+            raise ValueError(f"No se pudo programar {action}")
+        self.logger.info(f"Programado {action} por orden externa")
+        self._notify_change()
+        return serialize_info(info)
+
+    def cancel(self):
+        """Cancela todas las acciones programadas."""
+        if not self.system_model.cancel_scheduled_action():
+            raise ValueError("No se pudo cancelar la acción programada")
+        self.logger.info("Acción cancelada por orden externa")
+        self._notify_change()
+        return None
+
+    def status(self):
+        """Devuelve la acción programada y las tareas pendientes del sistema."""
+        jobs = [serialize_info(info) for info in self.system_model.get_pending_jobs()
+                if info['action_type'] in SYSTEM_ACTIONS]
+        return build_status(jobs)
+
+    def _notify_change(self):
+        if self.on_change is not None:
+            self.on_change()
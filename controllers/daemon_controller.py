@@ -0,0 +1,128 @@
+"""
+Controlador sin interfaz gráfica (daemon) de EnergyPy.
+
+Este módulo mantiene los modelos (SystemModel, ConfigModel) en un bucle de
+eventos ligero de la biblioteca estándar (selectors) sin importar PyQt5,
+para servidores sin pantalla. La interfaz gráfica pasa a ser un cliente
+opcional del mismo estado persistente.
+"""
+
+import os
+import signal
+
+from models.config_model import ConfigModel
+from models.reconciler import ScheduleReconciler
+from models.schedule_journal import ScheduleJournal
+from models.system_model import SystemModel
+from controllers.command_handler import CommandHandler
+from utils.event_loop import EventLoop
+from utils.ipc import IpcServer
+from utils.logger import setup_logger
+
+# Intervalo (segundos) de reconciliación periódica con el estado del sistema
+DEFAULT_RECONCILE_INTERVAL = 60
+
+
+class DaemonController:
+    """Controlador del modo sin interfaz gráfica."""
+
+    def __init__(self, reconcile_interval=DEFAULT_RECONCILE_INTERVAL):
+        """Inicializa el daemon.
+
+        Args:
+            reconcile_interval (float): Segundos entre reconciliaciones
+        """
+        self.logger = setup_logger()
+        self.logger.info("Iniciando EnergyPy en modo daemon")
+
+        # Inicializar modelos
+        self.system_model = SystemModel()
+        self.config_model = ConfigModel()
+
+        self.reconciler = ScheduleReconciler(
+            self.system_model,
+            policy=self.config_model.get_config('foreign_schedule_policy')
+        )
+        self.reconcile_interval = reconcile_interval
+        self.loop = EventLoop()
+
+        # Órdenes de la CLI y de otros lanzamientos, atendidas en el bucle
+        self.command_handler = CommandHandler(self.system_model)
+        self.ipc_server = IpcServer(self.config_model.config_dir, self.command_handler.handle)
+
+    def run(self):
+        """Ejecuta el bucle de eventos hasta recibir una señal de parada.
+
+        Returns:
+            int: Código de salida (1 si ya hay otra instancia en ejecución)
+        """
+        if not self.ipc_server.listen():
+            self.logger.error("Ya hay una instancia de EnergyPy en ejecución")
+            self.loop.close()
+            return 1
+
+        # Restaurar las acciones programadas por cualquier cliente anterior
+        self.system_model.attach_journal(
+            ScheduleJournal(os.path.join(self.config_model.config_dir, 'schedule'))
+        )
+        self.ipc_server.attach(self.loop.add_reader, self.loop.remove_reader)
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self.loop.add_signal_handler(sig, self.loop.stop)
+            except (OSError, ValueError):
+                # Solo el hilo principal puede instalar manejadores de señales
+                pass
+
+        # Los resultados de los comandos llegan desde hilos de trabajo
+        self.system_model.add_command_listener(
+            lambda result: self.loop.call_soon_threadsafe(self._on_command_finished, result)
+        )
+
+        self._reconcile()
+        info = self.system_model.get_scheduled_info()
+        if info:
+            self.logger.info(
+                f"Acción pendiente: {info['action_type']} a las {info['scheduled_time']}"
+            )
+        self.loop.call_later(self.reconcile_interval, self._periodic_reconcile)
+
+        try:
+            self.loop.run_forever()
+        finally:
+            self._shutdown()
+        return 0
+
+    def stop(self):
+        """Solicita la parada del daemon (seguro desde cualquier hilo)."""
+        self.loop.stop()
+
+    def _periodic_reconcile(self):
+        """Reconcilia y vuelve a programar la siguiente comprobación."""
+        self._reconcile()
+        self.loop.call_later(self.reconcile_interval, self._periodic_reconcile)
+
+    def _reconcile(self):
+        """Alinea el estado con el apagado pendiente del sistema."""
+        outcome = self.reconciler.reconcile()
+        if outcome in ('adopted', 'dropped', 'cancelled'):
+            self.logger.info(f"Reconciliación con el sistema: {outcome}")
+
+    def _on_command_finished(self, result):
+        """Procesa en el bucle el resultado de un comando del sistema.
+
+        Args:
+            result (dict): Resultado del comando
+        """
+        if result['ok']:
+            self._reconcile()
+
+    def _shutdown(self):
+        """Libera los recursos sin cancelar las acciones programadas."""
+        self.ipc_server.close()
+        if self.system_model.journal is not None:
+            self.system_model.journal.close()
+        self.system_model.executor.shutdown(wait=True)
+        self.system_model.scheduler.close()
+        self.loop.close()
+        self.logger.info("Daemon detenido")
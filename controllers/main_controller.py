@@ -10,83 +10,325 @@ import logging
 from datetime import datetime
 
 from PyQt5.QtWidgets import QApplication, QMessageBox, QAction
-from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import QEvent, QFileSystemWatcher, QObject, QSocketNotifier, QTimer, pyqtSignal
 
 from models.system_model import SystemModel
 from models.config_model import ConfigModel
+from models.reconciler import ScheduleReconciler
+from models.schedule_journal import ScheduleJournal
+from controllers.clock_service import ClockService
+from controllers.command_handler import CommandHandler
 from views.main_view import MainView
-from views.settings_view import SettingsView
-from views.help_view import HelpView, AboutView
+from views.countdown_view_model import CountdownViewModel
+from views.tray_renderer import update_interval as tray_update_interval
 from utils.i18n import I18n
-from utils.logger import setup_logger, log_action
+from utils.logger import setup_logger, log_action, clean_old_logs
+from utils.startup_profiler import profiler
+from utils.file_watcher import FileWatcher
+from utils.theme_engine import ThemeEngine
+
+
+class CommandResultBridge(QObject):
+    """Reenvía al hilo de la interfaz los resultados de los comandos del sistema."""
+
+    # Se emite desde el hilo de trabajo; Qt lo entrega en el hilo de la interfaz
+    command_finished = pyqtSignal(dict)
+
+
+class FirstPaintNotifier(QObject):
+    """Avisa una sola vez cuando una ventana se pinta por primera vez."""
+
+    painted = pyqtSignal()
+
+    def __init__(self, widget):
+        """Inicializa el notificador.
+
+        Args:
+            widget (QWidget): Ventana a vigilar
+        """
+        super().__init__(widget)
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """Emite painted en el primer evento de pintado y deja de vigilar."""
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            self.painted.emit()
+        return False
 
 
 class MainController:
     """Controlador principal de la aplicación."""
 
-    def __init__(self):
-        """Inicializa el controlador principal."""
+    def __init__(self, ipc_server=None):
+        """Inicializa el controlador principal.
+
+        Args:
+            ipc_server (IpcServer, optional): Servidor de órdenes de la
+                instancia única, ya escuchando
+        """
         # Configurar el logger
         self.logger = setup_logger()
         self.logger.info("Iniciando aplicación EnergyPy")
         
         # Inicializar modelos
-        self.system_model = SystemModel()
-        self.config_model = ConfigModel()
+        with profiler.phase('modelos'):
+            self.system_model = SystemModel()
+        with profiler.phase('configuración'):
+            self.config_model = ConfigModel()
+            # Cargar configuración
+            self.config = self.config_model.get_config()
+            # Guardar los cambios pendientes al salir, sea cual sea el camino
+            QApplication.instance().aboutToQuit.connect(self.config_model.close)
+            # Cambios de config.json hechos por otros procesos
+            self.config_model.add_change_listener(self._on_config_changed)
+        self.config_watcher = None
+        self.config_notifier = None
+        
+        # Restaurar las acciones programadas antes de un cierre inesperado
+        with profiler.phase('diario de acciones'):
+            self.system_model.attach_journal(
+                ScheduleJournal(os.path.join(self.config_model.config_dir, 'schedule'))
+            )
         
-        # Cargar configuración
-        self.config = self.config_model.get_config()
+        # Resultados de los comandos del sistema, entregados en el hilo de la interfaz
+        self.command_bridge = CommandResultBridge()
+        self.command_bridge.command_finished.connect(self._on_command_finished)
+        self.system_model.add_command_listener(self.command_bridge.command_finished.emit)
+        
+        # Hojas de estilo procesadas y en caché por tema
+        self.theme_engine = ThemeEngine(
+            user_themes_dir=os.path.join(self.config_model.config_dir, 'themes')
+        )
         
         # Inicializar internacionalización
-        self.i18n = I18n(self.config['language'])
+        with profiler.phase('i18n'):
+            self.i18n = I18n(self.config['language'])
+        
+        # Reconciliación con el apagado que el sistema tiene realmente pendiente
+        self.reconciler = ScheduleReconciler(
+            self.system_model, policy=self.config['foreign_schedule_policy']
+        )
+        self.schedule_watcher = None
+        
+        # Órdenes de otros lanzamientos y de la CLI, atendidas en el hilo de la interfaz
+        self.command_handler = CommandHandler(
+            self.system_model,
+            show_callback=self.show_window,
+            on_change=self.update_countdown
+        )
+        self.ipc_server = ipc_server
+        self.ipc_notifiers = {}  # Un QSocketNotifier por socket vigilado
+        if ipc_server is not None:
+            ipc_server.handler = self.command_handler.handle
+            ipc_server.attach(self._add_ipc_reader, self._remove_ipc_reader)
         
-        # Inicializar vistas
+        # Inicializar vistas (los diálogos se crean al abrirlos por primera vez)
         self.main_view = None
+        self.countdown = None
         self.settings_view = None
         self.help_view = None
         self.about_view = None
         
-        # Timer para actualizar la cuenta regresiva
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_countdown)
-        self.update_timer.start(1000)  # Actualizar cada segundo
-        
-        # Verificar permisos de administrador
-        self._check_admin_permissions()
+        # Reloj de la cuenta regresiva: solo despierta con una acción pendiente
+        # y la ventana visible, alineado con el cambio de cada segundo
+        self.clock_service = ClockService(clock=self.system_model.time_source.now)
+        self.clock_service.tick.connect(self.update_countdown)
+        
+        # Etapas que no son necesarias para el primer pintado, en orden; la
+        # verificación de permisos de administrador es una de ellas
+        self.first_paint_notifier = None
+        self._deferred_stages = [
+            ('bandeja', self._setup_tray),
+            ('menú', self._setup_menu),
+            ('contenido de ayuda', self._prepare_help),
+            ('temas', lambda: self.theme_engine.preload(('light', 'dark'))),
+            ('vigilancia de la configuración', self._setup_config_watcher),
+            ('permisos de administrador', self._check_admin_permissions),
+            ('limpieza de registros', clean_old_logs),
+        ]
 
     def start(self):
-        """Inicia la aplicación y muestra la vista principal."""
+        """Inicia la aplicación y muestra la vista principal.
+        
+        Solo el camino crítico (ventana, tema y valores de la configuración)
+        se ejecuta antes de mostrarla; la bandeja, el menú, la ayuda, la
+        verificación de permisos y la limpieza de registros se ejecutan
+        después del primer pintado, una etapa por iteración del bucle de eventos.
+        """
         # Inicializar la vista principal
-        self.main_view = MainView(self, self.i18n)
+        with profiler.phase('vista principal'):
+            self.main_view = MainView(self, self.i18n)
+            self.countdown = CountdownViewModel(self.main_view)
         
         # Conectar señales de la vista principal
         self._connect_main_view_signals()
+        self.clock_service.watch(self.main_view)
         
-        # Cargar tema
-        self._load_theme()
+        # Cargar tema (antes de mostrar, para no repintar con otro estilo)
+        with profiler.phase('tema'):
+            self._load_theme()
         
         # Cargar configuración en la vista
         self._load_config_to_view()
         
+        # Adoptar o descartar el estado pendiente del sistema
+        with profiler.phase('reconciliación'):
+            self._setup_reconciler()
+        
         # Mostrar la vista principal
-        if self.config['start_minimized'] and self.config['minimize_to_tray']:
-            self.main_view.hide()
+        with profiler.phase('mostrar ventana'):
+            if self.config['start_minimized'] and self.config['minimize_to_tray']:
+                self.main_view.hide()
+            else:
+                self.main_view.show()
+        
+        # Reflejar las acciones restauradas del diario y armar el reloj si procede
+        self.update_countdown()
+        
+        if self.main_view.isVisible():
+            self.first_paint_notifier = FirstPaintNotifier(self.main_view)
+            self.first_paint_notifier.painted.connect(self._on_first_paint)
         else:
-            self.main_view.show()
+            # Sin ventana visible, las etapas diferidas empiezan con el bucle de eventos
+            profiler.mark('bucle de eventos')
+            QTimer.singleShot(0, self._run_deferred_stage)
         
         self.logger.info("Aplicación iniciada correctamente")
 
+    def _on_first_paint(self):
+        """Programa las etapas diferidas tras el primer pintado."""
+        profiler.first_paint()
+        QTimer.singleShot(0, self._run_deferred_stage)
+
+    def _run_deferred_stage(self):
+        """Ejecuta la siguiente etapa diferida y programa la posterior."""
+        if not self._deferred_stages:
+            profiler.finish()
+            return
+        name, stage = self._deferred_stages.pop(0)
+        try:
+            with profiler.phase(name):
+                stage()
+        except Exception as e:
+            self.logger.error(f"Error en la etapa de arranque '{name}': {str(e)}")
+        QTimer.singleShot(0, self._run_deferred_stage)
+
+    def _setup_tray(self):
+        """Crea el icono de la bandeja y le muestra la cuenta regresiva en curso."""
+        self.main_view._setup_tray_icon()
+        if self.main_view.tray_countdown_enabled:
+            # Con la ventana en la bandeja, despertar solo cuando cambia el icono
+            self.clock_service.background_interval = tray_update_interval
+        self.update_countdown()
+
+    def _prepare_help(self):
+        """Construye de antemano el diálogo de ayuda, sin mostrarlo."""
+        if self.help_view is None:
+            from views.help_view import HelpView
+            self.help_view = HelpView(self.main_view, self.i18n)
+
     def _check_admin_permissions(self):
         """Verifica si la aplicación tiene permisos de administrador."""
         if self.system_model.requires_admin():
             self.logger.warning("La aplicación no tiene permisos de administrador")
             # Mostrar advertencia al usuario
             QMessageBox.warning(
-                None,
+                self.main_view,
                 self.i18n.get_text("admin_required_title"),
                 self.i18n.get_text("admin_required_message")
             )
 
+    def _setup_reconciler(self):
+        """Reconcilia al iniciar y vigila los cambios del estado del sistema."""
+        self._reconcile_schedule()
+        if self.reconciler.is_supported():
+            # Solo se reconcilia cuando cambia el directorio de estado, nunca por tick
+            self.schedule_watcher = QFileSystemWatcher()
+            self.schedule_watcher.directoryChanged.connect(self._on_schedule_dir_changed)
+            self._update_schedule_watch()
+
+    def _update_schedule_watch(self):
+        """Vigila el directorio de estado o, hasta que exista, su antepasado."""
+        paths = self.reconciler.watch_paths()
+        current = self.schedule_watcher.directories()
+        if current != paths:
+            if current:
+                self.schedule_watcher.removePaths(current)
+            self.schedule_watcher.addPaths(paths)
+
+    def _on_schedule_dir_changed(self, path):
+        """Sigue al directorio de estado si se crea o se borra y reconcilia."""
+        self._update_schedule_watch()
+        self._reconcile_schedule()
+
+    def _reconcile_schedule(self, *args):
+        """Alinea la interfaz con el apagado pendiente del sistema."""
+        outcome = self.reconciler.reconcile()
+        if outcome in ('adopted', 'dropped', 'cancelled'):
+            self.update_countdown()
+
+    def _setup_config_watcher(self):
+        """Vigila config.json para aplicar los cambios hechos desde fuera."""
+        self.config_watcher = FileWatcher(self.config_model.config_file)
+        if self.config_watcher.fileno() is not None:
+            self.config_notifier = QSocketNotifier(self.config_watcher.fileno(), QSocketNotifier.Read)
+            self.config_notifier.activated.connect(lambda fd: self._check_config_file())
+        else:
+            self._schedule_config_poll()
+        self.logger.info(f"Vigilando la configuración ({self.config_watcher.backend})")
+
+    def _schedule_config_poll(self):
+        """Programa la siguiente comprobación del sondeo de config.json."""
+        QTimer.singleShot(int(self.config_watcher.next_interval() * 1000), self._poll_config_file)
+
+    def _poll_config_file(self):
+        self._check_config_file()
+        self._schedule_config_poll()
+
+    def _check_config_file(self):
+        """Recarga la configuración si config.json ha cambiado."""
+        if self.config_watcher.check():
+            self.config_model.reload()
+
+    def _add_ipc_reader(self, sock, callback):
+        """Vigila un socket del servidor de órdenes en el bucle de Qt.
+
+        Args:
+            sock (socket.socket): Socket a vigilar
+            callback (callable): Recibe el socket cuando es legible
+        """
+        notifier = QSocketNotifier(sock.fileno(), QSocketNotifier.Read)
+        notifier.activated.connect(lambda fd: callback(sock))
+        self.ipc_notifiers[sock] = notifier
+
+    def _remove_ipc_reader(self, sock):
+        """Deja de vigilar un socket del servidor de órdenes."""
+        notifier = self.ipc_notifiers.pop(sock, None)
+        if notifier is not None:
+            notifier.setEnabled(False)
+            notifier.deleteLater()
+
+    def _on_config_changed(self, changes):
+        """Aplica solo las claves de configuración cambiadas desde fuera.
+
+        Args:
+            changes (dict): {clave: nuevo valor}
+        """
+        if 'language' in changes:
+            self.i18n.set_language(changes['language'])
+            self._reload_ui_texts()
+        if 'theme' in changes:
+            self._load_theme()
+            if self.main_view:
+                self.main_view.apply_theme(changes['theme'])
+        if 'foreign_schedule_policy' in changes:
+            # Se aplica a partir de la próxima acción externa detectada
+            self.reconciler.policy = changes['foreign_schedule_policy']
+        # show_notifications y minimize_to_tray se consultan en cada uso
+        # sobre self.config, que el modelo ya ha actualizado
+        log_action(f"Configuración externa aplicada: {', '.join(sorted(changes))}")
+
     def _connect_main_view_signals(self):
         """Conecta las señales de la vista principal."""
         if self.main_view:
@@ -97,8 +339,7 @@ class MainController:
             # Cambio de tema
             self.main_view.theme_switch.stateChanged.connect(self.toggle_theme)
             
-            # Añadir menú de opciones
-            self._setup_menu()
+            # El menú de opciones se añade tras el primer pintado
 
     def _setup_menu(self):
         """Configura el menú de la aplicación."""
@@ -137,20 +378,8 @@ class MainController:
         help_menu.addAction(self.about_action)
 
     def _load_theme(self):
-        """Carga el tema de la aplicación."""
-        theme = self.config['theme']
-        theme_file = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'styles', f'{theme}.qss'
-        )
-        
-        try:
-            with open(theme_file, 'r', encoding='utf-8') as f:
-                style = f.read()
-                QApplication.instance().setStyleSheet(style)
-                self.logger.info(f"Tema cargado: {theme}")
-        except Exception as e:
-            self.logger.error(f"Error al cargar el tema: {str(e)}")
+        """Aplica el tema configurado a toda la aplicación (una sola vez por cambio)."""
+        self.theme_engine.apply(self.config['theme'])
 
     def _load_config_to_view(self):
         """Carga la configuración en la vista principal."""
@@ -177,32 +406,34 @@ class MainController:
             
             # Establecer tema
             self.main_view.theme_switch.setChecked(self.config['theme'] == 'dark')
+            self.main_view.theme_switch.setEnabled(not self.config_model.is_locked('theme'))
 
     def schedule_action(self):
         """Programa una acción de apagado o reinicio."""
         # Obtener tipo de acción
         action_type = 'shutdown' if self.main_view.shutdown_radio.isChecked() else 'restart'
         
-        # Guardar configuración
-        self.config_model.set_config('last_used_action', action_type)
-        
         # Obtener pestaña activa
         current_tab = self.main_view.tab_widget.currentIndex()
-        self.config_model.set_config('last_used_tab', current_tab)
+        
+        # Guardar configuración (una sola escritura para todas las claves)
+        with self.config_model.batch():
+            self.config_model.set_config('last_used_action', action_type)
+            self.config_model.set_config('last_used_tab', current_tab)
+            
+            if current_tab == 0:
+                # Obtener valor y unidad de tiempo
+                time_value = self.main_view.time_value_spin.value()
+                time_unit_index = self.main_view.time_unit_combo.currentIndex()
+                time_unit = ['seconds', 'minutes', 'hours'][time_unit_index]
+                
+                self.config_model.set_config('last_used_time_value', time_value)
+                self.config_model.set_config('last_used_time_unit', time_unit)
         
         success = False
-        scheduled_time = None
+        when = None
         
         if current_tab == 0:  # Pestaña de tiempo
-            # Obtener valor y unidad de tiempo
-            time_value = self.main_view.time_value_spin.value()
-            time_unit_index = self.main_view.time_unit_combo.currentIndex()
-            time_unit = ['seconds', 'minutes', 'hours'][time_unit_index]
-            
-            # Guardar configuración
-            self.config_model.set_config('last_used_time_value', time_value)
-            self.config_model.set_config('last_used_time_unit', time_unit)
-            
             # Convertir a segundos
             seconds = time_value
             if time_unit == 'minutes':
@@ -210,12 +441,9 @@ class MainController:
             elif time_unit == 'hours':
                 seconds *= 3600
             
-            # Guardar el tiempo original en segundos para el cálculo del progreso
-            self.system_model.original_seconds = seconds
-            
-            # Programar acción
+            # Programar acción (el modelo guarda la duración para el progreso)
             success = self.system_model.schedule_shutdown(seconds, action_type)
-            scheduled_time = datetime.now().strftime('%H:%M:%S')
+            when = self.i18n.get_text(f"in_{time_unit}", count=time_value)
             
             log_action(f"Programado {action_type} en {time_value} {time_unit}")
             
@@ -231,32 +459,24 @@ class MainController:
             
             # Programar acción
             success = self.system_model.schedule_shutdown_at_time(target_datetime, action_type)
-            scheduled_time = target_datetime.strftime('%H:%M:%S')
-            
-            # Guardar el tiempo original en segundos para el cálculo del progreso
-            now = datetime.now()
-            seconds = int((target_datetime - now).total_seconds())
-            self.system_model.original_seconds = seconds
+            scheduled_time = target_datetime.strftime('%H:%M')
+            when = self.i18n.get_text("at_time", time=scheduled_time, count=target_time.hour)
             
             log_action(f"Programado {action_type} a las {scheduled_time}")
         
         if success:
-            # Actualizar interfaz
-            self.main_view.schedule_button.setEnabled(False)
-            self.main_view.cancel_button.setEnabled(True)
-            self.main_view.tab_widget.setEnabled(False)
-            # Deshabilitar los radio buttons individualmente
-            self.main_view.shutdown_radio.setEnabled(False)
-            self.main_view.restart_radio.setEnabled(False)
+            # Actualizar interfaz y arrancar la cuenta regresiva
+            self._set_controls_scheduled(True)
+            self.update_countdown()
             
             # Mostrar notificación
-            if self.config['show_notifications']:
+            if self.config['show_notifications'] and self.main_view.tray_icon:
                 self.main_view.tray_icon.showMessage(
                     self.i18n.get_text("app_title"),
                     self.i18n.get_text(
                         "notification_scheduled",
                         action=self.i18n.get_text(f"action_{action_type}"),
-                        time=scheduled_time
+                        when=when
                     ),
                     3000
                 )
@@ -273,24 +493,15 @@ class MainController:
         success = self.system_model.cancel_scheduled_action()
         
         if success:
-            # Restablecer la interfaz
-            self.main_view.schedule_button.setEnabled(True)
-            self.main_view.cancel_button.setEnabled(False)
-            self.main_view.tab_widget.setEnabled(True)
-            self.main_view.shutdown_radio.setEnabled(True)
-            self.main_view.restart_radio.setEnabled(True)
-            
-            # Restablecer barra de progreso y tiempo restante
-            self.main_view.progress_bar.setValue(0)
-            self.main_view.remaining_time_label.setText("--:--:--")
-            
-            # Restablecer el tiempo original en segundos
-            self.system_model.original_seconds = 0
+            # Restablecer controles, barra de progreso y tiempo restante
+            self.countdown.reset()
+            self.main_view.update_tray_countdown(None)
+            self.clock_service.set_pending(False)
             
             log_action("Acción programada cancelada")
             
             # Mostrar notificación
-            if self.config['show_notifications']:
+            if self.config['show_notifications'] and self.main_view.tray_icon:
                 self.main_view.tray_icon.showMessage(
                     self.i18n.get_text("app_title"),
                     self.i18n.get_text("notification_cancelled"),
@@ -304,53 +515,86 @@ class MainController:
                 self.i18n.get_text("error_cancelling")
             )
 
+    def _set_controls_scheduled(self, scheduled):
+        """Habilita los controles según haya o no una acción programada.
+        
+        Args:
+            scheduled (bool): True si hay una acción programada
+        """
+        self.countdown.set_scheduled(scheduled)
+
+    def _on_command_finished(self, result):
+        """Procesa el resultado de un comando del sistema ejecutado en segundo plano.
+        
+        Args:
+            result (dict): Resultado del comando
+        """
+        if not self.main_view:
+            return
+        
+        if result['ok']:
+            # Los eventos del directorio llegados durante el comando se omitieron
+            self._reconcile_schedule()
+            return
+        
+        if result['label'] == 'schedule':
+            # El modelo ya retiró la tarea: refrescar la interfaz y avisar
+            self.update_countdown()
+            QMessageBox.critical(
+                self.main_view,
+                self.i18n.get_text("error_title"),
+                self.i18n.get_text("error_scheduling")
+            )
+        elif result['label'] == 'cancel':
+            QMessageBox.critical(
+                self.main_view,
+                self.i18n.get_text("error_title"),
+                self.i18n.get_text("error_cancelling")
+            )
+
     def update_countdown(self):
-        """Actualiza la cuenta regresiva en la interfaz."""
-        if not self.main_view or not self.system_model.get_scheduled_info():
+        """Actualiza la cuenta regresiva en la interfaz.
+        
+        El estado se calcula una vez por tick y solo se envían a los widgets
+        las propiedades que han cambiado.
+        """
+        if not self.main_view:
             return
         
-        remaining = self.system_model.get_remaining_time()
-        if remaining is not None:
-            # Calcular horas, minutos y segundos
-            hours, remainder = divmod(remaining, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            
-            # Actualizar etiqueta de tiempo restante
-            time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            self.main_view.remaining_time_label.setText(time_str)
-            
-            # Obtener información de la acción programada
-            info = self.system_model.get_scheduled_info()
-            
-            # Obtener el tiempo total original
-            total_seconds = getattr(self.system_model, 'original_seconds', 0)
-            
-            # Actualizar barra de progreso
-            if total_seconds > 0:
-                # Calcular el progreso como porcentaje del tiempo transcurrido
-                progress = int(((total_seconds - remaining) / total_seconds) * 100)
-                self.main_view.progress_bar.setValue(progress)
-            
-            # Si el tiempo restante es 0, restablecer la interfaz
-            if remaining == 0:
-                self.main_view.schedule_button.setEnabled(True)
-                self.main_view.cancel_button.setEnabled(False)
-                self.main_view.tab_widget.setEnabled(True)
-                self.main_view.shutdown_radio.setEnabled(True)
-                self.main_view.restart_radio.setEnabled(True)
-            self.main_view.tab_widget.setEnabled(True)
+        info = self.system_model.get_scheduled_info()
+        # Sin acciones pendientes el reloj se detiene por completo
+        self.clock_service.set_pending(info is not None, info and info['deadline'])
+        self.countdown.update(info)
+        self.main_view.update_tray_countdown(info)
 
     def toggle_theme(self, state):
         """Cambia entre tema claro y oscuro."""
         theme = 'dark' if state else 'light'
+        if theme == self.theme_engine.current_theme:
+            # El cambio viene de cargar la configuración en la vista
+            return
         self.config_model.set_theme(theme)
         self._load_theme()
         log_action(f"Cambiado tema a {theme}")
 
+    def show_window(self):
+        """Muestra y trae al frente la ventana principal."""
+        if self.main_view:
+            self.main_view.showNormal()
+            self.main_view.raise_()
+            self.main_view.activateWindow()
+
     def show_settings(self):
-        """Muestra la vista de configuración."""
-        self.settings_view = SettingsView(self.main_view, self.i18n, self.config_model)
-        self.settings_view.settings_changed.connect(self._update_config)
+        """Muestra la vista de configuración.
+        
+        El diálogo se crea en el primer uso y después solo se refresca.
+        """
+        if self.settings_view is None:
+            from views.settings_view import SettingsView
+            self.settings_view = SettingsView(self.main_view, self.i18n, self.config_model)
+            self.settings_view.settings_changed.connect(self._update_config)
+        else:
+            self.settings_view.refresh()
         self.settings_view.exec_()
         log_action("Vista de configuración mostrada")
 
@@ -365,9 +609,10 @@ class MainController:
             self.i18n.set_language(new_config['language'])
             self._reload_ui_texts()
         
-        # Guardar configuración
-        for key, value in new_config.items():
-            self.config_model.set_config(key, value)
+        # Guardar configuración (una sola escritura para todas las claves)
+        with self.config_model.batch():
+            for key, value in new_config.items():
+                self.config_model.set_config(key, value)
         
         # Recargar configuración
         self.config = self.config_model.get_config()
@@ -381,13 +626,8 @@ class MainController:
             # Actualizar el menú
             self._setup_menu()
             
-            # Actualizar el icono de la bandeja del sistema
-            if hasattr(self.main_view, 'tray_icon') and self.main_view.tray_icon:
-                self.main_view.tray_icon.setToolTip(self.i18n.get_text("app_title"))
-                
-                # Actualizar el menú contextual del icono de la bandeja
-                if hasattr(self.main_view, '_setup_tray_icon'):
-                    self.main_view._setup_tray_icon()
+            # Actualizar los textos de la bandeja del sistema (sin recrearla)
+            self.main_view.retranslate_tray()
             
             # Actualizar los textos de los widgets
             self.main_view.setWindowTitle(self.i18n.get_text("app_title"))
@@ -409,22 +649,34 @@ class MainController:
 
     def show_help(self):
         """Muestra la vista de ayuda."""
-        # Crear una nueva instancia cada vez para evitar problemas con el objeto C/C++
-        help_view = HelpView(self.main_view, self.i18n)
-        help_view.show()
-        # Guardar una referencia para evitar que se elimine prematuramente
-        self.help_view = help_view
+        if self.help_view is None:
+            from views.help_view import HelpView
+            self.help_view = HelpView(self.main_view, self.i18n)
+        else:
+            self.help_view.refresh()
+        self._present_dialog(self.help_view)
         log_action("Vista de ayuda mostrada")
 
     def show_about(self):
         """Muestra la vista de acerca de."""
-        # Crear una nueva instancia cada vez para evitar problemas con el objeto C/C++
-        about_view = AboutView(self.main_view, self.i18n)
-        about_view.show()
-        # Guardar una referencia para evitar que se elimine prematuramente
-        self.about_view = about_view
+        if self.about_view is None:
+            from views.help_view import AboutView
+            self.about_view = AboutView(self.main_view, self.i18n)
+        else:
+            self.about_view.refresh()
+        self._present_dialog(self.about_view)
         log_action("Vista de acerca de mostrada")
 
+    def _present_dialog(self, dialog):
+        """Muestra un diálogo no modal y lo trae al frente si ya estaba abierto.
+        
+        Args:
+            dialog (QDialog): Diálogo a mostrar
+        """
+        dialog.show()
+        dialog.raise_()
+        dialog.activateWindow()
+
     def get_config(self, key=None):
         """Obtiene la configuración o un valor específico.
 
@@ -444,6 +696,17 @@ class MainController:
         if self.system_model.get_scheduled_info():
             self.system_model.cancel_scheduled_action()
         
+        # Asegurar que el diario queda sincronizado en disco
+        if self.system_model.journal is not None:
+            self.system_model.journal.close()
+        
+        # Detener el reloj de la cuenta regresiva
+        self.clock_service.stop()
+        
+        # Liberar el socket de instancia única
+        if self.ipc_server is not None:
+            self.ipc_server.close()
+        
         # Cerrar la aplicación
         QApplication.instance().quit()
         log_action("Aplicación cerrada")
\ No newline at end of file
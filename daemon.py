@@ -0,0 +1,31 @@
+"""
+Punto de entrada sin interfaz gráfica para EnergyPy.
+
+Este script ejecuta el planificador en un bucle de eventos de la biblioteca
+estándar, sin importar PyQt5, para equipos sin pantalla.
+"""
+
+import argparse
+import os
+import sys
+
+# Asegurar que los módulos de la aplicación sean encontrados
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from controllers.daemon_controller import DaemonController, DEFAULT_RECONCILE_INTERVAL
+
+
+def main():
+    """Función principal que inicia el daemon."""
+    parser = argparse.ArgumentParser(description="EnergyPy sin interfaz gráfica")
+    parser.add_argument(
+        '--reconcile-interval', type=float, default=DEFAULT_RECONCILE_INTERVAL,
+        help="Segundos entre reconciliaciones con el estado del sistema"
+    )
+    args = parser.parse_args()
+
+    sys.exit(DaemonController(reconcile_interval=args.reconcile_interval).run())
+
+
+if __name__ == "__main__":
+    main()
@@ -10,19 +10,24 @@ import platform
 import logging
 import traceback
 
-from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon
-
 # Asegurar que los módulos de la aplicación sean encontrados
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from controllers.main_controller import MainController
-from utils.logger import setup_logger
-from utils.paths import get_resource_path
+# Activar el perfilado de arranque antes de cualquier otra importación
+from utils.startup_profiler import profiler
+profiler.enable_from_argv(sys.argv)
+
+with profiler.phase('importaciones'):
+    from models.config_model import ConfigModel
+    from utils.ipc import IpcServer, send_command
+    from utils.logger import setup_logger
+    from utils.resources import resource_exists, resource_location, window_icon_file
 
 def setup_high_dpi():
     """Configura el soporte de alta resolución DPI."""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+
     if hasattr(Qt, 'AA_EnableHighDpiScaling'):
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
@@ -43,11 +48,53 @@ def handle_exception(exc_type, exc_value, exc_traceback):
     logger.critical("Excepción no capturada:", exc_info=(exc_type, exc_value, exc_traceback))
     
     # Mostrar mensaje de error al usuario
+    from PyQt5.QtWidgets import QMessageBox
     error_msg = f"Se ha producido un error inesperado:\n{exc_value}"
     QMessageBox.critical(None, "Error crítico", error_msg)
 
+def forward_to_running_instance(argv):
+    """Garantiza una única instancia antes de cargar PyQt5.
+
+    Las órdenes de línea de comandos (schedule, cancel, status) se delegan
+    en la CLI, que las reenvía a la instancia en ejecución. Un lanzamiento
+    sin órdenes, con 'show' o solo con argumentos de Qt muestra la ventana
+    de la instancia existente o abre la interfaz.
+
+    Args:
+        argv (list): Argumentos de la línea de comandos
+
+    Returns:
+        tuple: (código de salida o None para continuar, IpcServer o None)
+    """
+    from controllers.cli_controller import CliController, is_cli_invocation
+
+    if is_cli_invocation(argv):
+        return CliController().run(argv), None
+
+    config_dir = ConfigModel().config_dir
+    ipc_server = IpcServer(config_dir)
+    if ipc_server.listen():
+        return None, ipc_server
+
+    response = send_command(config_dir, 'show')
+    if response is not None and not response['ok']:
+        print(response['error'], file=sys.stderr)
+        return 1, None
+    return 0, None
+
 def main():
     """Función principal que inicia la aplicación."""
+    # Reenviar la orden a la instancia en ejecución, sin construir QApplication
+    with profiler.phase('instancia única'):
+        exit_code, ipc_server = forward_to_running_instance(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+    
+    with profiler.phase('importaciones de la interfaz'):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QIcon
+        from controllers.main_controller import MainController
+    
     # Configurar el manejador de excepciones
     sys.excepthook = handle_exception
     
@@ -60,28 +107,22 @@ def main():
     setup_high_dpi()
     
     # Crear la aplicación Qt
-    app = QApplication(sys.argv)
+    with profiler.phase('QApplication'):
+        app = QApplication(sys.argv)
     app.setApplicationName("EnergyPy")
     app.setOrganizationName("EnergyPy")
     
     # Configurar el icono de la aplicación según la plataforma
-    icon_filename = ""
-    if platform.system() == "Windows":
-        icon_filename = "icon.ico"
-    elif platform.system() == "Darwin":  # macOS
-        icon_filename = "icon.icns"
-    else:  # Linux y otros
-        icon_filename = "icon.png"
-    
-    icon_path = get_resource_path(icon_filename)
-    if os.path.exists(icon_path):
+    icon_filename = window_icon_file()
+    if resource_exists(icon_filename):
+        icon_path = resource_location(icon_filename)
         app.setWindowIcon(QIcon(icon_path))
         logger.info(f"Icono cargado desde: {icon_path}")
     else:
-        logger.warning(f"No se pudo encontrar el icono en: {icon_path}")
+        logger.warning(f"No se pudo encontrar el icono: {icon_filename}")
     
     # Iniciar el controlador principal
-    controller = MainController()
+    controller = MainController(ipc_server)
     controller.start()
     
     # Ejecutar el bucle principal de la aplicación
@@ -3,23 +3,81 @@ Modelo para la gestión de configuración y preferencias del usuario.
 
 Este módulo maneja el almacenamiento y recuperación de las preferencias
 del usuario, como el tema, idioma y configuraciones recientes.
+
+Los cambios se agrupan: varias claves modificadas dentro de batch() o en
+poco tiempo se guardan con una sola escritura, hecha en segundo plano tras
+un breve retardo. Cada escritura es atómica (archivo temporal, fsync y
+renombrado), de modo que un corte de corriente deja la configuración
+anterior o la nueva, nunca un archivo a medias.
+
+Si otro proceso modifica config.json (por ejemplo, las herramientas de
+administración de los equipos), reload() lo vuelve a leer, lo compara con
+lo último guardado y avisa a los suscriptores solo de las claves cambiadas.
+
+La configuración efectiva se resuelve por capas, de menor a mayor prioridad:
+  1. los valores predeterminados de la aplicación;
+  2. los archivos *.json de /etc/energypy (en Windows, EnergyPy dentro de
+     %PROGRAMDATA%), en orden alfabético, con una sección "defaults" (valores
+     predeterminados del equipo) y otra "locked" (valores fijados por el
+     administrador que el usuario no puede cambiar);
+  3. config.json del usuario, que solo guarda lo que difiere de las capas
+     anteriores;
+  4. las variables de entorno ENERGYPY_<CLAVE> (por ejemplo,
+     ENERGYPY_THEME=dark), con el valor en JSON o como texto;
+  5. los valores bloqueados, que prevalecen sobre todo lo demás.
+La combinación se calcula al cargar y solo se repite cuando cambia una capa,
+así que get_config() es una consulta directa a un diccionario.
 """
 
+import copy
 import os
 import json
 import logging
-from pathlib import Path
+import threading
+from contextlib import contextmanager
+
+from utils.paths import get_user_config_dir
+
+# Retardo máximo (segundos) antes de guardar los cambios pendientes
+DEFAULT_FLUSH_DELAY = 0.5
+# Prefijo de las variables de entorno que sustituyen valores de configuración
+ENV_PREFIX = 'ENERGYPY_'
+
+# Marca de clave ausente (None es un valor válido)
+_MISSING = object()
 
 
 class ConfigModel:
     """Modelo para gestionar la configuración y preferencias del usuario."""
 
-    def __init__(self):
-        """Inicializa el modelo de configuración."""
+    def __init__(self, flush_delay=DEFAULT_FLUSH_DELAY, system_dir=None):
+        """Inicializa el modelo de configuración.
+
+        Args:
+            flush_delay (float): Segundos máximos de agrupación de los cambios
+                antes de guardarlos; 0 guarda cada cambio en el acto
+            system_dir (str, optional): Directorio de la configuración del
+                equipo; por defecto el del sistema operativo
+        """
         self.logger = logging.getLogger(__name__)
         self.config_dir = self._get_config_dir()
         self.config_file = os.path.join(self.config_dir, 'config.json')
-        self.default_config = {
+        self.system_dir = system_dir or self._get_system_config_dir()
+        self.flush_delay = flush_delay
+        self._lock = threading.RLock()
+        # Serializa las escrituras del hilo de la interfaz y del temporizador
+        self._write_lock = threading.Lock()
+        self._batch_depth = 0
+        self._dirty = False
+        self._flush_timer = None
+        # Escrituras del archivo realizadas
+        self.writes = 0
+        # Combinaciones de las capas realizadas
+        self.merges = 0
+        # Contenido del archivo tras la última lectura o escritura
+        self._saved = {}
+        self._listeners = []
+        self.builtin_config = {
             'theme': 'light',  # 'light' o 'dark'
             'language': 'es',  # 'es' o 'en'
             'last_used_tab': 0,  # 0: tiempo, 1: hora exacta
@@ -29,54 +87,327 @@ class ConfigModel:
             'show_notifications': True,
             'minimize_to_tray': True,
             'start_minimized': False,
+            'foreign_schedule_policy': 'adopt',  # 'adopt' o 'cancel'
             'keyboard_shortcuts': {
                 'cancel': 'Ctrl+C',
                 'switch_tab': 'Ctrl+Tab',
                 'toggle_theme': 'Ctrl+T'
             }
         }
-        self.config = self._load_config()
+        # Capas de configuración
+        self._system_state = _MISSING  # aún sin leer
+        self._locked = {}
+        self._load_system_layer()
+        self._env = self._load_env_layer()
+        self._user = self._load_user_layer()
+        # Vista combinada; se actualiza en el sitio para que quien guarde
+        # una referencia a ella vea siempre los valores vigentes
+        self.config = {}
+        self._merge()
 
     def _get_config_dir(self):
-        """Obtiene el directorio de configuración según el sistema operativo."""
-        home = Path.home()
-        
+        """Obtiene (y crea si no existe) el directorio de configuración."""
+        return get_user_config_dir()
+
+    def _get_system_config_dir(self):
+        """Obtiene el directorio de la configuración del equipo."""
         if os.name == 'nt':  # Windows
-            config_dir = os.path.join(home, 'AppData', 'Local', 'EnergyPy')
-        else:  # Linux/macOS
-            config_dir = os.path.join(home, '.config', 'energypy')
-            
-        # Crear el directorio si no existe
-        os.makedirs(config_dir, exist_ok=True)
-        return config_dir
-
-    def _load_config(self):
-        """Carga la configuración desde el archivo o crea uno nuevo."""
+            return os.path.join(os.environ.get('PROGRAMDATA', r'C:\ProgramData'), 'EnergyPy')
+        return os.path.join(os.sep, 'etc', 'energypy')  # Linux/macOS
+
+    def _system_files(self):
+        """Archivos *.json del directorio del equipo y su estado.
+
+        Returns:
+            tuple: ((nombre, mtime_ns, tamaño), ...) en orden alfabético, o
+                None si el directorio no existe
+        """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                # Asegurar que todas las claves existan
-                for key, value in self.default_config.items():
-                    if key not in config:
-                        config[key] = value
-                return config
-            else:
-                self._save_config(self.default_config)
-                return self.default_config.copy()
+            names = sorted(name for name in os.listdir(self.system_dir) if name.endswith('.json'))
+        except OSError:
+            return None
+        state = []
+        for name in names:
+            try:
+                st = os.stat(os.path.join(self.system_dir, name))
+            except OSError:
+                continue
+            state.append((name, st.st_mtime_ns, st.st_size))
+        return tuple(state)
+
+    def _load_system_layer(self):
+        """Lee los valores predeterminados y bloqueados del equipo.
+
+        Returns:
+            bool: True si los archivos del equipo han cambiado desde la
+                última lectura
+        """
+        state = self._system_files()
+        if state == self._system_state:
+            return False
+        self._system_state = state
+
+        defaults, locked = {}, {}
+        for name, _, _ in state or ():
+            path = os.path.join(self.system_dir, name)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as e:
+                self.logger.warning(f"Se ignora la configuración del equipo {path}: {str(e)}")
+                continue
+            if not isinstance(data, dict):
+                self.logger.warning(f"Se ignora la configuración del equipo {path}: no contiene un objeto")
+                continue
+            for section, values in (('defaults', defaults), ('locked', locked)):
+                section_values = data.get(section, {})
+                if isinstance(section_values, dict):
+                    values.update(section_values)
+                else:
+                    self.logger.warning(f"Se ignora la sección '{section}' de {path}: no es un objeto")
+
+        self._locked = locked
+        # Lo que se restablece con "valores predeterminados"
+        self.default_config = {**self.builtin_config, **defaults, **locked}
+        if locked:
+            self.logger.info(f"Claves bloqueadas por el administrador: {', '.join(sorted(locked))}")
+        return True
+
+    def _load_env_layer(self):
+        """Lee los valores de las variables de entorno ENERGYPY_<CLAVE>.
+
+        Returns:
+            dict: {clave: valor} de las variables definidas y válidas
+        """
+        env = {}
+        for key, default in self.builtin_config.items():
+            raw = os.environ.get(ENV_PREFIX + key.upper())
+            if raw is None:
+                continue
+            try:
+                value = json.loads(raw)
+            except ValueError:
+                value = raw
+            if not isinstance(value, type(default)):
+                self.logger.warning(f"Se ignora {ENV_PREFIX}{key.upper()}: se esperaba "
+                                    f"un valor de tipo {type(default).__name__}")
+                continue
+            env[key] = value
+        return env
+
+    def _load_user_layer(self):
+        """Carga config.json del usuario.
+
+        Returns:
+            dict: Valores del usuario que difieren de las capas inferiores
+        """
+        try:
+            config = self._read_file()
+        except FileNotFoundError:
+            return {}
         except Exception as e:
             self.logger.error(f"Error al cargar la configuración: {str(e)}")
-            return self.default_config.copy()
+            return {}
+        self._saved = copy.deepcopy(config)
+        # Las versiones anteriores guardaban todas las claves; las que
+        # coinciden con el valor predeterminado no son una elección del usuario
+        return {key: value for key, value in config.items()
+                if value != self.default_config.get(key, _MISSING)}
+
+    def _read_file(self):
+        """Lee config.json.
+
+        Returns:
+            dict: Configuración del archivo
 
-    def _save_config(self, config):
-        """Guarda la configuración en el archivo."""
+        Raises:
+            OSError: Si no se puede leer el archivo
+            ValueError: Si el contenido no es una configuración válida
+        """
+        with open(self.config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        if not isinstance(config, dict):
+            raise ValueError("config.json no contiene un objeto")
+        return config
+
+    def _merge(self):
+        """Combina las capas y actualiza la vista combinada en el sitio.
+
+        Returns:
+            dict: {clave: nuevo valor} de las claves cuyo valor ha cambiado
+        """
+        with self._lock:
+            merged = copy.deepcopy({**self.default_config, **self._user,
+                                    **self._env, **self._locked})
+            changes = {key: value for key, value in merged.items()
+                       if self.config.get(key, _MISSING) != value}
+            for key in set(self.config) - set(merged):
+                del self.config[key]
+            self.config.update(changes)
+            self.merges += 1
+        return changes
+
+    def is_locked(self, key):
+        """Indica si el administrador ha bloqueado una clave.
+
+        Args:
+            key (str): Clave de configuración
+
+        Returns:
+            bool: True si el usuario no puede cambiar su valor
+        """
+        return key in self._locked
+
+    def add_change_listener(self, callback):
+        """Registra un callback(changes) para los cambios externos del archivo.
+
+        Args:
+            callback (callable): Recibe un diccionario {clave: nuevo valor}
+                con solo las claves que han cambiado
+        """
+        self._listeners.append(callback)
+
+    def reload(self):
+        """Vuelve a leer config.json y aplica solo lo que ha cambiado en él.
+
+        Las claves modificadas en el archivo desde la última lectura o
+        escritura sustituyen a las de memoria; los cambios locales aún no
+        guardados de otras claves se conservan. Las escrituras propias no
+        producen cambios. También se releen los archivos del equipo si han
+        cambiado.
+
+        Returns:
+            dict: {clave: nuevo valor} de las claves efectivas cambiadas
+        """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4)
-            return True
-        except Exception as e:
-            self.logger.error(f"Error al guardar la configuración: {str(e)}")
+            on_disk = self._read_file()
+        except FileNotFoundError:
+            on_disk = {}
+        except (OSError, ValueError) as e:
+            # Por ejemplo, un archivo a medio escribir; el siguiente aviso lo relee
+            self.logger.warning(f"No se pudo recargar la configuración: {str(e)}")
+            return {}
+
+        with self._lock:
+            changed = self._load_system_layer()
+            for key in set(on_disk) | set(self._saved):
+                value = on_disk.get(key, _MISSING)
+                if value == self._saved.get(key, _MISSING):
+                    continue
+                changed = True
+                if value is _MISSING or value == self.default_config.get(key, _MISSING):
+                    self._user.pop(key, None)
+                else:
+                    self._user[key] = value
+            self._saved = copy.deepcopy(on_disk)
+            changes = self._merge() if changed else {}
+
+        if changes:
+            self.logger.info(f"Configuración recargada; claves cambiadas: {', '.join(sorted(changes))}")
+            for callback in self._listeners:
+                try:
+                    callback(dict(changes))
+                except Exception as e:
+                    self.logger.error(f"Error al aplicar los cambios de configuración: {str(e)}")
+        return changes
+
+    def _write(self, text):
+        """Sustituye el archivo de configuración por un texto ya serializado.
+
+        Se escribe en un temporal sincronizado en disco que después se
+        renombra sobre config.json, así que el archivo nunca queda a medias.
+        """
+        tmp_path = f"{self.config_file}.tmp"
+        with self._write_lock:
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.config_file)
+                with self._lock:
+                    self._saved = json.loads(text)
+                if os.name != 'nt':
+                    # Persistir también la entrada del directorio renombrada
+                    dir_fd = os.open(self.config_dir, os.O_RDONLY)
+                    try:
+                        os.fsync(dir_fd)
+                    finally:
+                        os.close(dir_fd)
+                self.writes += 1
+                return True
+            except OSError as e:
+                self.logger.error(f"Error al guardar la configuración: {str(e)}")
+                return False
+
+    @contextmanager
+    def batch(self):
+        """Agrupa varios cambios de configuración en una sola escritura.
+
+        Los cambios hechos dentro del bloque se guardan juntos al salir del
+        bloque más externo. Se puede anidar.
+
+        Ejemplo:
+            with config_model.batch():
+                config_model.set_config('last_used_action', 'restart')
+                config_model.set_config('last_used_tab', 1)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self._commit()
+
+    def flush(self):
+        """Guarda en el acto los cambios pendientes.
+
+        Returns:
+            bool: True si no había cambios o se guardaron correctamente
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return True
+            self._dirty = False
+            # Solo la capa del usuario; el resto se resuelve al cargar
+            text = json.dumps(self._user, indent=4)
+        if not self._write(text):
+            with self._lock:
+                self._dirty = True
             return False
+        return True
+
+    def close(self):
+        """Guarda los cambios pendientes (llamar antes de salir)."""
+        self.flush()
+
+    def _commit(self):
+        """Guarda o programa el guardado de los cambios fuera de un lote."""
+        with self._lock:
+            if not self._dirty or self._batch_depth:
+                return True
+            if self.flush_delay > 0:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(self.flush_delay, self._flush_pending)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return True
+        return self.flush()
+
+    def _flush_pending(self):
+        """Guardado diferido; si hay un lote abierto, lo hará el lote al cerrarse."""
+        with self._lock:
+            self._flush_timer = None
+            if self._batch_depth:
+                return
+        self.flush()
 
     def get_config(self, key=None):
         """Obtiene toda la configuración o un valor específico.
@@ -94,15 +425,36 @@ class ConfigModel:
     def set_config(self, key, value):
         """Establece un valor de configuración y lo guarda.
 
+        El valor se guarda en la capa del usuario; si coincide con el
+        predeterminado, se elimina de ella para seguir los cambios del
+        administrador. Una variable de entorno de la clave sigue
+        prevaleciendo mientras esté definida.
+
         Args:
             key (str): Clave a modificar
             value (any): Nuevo valor
 
         Returns:
-            bool: True si se guardó correctamente, False en caso contrario
+            bool: True si se guardó (o quedó pendiente de guardar), False si
+                la clave está bloqueada o falló la escritura
         """
-        self.config[key] = value
-        return self._save_config(self.config)
+        with self._lock:
+            if key in self._locked:
+                if value == self._locked[key]:
+                    return True
+                self.logger.warning(f"No se puede cambiar '{key}': bloqueada por el administrador")
+                return False
+            if value == self.default_config.get(key, _MISSING):
+                if self._user.pop(key, _MISSING) is _MISSING:
+                    return True
+            elif self._user.get(key, _MISSING) == value:
+                return True
+            else:
+                self._user[key] = value
+            if key not in self._env:
+                self.config[key] = value
+            self._dirty = True
+        return self._commit()
 
     def reset_config(self):
         """Restablece la configuración a los valores predeterminados.
@@ -110,8 +462,11 @@ class ConfigModel:
         Returns:
             bool: True si se restableció correctamente, False en caso contrario
         """
-        self.config = self.default_config.copy()
-        return self._save_config(self.config)
+        with self._lock:
+            self._user = {}
+            self._merge()
+            self._dirty = True
+        return self._commit()
 
     def get_theme(self):
         """Obtiene el tema actual.
@@ -0,0 +1,138 @@
+"""
+Temporizador de precisión para disparar acciones en su fecha límite exacta.
+
+Este módulo implementa un trabajador que duerme hasta la fecha límite y
+ejecuta un callback. En Linux con Python 3.13+ usa timerfd (sobre
+CLOCK_BOOTTIME cuando existe, de modo que la suspensión cuenta); en el resto
+de plataformas duerme por tramos hasta la fecha límite y afina los últimos
+milisegundos.
+"""
+
+import logging
+import os
+import select
+import threading
+import time
+
+# Tramo máximo de espera para volver a consultar el reloj (cubre suspensiones)
+MAX_WAIT_SLICE = 30.0
+# Margen final que se resuelve con esperas cortas en lugar de una sola espera
+SPIN_MARGIN = 0.002
+
+
+def timerfd_available():
+    """Indica si la plataforma ofrece timerfd en el módulo os."""
+    return hasattr(os, 'timerfd_create')
+
+
+class PrecisionTimer:
+    """Temporizador de un solo disparo con precisión de milisegundos.
+
+    Admite la misma interfaz que threading.Timer (cancel()), por lo que puede
+    usarse como timer_factory del planificador.
+    """
+
+    def __init__(self, delay, callback, clock=time.monotonic, use_timerfd=True,
+                 on_slice=None):
+        """Arma el temporizador.
+
+        Args:
+            delay (float): Segundos hasta el disparo
+            callback (callable): Función a ejecutar en la fecha límite
+            clock (callable): Reloj sobre el que se mide la fecha límite
+            use_timerfd (bool): Permite desactivar timerfd aunque esté disponible
+            on_slice (callable, optional): Se invoca desde el hilo del
+                temporizador cada MAX_WAIT_SLICE segundos de espera
+        """
+        self.logger = logging.getLogger(__name__)
+        self.callback = callback
+        self.clock = clock
+        self.on_slice = on_slice
+        self.deadline = clock() + max(0.0, delay)
+        self.fired_at = None
+        self._cancelled = threading.Event()
+        self._wake_fds = None
+        # cancel() escribe en la tubería desde otro hilo: cerrarla sin este
+        # cerrojo dejaría escribir en un descriptor ya reutilizado
+        self._wake_lock = threading.Lock()
+
+        if use_timerfd and timerfd_available():
+            target = self._wait_timerfd
+            self._wake_fds = os.pipe()
+        else:
+            target = self._wait_sleep
+        self._thread = threading.Thread(target=self._run, args=(target, delay), daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Cancela el temporizador si aún no se ha disparado."""
+        self._cancelled.set()
+        with self._wake_lock:
+            if self._wake_fds is not None:
+                try:
+                    os.write(self._wake_fds[1], b'x')
+                except OSError:
+                    pass
+
+    def _run(self, wait, delay):
+        """Espera hasta la fecha límite y ejecuta el callback."""
+        try:
+            if not wait(delay) or self._cancelled.is_set():
+                return
+            self.fired_at = self.clock()
+            self.callback()
+        except Exception as e:
+            self.logger.error(f"Error en el temporizador de precisión: {str(e)}")
+        finally:
+            with self._wake_lock:
+                wake_fds, self._wake_fds = self._wake_fds, None
+            if wake_fds is not None:
+                for fd in wake_fds:
+                    os.close(fd)
+
+    def _wait_sleep(self, delay):
+        """Duerme por tramos hasta la fecha límite.
+
+        Returns:
+            bool: True si se alcanzó la fecha límite, False si se canceló
+        """
+        while True:
+            remaining = self.deadline - self.clock()
+            if remaining <= 0:
+                return True
+            if remaining > SPIN_MARGIN:
+                wait = min(remaining - SPIN_MARGIN, MAX_WAIT_SLICE)
+            else:
+                wait = remaining / 2
+            if self._cancelled.wait(wait):
+                return False
+            if wait == MAX_WAIT_SLICE:
+                self._slice_elapsed()
+
+    def _wait_timerfd(self, delay):
+        """Espera con un timerfd relativo.
+
+        Returns:
+            bool: True si se alcanzó la fecha límite, False si se canceló
+        """
+        clock_id = getattr(time, 'CLOCK_BOOTTIME', time.CLOCK_MONOTONIC)
+        fd = os.timerfd_create(clock_id)
+        try:
+            # Un retardo de 0 desarmaría el timerfd: usar el mínimo representable
+            os.timerfd_settime(fd, initial=max(delay, 1e-9))
+            while True:
+                readable, _, _ = select.select([fd, self._wake_fds[0]], [], [], MAX_WAIT_SLICE)
+                if readable:
+                    return fd in readable and not self._cancelled.is_set()
+                self._slice_elapsed()
+        finally:
+            os.close(fd)
+
+    def _slice_elapsed(self):
+        """Avisa de un tramo de espera completo sin alcanzar la fecha límite."""
+        if self.on_slice is None:
+            return
+        try:
+            self.on_slice()
+        except Exception as e:
+            self.logger.error(f"Error en el aviso periódico del temporizador: {str(e)}")
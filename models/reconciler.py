@@ -0,0 +1,169 @@
+"""
+Reconciliación entre el estado de la aplicación y el apagado pendiente del sistema.
+
+Este módulo lee de forma barata (sin crear procesos) el apagado que el
+sistema operativo tiene realmente pendiente y lo compara con las tareas de
+SystemModel. Así la interfaz refleja acciones programadas antes de un cierre
+inesperado de la aplicación o desde la línea de comandos por un administrador.
+"""
+
+import logging
+import os
+import time
+
+# Archivo donde systemd guarda el apagado programado (shutdown +N, logind)
+SYSTEMD_SCHEDULED_FILE = '/run/systemd/shutdown/scheduled'
+
+# Solo existe si systemd es el gestor del sistema; logind no crea el
+# directorio de SYSTEMD_SCHEDULED_FILE hasta la primera programación
+SYSTEMD_RUNTIME_DIR = '/run/systemd/system'
+
+# Diferencia tolerada entre ambas fechas límite: el respaldo con el comando
+# `shutdown` se redondea al minuto
+SYNC_TOLERANCE = 61
+
+# Modos de systemd que corresponden a un reinicio
+RESTART_MODES = ('reboot', 'kexec')
+
+
+def read_systemd_schedule(path=SYSTEMD_SCHEDULED_FILE):
+    """Lee el apagado programado en systemd.
+
+    Args:
+        path (str): Ruta del archivo de systemd
+
+    Returns:
+        dict: 'action_type', 'deadline' (epoch) y 'created' (epoch), o None
+            si no hay apagado pendiente
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            created = os.fstat(f.fileno()).st_mtime
+            values = dict(
+                line.strip().split('=', 1) for line in f if '=' in line
+            )
+    except FileNotFoundError:
+        return None
+
+    usec = int(values.get('USEC', 0))
+    if usec <= 0:
+        return None
+    mode = values.get('MODE', 'poweroff')
+    return {
+        'action_type': 'restart' if mode in RESTART_MODES else 'shutdown',
+        'deadline': usec / 1_000_000,
+        'created': created
+    }
+
+
+class ScheduleReconciler:
+    """Sincroniza SystemModel con el apagado pendiente del sistema operativo."""
+
+    def __init__(self, system_model, policy='adopt', path=SYSTEMD_SCHEDULED_FILE):
+        """Inicializa el reconciliador.
+
+        Args:
+            system_model (SystemModel): Modelo del sistema
+            policy (str): 'adopt' para asumir el apagado externo o 'cancel'
+                para cancelarlo
+            path (str): Archivo de estado de systemd
+        """
+        self.logger = logging.getLogger(__name__)
+        self.system_model = system_model
+        self.policy = policy
+        self.path = path
+        self._last_signature = False  # Aún no se ha comprobado nunca
+
+    def is_supported(self):
+        """Indica si el sistema expone su estado pendiente de forma barata."""
+        if self.system_model.get_os_type() != 'linux':
+            return False
+        return os.path.isdir(SYSTEMD_RUNTIME_DIR) or os.path.isdir(os.path.dirname(self.path))
+
+    def watch_paths(self):
+        """Rutas que conviene vigilar para reconciliar por eventos.
+
+        Mientras logind no haya creado el directorio del archivo de estado se
+        vigila el antepasado más cercano que exista, para detectar su creación.
+
+        Returns:
+            list: Directorio a vigilar
+        """
+        directory = os.path.dirname(self.path)
+        while directory and not os.path.isdir(directory):
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        return [directory]
+
+    def _signature(self):
+        """Firma barata (un stat) del archivo de estado."""
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            return None
+
+    def reconcile(self, force=False):
+        """Compara el estado del sistema con el de la aplicación y los alinea.
+
+        Args:
+            force (bool): Releer el archivo aunque no haya cambiado
+
+        Returns:
+            str: 'unsupported', 'busy', 'unchanged', 'in_sync', 'adopted',
+                'cancelled', 'failed' o 'dropped'
+        """
+        if not self.is_supported():
+            return 'unsupported'
+
+        # Un comando propio aún en curso dejaría el archivo a medio actualizar
+        pending_command = self.system_model.scheduled_action
+        if pending_command is not None and not pending_command.done():
+            return 'busy'
+
+        signature = self._signature()
+        if not force and signature == self._last_signature:
+            return 'unchanged'
+        self._last_signature = signature
+
+        os_state = read_systemd_schedule(self.path) if signature else None
+        if os_state is not None and os_state['deadline'] <= time.time():
+            # Archivo obsoleto: nunca debe provocar un disparo inmediato
+            os_state = None
+        info = self.system_model.get_scheduled_info()
+
+        if os_state is None:
+            if info is None:
+                return 'in_sync'
+            # Se canceló fuera de la aplicación (por ejemplo `shutdown -c`)
+            self.system_model.drop_system_jobs()
+            self.logger.info("Acción cancelada externamente; estado local descartado")
+            return 'dropped'
+
+        remaining = os_state['deadline'] - time.time()
+        if info is not None and info['action_type'] == os_state['action_type'] \
+                and abs(info['remaining_seconds'] - remaining) <= SYNC_TOLERANCE:
+            return 'in_sync'
+
+        if self.policy == 'cancel':
+            # Cancelar solo la acción externa y volver a programar la local
+            if not self.system_model.cancel_foreign_action():
+                self._last_signature = None  # Reintentar en la próxima reconciliación
+                self.logger.error("No se pudo cancelar el apagado externo")
+                return 'failed'
+            self.logger.info("Apagado externo cancelado según la política configurada")
+            return 'cancelled'
+
+        # La duración original se deriva de la fecha de creación del archivo
+        duration = max(remaining, os_state['deadline'] - os_state['created'])
+        self.system_model.drop_system_jobs()
+        self.system_model.adopt_scheduled_action(
+            os_state['action_type'], remaining, duration
+        )
+        self.logger.info(
+            f"Adoptado {os_state['action_type']} pendiente del sistema "
+            f"({int(remaining)} s restantes)"
+        )
+        return 'adopted'
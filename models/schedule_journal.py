@@ -0,0 +1,310 @@
+"""
+Diario (journal) de solo anexado para las acciones programadas.
+
+Este módulo registra los eventos de programación y cancelación en un archivo
+de texto de solo anexado, agrupando los fsync en lotes, y lo compacta
+periódicamente en una instantánea. Al iniciar, el estado se reconstruye
+leyendo la instantánea y reproduciendo solo la cola de eventos posterior.
+
+Formato del diario (una línea por evento, campos separados por tabuladores):
+    S <clave> <acción> <fecha límite epoch> <duración>   programación
+    C <clave>                                            cancelación/disparo
+    X                                                    cancelación total
+"""
+
+import gc
+import os
+import threading
+
+# Eventos tras los que se compacta el diario en una instantánea
+DEFAULT_COMPACT_EVERY = 1000
+# Retardo máximo (segundos) antes de hacer fsync de los eventos pendientes
+DEFAULT_FSYNC_DELAY = 0.5
+
+
+def replay(lines, jobs=None, skipped=None):
+    """Reproduce eventos del diario sobre un estado.
+
+    Solo se separa la clave de cada evento; el resto de campos se conserva
+    como texto y únicamente se interpreta para las tareas supervivientes
+    (parse_fields descarta entonces los campos dañados), lo que mantiene la
+    reproducción barata. Los eventos sin estructura reconocible (por
+    ejemplo, una línea a medio escribir) se ignoran.
+
+    Args:
+        lines (iterable): Líneas del diario
+        jobs (dict, optional): Estado inicial {clave: 'acción\tfecha\tduración'}
+        skipped (list, optional): Recibe los índices de las líneas ignoradas
+
+    Returns:
+        dict: Estado resultante
+    """
+    jobs = {} if jobs is None else jobs
+    skipped = [] if skipped is None else skipped
+    pop = jobs.pop
+    # partition() es bastante más barato que split() con índices: este bucle
+    # es casi todo el coste de arrancar con un diario largo
+    for index, line in enumerate(lines):
+        kind, _, rest = line.partition('\t')
+        if kind == 'C':
+            pop(rest, None)
+        elif kind == 'S':
+            key, separator, fields = rest.partition('\t')
+            if separator:
+                jobs[key] = fields
+            else:
+                skipped.append(index)
+        elif kind == 'X' and line == 'X':
+            jobs.clear()
+        elif line:
+            skipped.append(index)
+    return jobs
+
+
+def parse_fields(fields):
+    """Interpreta los campos guardados de una tarea.
+
+    Args:
+        fields (str): 'acción\tfecha límite\tduración'
+
+    Returns:
+        tuple: (acción, fecha límite epoch, duración) o None si está dañada
+    """
+    try:
+        action_type, deadline, duration = fields.split('\t')
+        return action_type, float(deadline), int(float(duration))
+    except (ValueError, AttributeError, OverflowError):
+        return None
+
+
+def _fsync_dir(path):
+    """Persiste las entradas renombradas de un directorio (solo POSIX)."""
+    if os.name == 'nt':
+        return
+    dir_fd = os.open(os.path.dirname(path) or '.', os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+class ScheduleJournal:
+    """Diario persistente de acciones programadas con instantáneas."""
+
+    def __init__(self, base_path, compact_every=DEFAULT_COMPACT_EVERY,
+                 fsync_delay=DEFAULT_FSYNC_DELAY):
+        """Inicializa el diario.
+
+        Args:
+            base_path (str): Ruta base; se usan '<base>.journal' y '<base>.snapshot'
+            compact_every (int): Eventos entre compactaciones
+            fsync_delay (float): Segundos máximos de agrupación de fsync
+        """
+        self.journal_path = f"{base_path}.journal"
+        self.snapshot_path = f"{base_path}.snapshot"
+        self.compact_every = compact_every
+        self.fsync_delay = fsync_delay
+        self._lock = threading.Lock()
+        self._file = None
+        self._events_since_snapshot = 0
+        self._fsync_timer = None
+        self._state = {}
+        os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+
+    @property
+    def logger(self):
+        """Logger del diario; logging solo se importa si hay algo que registrar."""
+        import logging
+        return logging.getLogger(__name__)
+
+    def load(self):
+        """Reconstruye el estado desde la instantánea y la cola del diario.
+
+        Returns:
+            dict: {clave: (acción, fecha límite epoch, duración)}
+        """
+        with self._lock:
+            jobs = {}
+            try:
+                with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                    # Solo hay instantánea tras la primera compactación:
+                    # `cli.py status` no carga json en el caso habitual
+                    import json
+
+                    jobs = json.load(f)['jobs']
+                if not isinstance(jobs, dict):
+                    raise ValueError("'jobs' no es un objeto")
+            except FileNotFoundError:
+                pass
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.error(f"Instantánea del diario dañada, se ignora: {str(e)}")
+                jobs = {}
+
+            # Sin el recolector cíclico: las líneas y tuplas de la reproducción
+            # no forman ciclos y sus pasadas hacían variar el tiempo de carga
+            # de un diario largo entre una y dos veces
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                events = self._read_journal_locked(jobs)
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            self._state = jobs
+            self._events_since_snapshot = events
+            if self._events_since_snapshot >= self.compact_every:
+                self._compact_locked()
+
+            state = {}
+            for key, fields in self._state.items():
+                parsed = parse_fields(fields)
+                if parsed is not None:
+                    state[key] = parsed
+            return state
+
+    def _read_journal_locked(self, jobs):
+        """Reproduce el diario sobre jobs y lo recorta tras el último evento válido.
+
+        Una línea final sin salto de línea es una escritura interrumpida; se
+        descarta junto con los eventos dañados del final, de modo que los
+        siguientes eventos se anexan tras el último válido.
+
+        Returns:
+            int: Número de eventos válidos del diario
+        """
+        try:
+            with open(self.journal_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            self.logger.error(f"No se pudo leer el diario: {str(e)}")
+            return 0
+
+        # Todo lo anterior a la última cancelación total no afecta al estado:
+        # solo se cuentan sus eventos, sin decodificarlos ni separarlos
+        head = 0
+        if data.startswith(b'X\n'):
+            head = 2
+        last_clear = data.rfind(b'\nX\n')
+        if last_clear >= 0:
+            head = last_clear + 3
+        if head:
+            jobs.clear()
+        head_events = data.count(b'\n', 0, head)
+
+        lines = data[head:].decode('utf-8', errors='replace').split('\n')
+        # Sin salto de línea final, el último trozo es un evento a medias
+        torn = lines.pop()
+        skipped = []
+        replay(lines, jobs, skipped)
+
+        # Eventos dañados al final del diario, tras el último válido
+        trailing = 0
+        while skipped and skipped[-1] == len(lines) - 1 - trailing:
+            skipped.pop()
+            trailing += 1
+        if trailing or torn:
+            self.logger.warning(f"Diario dañado: se ignoran {trailing + bool(torn)} eventos "
+                                f"finales y se recorta tras el último válido")
+            # Salto de línea del último evento completo y, de ahí, hacia atrás
+            end = data.rfind(b'\n')
+            for _ in range(trailing):
+                end = data.rfind(b'\n', 0, end)
+            good_end = end + 1
+            try:
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(good_end)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except OSError as e:
+                self.logger.error(f"No se pudo recortar el diario: {str(e)}")
+        if skipped:
+            self.logger.warning(f"Diario dañado: se ignoran {len(skipped)} eventos intermedios")
+        return head_events + len(lines) - len(skipped) - trailing
+
+    def record_schedule(self, key, action_type, deadline, duration):
+        """Registra una acción programada.
+
+        Args:
+            key (str): Clave estable de la tarea
+            action_type (str): 'shutdown' o 'restart'
+            deadline (float): Fecha límite en epoch (time.time())
+            duration (int): Duración total solicitada
+        """
+        self._append(f"S\t{key}\t{action_type}\t{deadline:.3f}\t{duration}")
+
+    def record_cancel(self, key):
+        """Registra la cancelación o el disparo de una tarea."""
+        self._append(f"C\t{key}")
+
+    def record_clear(self):
+        """Registra la cancelación de todas las tareas."""
+        self._append("X")
+
+    def flush(self):
+        """Escribe y sincroniza en disco los eventos pendientes."""
+        with self._lock:
+            self._flush_locked()
+
+    def compact(self):
+        """Sustituye el diario por una instantánea atómica del estado actual."""
+        with self._lock:
+            self._compact_locked()
+
+    def close(self):
+        """Sincroniza y cierra el diario."""
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _append(self, line):
+        """Añade un evento al diario y programa el fsync agrupado."""
+        with self._lock:
+            replay((line,), self._state)
+            if self._file is None:
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+            self._file.write(line + '\n')
+            self._events_since_snapshot += 1
+
+            if self._events_since_snapshot >= self.compact_every:
+                self._compact_locked()
+            elif self._fsync_timer is None:
+                self._fsync_timer = threading.Timer(self.fsync_delay, self.flush)
+                self._fsync_timer.daemon = True
+                self._fsync_timer.start()
+
+    def _flush_locked(self):
+        if self._fsync_timer is not None:
+            self._fsync_timer.cancel()
+            self._fsync_timer = None
+        if self._file is not None:
+            try:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError as e:
+                self.logger.error(f"Error al sincronizar el diario: {str(e)}")
+
+    def _compact_locked(self):
+        import json
+
+        try:
+            tmp_path = f"{self.snapshot_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'jobs': self._state}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+            _fsync_dir(self.snapshot_path)
+
+            # Solo tras persistir la instantánea se vacía el diario; si se
+            # interrumpe antes, reproducir la cola sobre ella es idempotente
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, 'w', encoding='utf-8')
+            self._events_since_snapshot = 0
+            self._flush_locked()
+        except OSError as e:
+            self.logger.error(f"Error al compactar el diario: {str(e)}")
@@ -0,0 +1,357 @@
+"""
+Motor de planificación de tareas de EnergyPy.
+
+Este módulo mantiene un montículo (heap) de tareas ordenadas por su fecha
+límite en un reloj monotónico. Cientos de acciones pendientes (apagados,
+reinicios, avisos, hooks) pueden convivir y solo se arma un temporizador
+para la tarea más próxima.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+def _start_thread_timer(delay, callback):
+    """Arma un temporizador de hilo que ejecuta el callback tras el retardo.
+
+    Args:
+        delay (float): Segundos hasta la ejecución
+        callback (callable): Función a ejecutar
+
+    Returns:
+        threading.Timer: Temporizador armado (admite cancel())
+    """
+    timer = threading.Timer(delay, callback)
+    timer.daemon = True
+    timer.start()
+    return timer
+
+
+class ScheduledJob:
+    """Registro de una tarea programada dentro del planificador."""
+
+    __slots__ = (
+        'job_id', 'deadline', 'action_type', 'callback', 'payload',
+        'duration', 'wall_time', '_seq', '_index'
+    )
+
+    def __init__(self, job_id, deadline, action_type, duration,
+                 callback=None, payload=None):
+        """Inicializa el registro de la tarea.
+
+        Args:
+            job_id (int): Identificador único de la tarea
+            deadline (float): Fecha límite en el reloj del planificador
+            action_type (str): Tipo de acción ('shutdown', 'restart', 'warning'...)
+            duration (int): Segundos totales solicitados al programarla
+            callback (callable, optional): Función a ejecutar al vencer
+            payload (any, optional): Datos adicionales de la tarea
+        """
+        self.job_id = job_id
+        self.deadline = deadline
+        self.action_type = action_type
+        self.duration = duration
+        self.callback = callback
+        self.payload = payload
+        self.wall_time = datetime.now() + timedelta(seconds=duration)
+        self._seq = job_id
+        self._index = -1  # Posición en el heap, -1 si ya no está pendiente
+
+    def __lt__(self, other):
+        return (self.deadline, self._seq) < (other.deadline, other._seq)
+
+    @property
+    def pending(self):
+        """Indica si la tarea sigue pendiente en el planificador."""
+        return self._index >= 0
+
+
+class Scheduler:
+    """Planificador de tareas basado en un heap indexado de fechas límite.
+
+    Inserción y cancelación son O(log n). Solo existe un temporizador
+    armado en cada momento, para la fecha límite más próxima.
+    """
+
+    def __init__(self, clock=time.monotonic, timer_factory=_start_thread_timer):
+        """Inicializa el planificador.
+
+        Args:
+            clock (callable): Reloj monotónico que devuelve segundos (float)
+            timer_factory (callable): Función (delay, callback) que arma un
+                temporizador con método cancel()
+        """
+        self.logger = logging.getLogger(__name__)
+        self.clock = clock
+        self.timer_factory = timer_factory
+        self._heap = []
+        self._jobs = {}
+        # Heaps perezosos por tipo de acción para consultar la próxima de un tipo
+        self._by_type = {}
+        # Entradas ya retiradas que siguen en cada heap por tipo
+        self._stale = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._timer = None
+        self._armed_deadline = None
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __contains__(self, job_id):
+        return job_id in self._jobs
+
+    def add(self, delay, action_type, callback=None, payload=None):
+        """Añade una tarea que vencerá tras el retardo indicado.
+
+        Args:
+            delay (float): Segundos hasta el vencimiento
+            action_type (str): Tipo de acción
+            callback (callable, optional): Función callback(job) a ejecutar al vencer
+            payload (any, optional): Datos adicionales
+
+        Returns:
+            ScheduledJob: Tarea creada
+        """
+        delay = max(0, delay)
+        with self._lock:
+            job = ScheduledJob(
+                next(self._ids), self.clock() + delay, action_type,
+                int(delay), callback, payload
+            )
+            job._index = len(self._heap)
+            self._heap.append(job)
+            self._sift_up(job._index)
+            self._jobs[job.job_id] = job
+            heapq.heappush(
+                self._by_type.setdefault(action_type, []),
+                (job.deadline, job._seq, job)
+            )
+            self._rearm()
+        return job
+
+    def cancel(self, job_id):
+        """Cancela una tarea pendiente.
+
+        Args:
+            job_id (int): Identificador de la tarea
+
+        Returns:
+            bool: True si la tarea existía y se canceló
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            self._remove(job)
+            self._rearm()
+        return True
+
+    def clear(self, action_types=None):
+        """Cancela todas las tareas, opcionalmente solo de ciertos tipos.
+
+        Args:
+            action_types (iterable, optional): Tipos de acción a cancelar
+
+        Returns:
+            int: Número de tareas canceladas
+        """
+        with self._lock:
+            if action_types is None:
+                removed = len(self._heap)
+                for job in self._heap:
+                    job._index = -1
+                self._heap = []
+                self._jobs = {}
+                self._by_type = {}
+                self._stale = {}
+            else:
+                targets = [job for job in self._heap if job.action_type in action_types]
+                for job in targets:
+                    self._remove(job)
+                removed = len(targets)
+            self._rearm()
+        return removed
+
+    def get(self, job_id):
+        """Obtiene una tarea pendiente por su identificador."""
+        return self._jobs.get(job_id)
+
+    def peek(self, action_types=None):
+        """Obtiene la próxima tarea pendiente sin retirarla.
+
+        Args:
+            action_types (iterable, optional): Limitar la consulta a estos tipos
+
+        Returns:
+            ScheduledJob: Próxima tarea o None si no hay
+        """
+        with self._lock:
+            if action_types is None:
+                return self._heap[0] if self._heap else None
+
+            best = None
+            for action_type in action_types:
+                queue = self._by_type.get(action_type)
+                # Descartar entradas ya canceladas o vencidas
+                while queue and not queue[0][2].pending:
+                    heapq.heappop(queue)
+                    self._stale[action_type] -= 1
+                if queue and (best is None or queue[0][2] < best):
+                    best = queue[0][2]
+            return best
+
+    def jobs(self):
+        """Obtiene las tareas pendientes ordenadas por fecha límite.
+
+        Returns:
+            list: Lista de ScheduledJob
+        """
+        with self._lock:
+            return sorted(self._heap)
+
+    def remaining(self, job):
+        """Calcula los segundos restantes de una tarea.
+
+        Args:
+            job (ScheduledJob): Tarea a consultar
+
+        Returns:
+            float: Segundos restantes (nunca negativos)
+        """
+        return max(0.0, job.deadline - self.clock())
+
+    def next_deadline(self):
+        """Obtiene la fecha límite más próxima o None si no hay tareas."""
+        with self._lock:
+            return self._heap[0].deadline if self._heap else None
+
+    def run_due(self):
+        """Ejecuta las tareas vencidas y rearma el temporizador.
+
+        Returns:
+            list: Tareas que vencieron en esta llamada
+        """
+        due = []
+        with self._lock:
+            now = self.clock()
+            while self._heap and self._heap[0].deadline <= now:
+                job = self._heap[0]
+                self._remove(job)
+                due.append(job)
+            self._rearm()
+
+        for job in due:
+            if job.callback is None:
+                continue
+            try:
+                job.callback(job)
+            except Exception as e:
+                self.logger.error(f"Error al ejecutar la tarea {job.job_id}: {str(e)}")
+        return due
+
+    def rearm(self):
+        """Vuelve a armar el temporizador, por ejemplo tras una suspensión."""
+        with self._lock:
+            self._disarm()
+            self._rearm()
+
+    def close(self):
+        """Desarma el temporizador activo sin cancelar las tareas."""
+        with self._lock:
+            self._disarm()
+
+    def _rearm(self):
+        """Arma el temporizador para la fecha límite más próxima."""
+        if not self._heap:
+            self._disarm()
+            return
+
+        deadline = self._heap[0].deadline
+        if self._timer is not None and deadline == self._armed_deadline:
+            return
+
+        self._disarm()
+        self._armed_deadline = deadline
+        self._timer = self.timer_factory(max(0.0, deadline - self.clock()), self._on_timer)
+
+    def _disarm(self):
+        """Cancela el temporizador activo si existe."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._armed_deadline = None
+
+    def _on_timer(self):
+        """Callback del temporizador: ejecuta las tareas vencidas."""
+        with self._lock:
+            self._timer = None
+            self._armed_deadline = None
+        self.run_due()
+
+    def _remove(self, job):
+        """Retira una tarea del heap en O(log n)."""
+        index = job._index
+        last = self._heap.pop()
+        if last is not job:
+            self._heap[index] = last
+            last._index = index
+            self._sift_down(index)
+            self._sift_up(last._index)
+        job._index = -1
+        del self._jobs[job.job_id]
+        self._discard_by_type(job.action_type)
+
+    def _discard_by_type(self, action_type):
+        """Cuenta una entrada obsoleta en el heap de su tipo.
+
+        Las entradas se retiran de forma perezosa en peek(), pero los tipos
+        que nunca se consultan (avisos, hooks) crecerían sin límite: el heap
+        se reconstruye cuando más de la mitad de sus entradas son obsoletas.
+        """
+        queue = self._by_type[action_type]
+        stale = self._stale.get(action_type, 0) + 1
+        if stale * 2 > len(queue):
+            queue[:] = [entry for entry in queue if entry[2].pending]
+            if not queue:
+                del self._by_type[action_type]
+                self._stale.pop(action_type, None)
+                return
+            heapq.heapify(queue)
+            stale = 0
+        self._stale[action_type] = stale
+
+    def _sift_up(self, index):
+        heap = self._heap
+        job = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not job < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            heap[index]._index = index
+            index = parent
+        heap[index] = job
+        job._index = index
+
+    def _sift_down(self, index):
+        heap = self._heap
+        size = len(heap)
+        job = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < job:
+                break
+            heap[index] = heap[child]
+            heap[index]._index = index
+            index = child
+        heap[index] = job
+        job._index = index
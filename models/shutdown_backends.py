@@ -0,0 +1,284 @@
+"""
+Backends del sistema operativo para programar, cancelar y ejecutar acciones.
+
+Este módulo separa de SystemModel la forma de hablar con el sistema:
+- SubprocessBackend: ejecuta el binario `shutdown` nativo (todas las plataformas).
+- LogindBackend: usa la API D-Bus de systemd-logind (ScheduleShutdown /
+  CancelScheduledShutdown) reutilizando una única conexión al bus, sin crear
+  procesos. Requiere el paquete opcional `jeepney` y recurre al backend de
+  subprocesos si el bus no está disponible.
+
+Todas las operaciones son bloqueantes y devuelven un diccionario de resultado
+con el mismo formato que utils.command_executor.run_command, por lo que
+deben ejecutarse a través del CommandExecutor.
+"""
+
+import abc
+import logging
+import math
+import os
+import threading
+import time
+
+from utils.command_executor import run_command
+
+# Nombres y rutas de systemd-logind en D-Bus
+LOGIND_BUS_NAME = 'org.freedesktop.login1'
+LOGIND_OBJECT_PATH = '/org/freedesktop/login1'
+LOGIND_INTERFACE = 'org.freedesktop.login1.Manager'
+
+# Tiempo límite de una llamada D-Bus (segundos)
+DBUS_TIMEOUT = 5
+
+
+def _result(ok, output='', error=''):
+    """Construye un diccionario de resultado compatible con run_command."""
+    return {'ok': ok, 'returncode': 0 if ok else None, 'output': output, 'error': error}
+
+
+class ShutdownBackend(abc.ABC):
+    """Interfaz común de los backends del sistema operativo.
+
+    Las subclases deben implementar schedule, cancel y fire; is_supported y
+    close tienen un comportamiento por defecto.
+    """
+
+    name = 'base'
+
+    def is_supported(self):
+        """Indica si el backend puede operar en este sistema."""
+        return False
+
+    @abc.abstractmethod
+    def schedule(self, action_type, seconds):
+        """Programa la acción en el sistema.
+
+        Args:
+            action_type (str): 'shutdown' o 'restart'
+            seconds (float): Segundos hasta la acción
+
+        Returns:
+            dict: Resultado de la operación
+        """
+
+    @abc.abstractmethod
+    def cancel(self):
+        """Cancela la acción programada en el sistema.
+
+        Returns:
+            dict: Resultado de la operación
+        """
+
+    @abc.abstractmethod
+    def fire(self, action_type):
+        """Ejecuta la acción inmediatamente.
+
+        Args:
+            action_type (str): 'shutdown' o 'restart'
+
+        Returns:
+            dict: Resultado de la operación
+        """
+
+    def close(self):
+        """Libera los recursos del backend."""
+
+
+class SubprocessBackend(ShutdownBackend):
+    """Backend basado en el comando `shutdown` del sistema."""
+
+    name = 'subprocess'
+
+    def __init__(self, os_type):
+        """Inicializa el backend.
+
+        Args:
+            os_type (str): 'windows', 'linux' o 'darwin'
+        """
+        self.os_type = os_type
+
+    def is_supported(self):
+        return self.os_type in ['windows', 'linux', 'darwin']
+
+    def build_schedule_args(self, action_type, seconds):
+        """Construye el comando nativo para programar la acción.
+
+        Args:
+            action_type (str): 'shutdown' o 'restart'
+            seconds (float): Segundos hasta la acción
+
+        Returns:
+            list: Argumentos del comando o None si el sistema no está soportado
+        """
+        if self.os_type == 'windows':
+            flag = '/s' if action_type == 'shutdown' else '/r'
+            return ['shutdown', flag, '/t', str(int(seconds))]
+        elif self.os_type in ['linux', 'darwin']:
+            flag = '-h' if action_type == 'shutdown' else '-r'
+            # Redondear hacia arriba: el respaldo nunca debe adelantarse
+            return ['shutdown', flag, f'+{math.ceil(seconds / 60)}']
+        return None
+
+    def schedule(self, action_type, seconds):
+        args = self.build_schedule_args(action_type, seconds)
+        if args is None:
+            return _result(False, error=f"Sistema operativo no soportado: {self.os_type}")
+        return run_command(args)
+
+    def cancel(self):
+        if self.os_type == 'windows':
+            return run_command(['shutdown', '/a'])
+        elif self.os_type in ['linux', 'darwin']:
+            return run_command(['shutdown', '-c'])
+        return _result(False, error=f"Sistema operativo no soportado: {self.os_type}")
+
+    def fire(self, action_type):
+        if self.os_type == 'windows':
+            flag = '/s' if action_type == 'shutdown' else '/r'
+            return run_command(['shutdown', flag, '/t', '0'])
+        elif self.os_type in ['linux', 'darwin']:
+            flag = '-h' if action_type == 'shutdown' else '-r'
+            return run_command(['shutdown', flag, 'now'])
+        return _result(False, error=f"Sistema operativo no soportado: {self.os_type}")
+
+
+class LogindBackend(ShutdownBackend):
+    """Backend nativo de systemd-logind sobre D-Bus.
+
+    La conexión se abre en la primera llamada y se reutiliza. Si el bus no
+    está disponible, la operación se delega en el backend de respaldo.
+    """
+
+    name = 'logind'
+
+    def __init__(self, bus='SYSTEM', bus_name=LOGIND_BUS_NAME,
+                 object_path=LOGIND_OBJECT_PATH, fallback=None):
+        """Inicializa el backend.
+
+        Args:
+            bus (str): 'SYSTEM', 'SESSION' o una dirección D-Bus explícita
+                (útil para probar contra un sustituto en un bus de sesión)
+            bus_name (str): Nombre del servicio logind
+            object_path (str): Ruta del objeto Manager
+            fallback (ShutdownBackend, optional): Backend de respaldo
+        """
+        self.logger = logging.getLogger(__name__)
+        self.bus = bus
+        self.bus_name = bus_name
+        self.object_path = object_path
+        self.fallback = fallback
+        self._connection = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_available(bus='SYSTEM'):
+        """Indica si jeepney está instalado y, para el bus del sistema, si
+        el equipo arrancó con systemd.
+
+        Args:
+            bus (str): Bus que se usará
+
+        Returns:
+            bool: True si el backend puede utilizarse
+        """
+        try:
+            import jeepney  # noqa: F401
+        except ImportError:
+            return False
+        return bus != 'SYSTEM' or os.path.isdir('/run/systemd/system')
+
+    def is_supported(self):
+        return True
+
+    def schedule(self, action_type, seconds):
+        mode = 'poweroff' if action_type == 'shutdown' else 'reboot'
+        # logind espera la hora objetivo en microsegundos de CLOCK_REALTIME
+        usec = int((time.time() + seconds) * 1_000_000)
+        return self._call('ScheduleShutdown', 'st', (mode, usec),
+                          lambda fb: fb.schedule(action_type, seconds))
+
+    def cancel(self):
+        return self._call('CancelScheduledShutdown', '', (),
+                          lambda fb: fb.cancel())
+
+    def fire(self, action_type):
+        method = 'PowerOff' if action_type == 'shutdown' else 'Reboot'
+        return self._call(method, 'b', (False,),
+                          lambda fb: fb.fire(action_type))
+
+    def close(self):
+        with self._lock:
+            self._drop_connection_locked()
+
+    def _drop_connection_locked(self):
+        """Cierra y descarta la conexión al bus (con el cerrojo tomado)."""
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+
+    def _get_connection(self):
+        """Abre (una sola vez) la conexión al bus."""
+        if self._connection is None:
+            from jeepney.io.blocking import open_dbus_connection
+            self._connection = open_dbus_connection(bus=self.bus)
+        return self._connection
+
+    def _call(self, method, signature, body, fallback_call):
+        """Invoca un método del Manager de logind.
+
+        Args:
+            method (str): Nombre del método D-Bus
+            signature (str): Firma D-Bus de los argumentos
+            body (tuple): Argumentos
+            fallback_call (callable): Operación equivalente en el backend de respaldo
+
+        Returns:
+            dict: Resultado de la operación
+        """
+        from jeepney import DBusAddress, DBusErrorResponse, new_method_call
+        from jeepney.io.blocking import unwrap_msg
+
+        address = DBusAddress(
+            self.object_path, bus_name=self.bus_name, interface=LOGIND_INTERFACE
+        )
+        message = new_method_call(address, method, signature or None, body)
+        with self._lock:
+            try:
+                reply = self._get_connection().send_and_get_reply(
+                    message, timeout=DBUS_TIMEOUT
+                )
+                values = unwrap_msg(reply)
+                return _result(True, output=' '.join(str(v) for v in values))
+            except DBusErrorResponse as e:
+                # logind respondió (por ejemplo, permiso denegado): resultado estructurado
+                return _result(False, error=f"{e.name}: {' '.join(map(str, e.data))}")
+            except (OSError, TimeoutError, ConnectionError) as e:
+                # Bus inaccesible o conexión rota: cerrarla (para no filtrar
+                # el socket) y usar el respaldo
+                self._drop_connection_locked()
+                self.logger.warning(f"logind no disponible ({str(e)}), usando respaldo")
+        if self.fallback is None:
+            return _result(False, error="logind no disponible")
+        return fallback_call(self.fallback)
+
+
+def create_backend(os_type):
+    """Crea el backend más adecuado para el sistema operativo.
+
+    La variable de entorno ENERGYPY_LOGIND_BUS permite dirigir el backend de
+    logind a otro bus (por ejemplo 'SESSION' con un sustituto de pruebas).
+
+    Args:
+        os_type (str): 'windows', 'linux' o 'darwin'
+
+    Returns:
+        ShutdownBackend: Backend a utilizar
+    """
+    fallback = SubprocessBackend(os_type)
+    bus = os.environ.get('ENERGYPY_LOGIND_BUS', 'SYSTEM')
+    if os_type == 'linux' and LogindBackend.is_available(bus):
+        return LogindBackend(bus=bus, fallback=fallback)
+    return fallback
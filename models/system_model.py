@@ -2,16 +2,26 @@
 Modelo para la gestión del sistema operativo y operaciones de apagado/reinicio.
 
 Este módulo proporciona una abstracción para detectar el sistema operativo
-y ejecutar comandos nativos para apagar o reiniciar el sistema.
+y programar el apagado o reinicio a través de un backend intercambiable
+(comando nativo o systemd-logind).
 """
 
 import os
 import sys
 import platform
+import itertools
 import logging
-import subprocess
+import time
 from datetime import datetime, timedelta
 
+from models.precision_timer import PrecisionTimer
+from models.scheduler import Scheduler
+from utils.command_executor import CommandExecutor
+from utils.time_source import TimeSource
+
+# Acciones que se delegan al sistema operativo
+SYSTEM_ACTIONS = ('shutdown', 'restart')
+
 
 class SystemModel:
     """Modelo para gestionar operaciones del sistema operativo."""
@@ -20,9 +30,54 @@ class SystemModel:
         """Inicializa el modelo del sistema."""
         self.os_type = platform.system().lower()
         self.logger = logging.getLogger(__name__)
-        self.scheduled_action = None
-        self.scheduled_time = None
-        self.action_type = None  # 'shutdown' o 'restart'
+        self._backend = None  # Se crea en el primer uso (ver backend)
+        self.time_source = TimeSource()
+        self.time_source.add_listener(self._on_clock_event)
+        self.scheduler = Scheduler(
+            clock=self.time_source.now,
+            timer_factory=self._start_precision_timer
+        )
+        # Los comandos del sistema se ejecutan fuera del hilo que llama
+        self.executor = CommandExecutor()
+        self.executor.add_listener(self._on_command_result)
+        self.scheduled_action = None  # Futuro del último comando de programación
+        # El sistema tiene (o puede tener) una acción programada por nosotros
+        self._os_pending = False
+        # Diario persistente opcional y claves estables de sus tareas
+        self.journal = None
+        self._journal_keys = {}
+        self._journal_seq = itertools.count(1)
+
+    @property
+    def backend(self):
+        """Backend de apagado, creado en el primer uso.
+
+        Las consultas de estado (CLI, interfaz) no necesitan cargar D-Bus ni
+        detectar el backend, de modo que se difiere hasta el primer comando.
+        """
+        if self._backend is None:
+            from models.shutdown_backends import create_backend
+
+            self._backend = create_backend(self.os_type)
+        return self._backend
+
+    @property
+    def scheduled_time(self):
+        """Hora (datetime) de la próxima acción del sistema o None."""
+        job = self.scheduler.peek(SYSTEM_ACTIONS)
+        return job.wall_time if job else None
+
+    @property
+    def action_type(self):
+        """Tipo de la próxima acción del sistema ('shutdown' o 'restart') o None."""
+        job = self.scheduler.peek(SYSTEM_ACTIONS)
+        return job.action_type if job else None
+
+    @property
+    def original_seconds(self):
+        """Duración total solicitada para la próxima acción del sistema."""
+        job = self.scheduler.peek(SYSTEM_ACTIONS)
+        return job.duration if job else 0
 
     def get_os_type(self):
         """Retorna el tipo de sistema operativo."""
@@ -40,39 +95,236 @@ class SystemModel:
     def schedule_shutdown(self, seconds=0, action_type='shutdown'):
         """Programa el apagado del sistema.
 
+        La fecha límite se mide en la fuente de tiempo monotónica, por lo que
+        los cambios del reloj de pared no alteran la cuenta regresiva.
+
         Args:
             seconds (int): Segundos hasta el apagado
             action_type (str): 'shutdown' o 'restart'
 
         Returns:
-            bool: True si se programó correctamente, False en caso contrario
+            int: Identificador de la tarea o None si no se pudo programar
         """
         try:
-            self.scheduled_time = datetime.now() + timedelta(seconds=seconds)
-            self.action_type = action_type
-
-            if self.os_type == 'windows':
-                cmd = 'shutdown'
-                flag = '/s' if action_type == 'shutdown' else '/r'
-                args = [cmd, flag, '/t', str(seconds)]
-            elif self.os_type == 'linux':
-                cmd = 'shutdown'
-                flag = '-h' if action_type == 'shutdown' else '-r'
-                args = [cmd, flag, f'+{seconds // 60}']
-            elif self.os_type == 'darwin':  # macOS
-                cmd = 'shutdown'
-                flag = '-h' if action_type == 'shutdown' else '-r'
-                args = [cmd, flag, f'+{seconds // 60}']
-            else:
+            if not self.backend.is_supported():
                 self.logger.error(f"Sistema operativo no soportado: {self.os_type}")
-                return False
+                return None
 
-            self.scheduled_action = subprocess.Popen(args)
-            self.logger.info(f"Programado {action_type} para {self.scheduled_time}")
-            return True
+            # En Linux/macOS el comando del sistema solo admite minutos: la
+            # acción se dispara desde el proceso en el segundo exacto y el
+            # sistema queda programado como respaldo
+            callback = self._fire_action if self.os_type in ['linux', 'darwin'] else None
+            job = self.scheduler.add(seconds, action_type, callback)
+            # El sistema operativo solo admite una acción pendiente: se programa
+            # únicamente cuando la nueva tarea pasa a ser la más próxima
+            if self.scheduler.peek(SYSTEM_ACTIONS) is job:
+                if self._apply_os_schedule(job) is None:
+                    self.scheduler.cancel(job.job_id)
+                    return None
+            self._journal_schedule(job)
+            self.logger.info(f"Programado {action_type} para {job.wall_time}")
+            return job.job_id
         except Exception as e:
             self.logger.error(f"Error al programar {action_type}: {str(e)}")
-            return False
+            return None
+
+    def adopt_scheduled_action(self, action_type, seconds, duration=None):
+        """Registra una acción que el sistema ya tiene programada.
+
+        No emite ningún comando: solo refleja en el planificador un apagado
+        programado fuera de la aplicación o antes de reiniciarla.
+
+        Args:
+            action_type (str): 'shutdown' o 'restart'
+            seconds (float): Segundos restantes
+            duration (float, optional): Duración total original, para el progreso
+
+        Returns:
+            int: Identificador de la tarea
+        """
+        callback = self._fire_action if self.os_type in ['linux', 'darwin'] else None
+        job = self.scheduler.add(seconds, action_type, callback)
+        if duration is not None:
+            job.duration = int(max(duration, seconds))
+        self._journal_schedule(job)
+        self._os_pending = True
+        return job.job_id
+
+    def drop_system_jobs(self):
+        """Olvida las acciones del sistema sin emitir ningún comando.
+
+        Returns:
+            int: Número de tareas retiradas
+        """
+        for job in self.scheduler.jobs():
+            if job.action_type in SYSTEM_ACTIONS:
+                self._journal_cancel(job.job_id)
+        self._os_pending = False
+        return self.scheduler.clear(SYSTEM_ACTIONS)
+
+    def attach_journal(self, journal):
+        """Asocia un diario persistente y restaura las acciones que contiene.
+
+        Las acciones restauradas no emiten comandos: el sistema ya las tiene
+        programadas (el reconciliador corrige cualquier discrepancia).
+
+        Args:
+            journal (ScheduleJournal): Diario de acciones programadas
+
+        Returns:
+            int: Número de acciones restauradas
+        """
+        self.journal = journal
+        restored = 0
+        now = time.time()
+        for key, (action_type, deadline, duration) in journal.load().items():
+            if deadline <= now:
+                # Vencida mientras la aplicación no estaba en ejecución
+                journal.record_cancel(key)
+                continue
+            callback = self._fire_action if self.os_type in ['linux', 'darwin'] else None
+            job = self.scheduler.add(deadline - now, action_type, callback)
+            job.duration = duration
+            self._journal_keys[job.job_id] = key
+            restored += 1
+        if restored:
+            self._os_pending = True
+            self.logger.info(f"Restauradas {restored} acciones desde el diario")
+        return restored
+
+    def _journal_schedule(self, job):
+        """Registra en el diario una acción del sistema programada."""
+        if self.journal is None:
+            return
+        # Las claves nunca se reutilizan, de modo que reproducir es conmutativo
+        key = f"{int(time.time() * 1000):x}.{next(self._journal_seq)}"
+        self._journal_keys[job.job_id] = key
+        deadline = time.time() + self.scheduler.remaining(job)
+        self.journal.record_schedule(key, job.action_type, deadline, job.duration)
+
+    def _journal_cancel(self, job_id):
+        """Registra en el diario la retirada de una acción del sistema."""
+        key = self._journal_keys.pop(job_id, None)
+        if self.journal is not None and key is not None:
+            self.journal.record_cancel(key)
+
+    def schedule_job(self, seconds, action_type, callback=None, payload=None):
+        """Programa una tarea interna (aviso, hook...) sin acción del sistema.
+
+        Args:
+            seconds (int): Segundos hasta el vencimiento
+            action_type (str): Tipo de tarea (por ejemplo 'warning' o 'hook')
+            callback (callable, optional): Función callback(job) a ejecutar al vencer
+            payload (any, optional): Datos adicionales de la tarea
+
+        Returns:
+            int: Identificador de la tarea
+        """
+        job = self.scheduler.add(seconds, action_type, callback, payload)
+        self.logger.info(f"Tarea {action_type} ({job.job_id}) programada para {job.wall_time}")
+        return job.job_id
+
+    def _start_precision_timer(self, delay, callback):
+        """Arma el temporizador de precisión del planificador.
+
+        Mientras espera, el temporizador comprueba los relojes cada medio
+        minuto, de modo que los saltos y suspensiones se detectan aunque la
+        interfaz no consulte el tiempo restante (ventana oculta, daemon).
+        """
+        return PrecisionTimer(delay, callback, clock=self.time_source.now,
+                              on_slice=self.time_source.check)
+
+    def _fire_action(self, job):
+        """Ejecuta inmediatamente la acción de una tarea vencida.
+
+        Args:
+            job (ScheduledJob): Tarea de apagado o reinicio
+        """
+        self.logger.info(f"Ejecutando {job.action_type} programado (tarea {job.job_id})")
+        self._journal_cancel(job.job_id)
+        self.executor.submit('fire', self.backend.fire, job.action_type, context=job.job_id)
+
+    def _apply_os_schedule(self, job):
+        """Encola la programación en el sistema operativo de una tarea.
+
+        El sistema solo admite una acción pendiente (en Windows, programar
+        otra falla con el error 1190): si ya hay una, se encola antes su
+        cancelación, que el ejecutor procesa en orden.
+
+        Args:
+            job (ScheduledJob): Tarea de apagado o reinicio
+
+        Returns:
+            Future: Futuro de la operación o None si no se pudo encolar
+        """
+        if self._os_pending:
+            if self.executor.submit('cancel', self.backend.cancel) is None:
+                return None
+            self._os_pending = False
+        self.scheduled_action = self.executor.submit(
+            'schedule', self.backend.schedule, job.action_type,
+            self.scheduler.remaining(job), context=job.job_id
+        )
+        self._os_pending = self.scheduled_action is not None
+        return self.scheduled_action
+
+    def add_command_listener(self, callback):
+        """Registra un callback(result) para los resultados de los comandos.
+
+        Args:
+            callback (callable): Recibe el diccionario de resultado (con
+                'label', 'ok', 'error' y 'context'); se invoca desde un hilo
+                de trabajo
+        """
+        self.executor.add_listener(callback)
+
+    def _on_command_result(self, result):
+        """Retira la tarea si el sistema rechazó su programación.
+
+        Args:
+            result (dict): Resultado del comando
+        """
+        if result['label'] == 'schedule' and not result['ok']:
+            job = self.scheduler.get(result['context'])
+            if job is not None and self.scheduler.peek(SYSTEM_ACTIONS) is job:
+                self.scheduler.cancel(job.job_id)
+                self._journal_cancel(job.job_id)
+                self.logger.error(f"Programación de la tarea {job.job_id} rechazada por el sistema")
+
+    def _on_clock_event(self, kind, offset):
+        """Resincroniza las tareas tras un salto de reloj o una suspensión.
+
+        Args:
+            kind (str): 'jump' o 'suspend'
+            offset (float): Desfase detectado en segundos
+        """
+        now = datetime.now()
+        for job in self.scheduler.jobs():
+            job.wall_time = now + timedelta(seconds=self.scheduler.remaining(job))
+            # El diario guarda fechas en hora de pared: volver a registrarlas
+            if job.job_id in self._journal_keys:
+                self._journal_cancel(job.job_id)
+                self._journal_schedule(job)
+
+        # La programación del sistema se expresa en hora de pared o en una
+        # cuenta atrás que puede haberse detenido: volver a emitirla
+        self.scheduler.rearm()
+        primary = self.scheduler.peek(SYSTEM_ACTIONS)
+        if primary is not None:
+            try:
+                self._apply_os_schedule(primary)
+                self.logger.info(f"Programación del sistema resincronizada tras {kind}")
+            except Exception as e:
+                self.logger.error(f"Error al resincronizar la programación: {str(e)}")
+
+    def get_clock_diagnostics(self):
+        """Obtiene los contadores de saltos de reloj y suspensiones detectados.
+
+        Returns:
+            dict: Diagnóstico de la fuente de tiempo
+        """
+        self.time_source.check()
+        return self.time_source.get_diagnostics()
 
     def schedule_shutdown_at_time(self, target_time, action_type='shutdown'):
         """Programa el apagado a una hora específica.
@@ -82,7 +334,7 @@ class SystemModel:
             action_type (str): 'shutdown' o 'restart'
 
         Returns:
-            bool: True si se programó correctamente, False en caso contrario
+            int: Identificador de la tarea o None si no se pudo programar
         """
         now = datetime.now()
         if target_time <= now:
@@ -92,53 +344,133 @@ class SystemModel:
         seconds = int((target_time - now).total_seconds())
         return self.schedule_shutdown(seconds, action_type)
 
-    def cancel_scheduled_action(self):
-        """Cancela cualquier apagado o reinicio programado.
+    def cancel_scheduled_action(self, job_id=None):
+        """Cancela el apagado o reinicio programado.
+
+        Al cancelar todas las tareas sin que haya ninguna acción local, se
+        cancela igualmente en el sistema la que pudiera haberse programado
+        fuera de la aplicación.
+
+        Args:
+            job_id (int, optional): Tarea concreta a cancelar. Si se omite se
+                cancelan todas las tareas pendientes.
 
         Returns:
             bool: True si se canceló correctamente, False en caso contrario
         """
         try:
-            if self.os_type == 'windows':
-                subprocess.run(['shutdown', '/a'])
-            elif self.os_type in ['linux', 'darwin']:
-                subprocess.run(['shutdown', '-c'])
-            else:
-                self.logger.error(f"Sistema operativo no soportado: {self.os_type}")
+            primary = self.scheduler.peek(SYSTEM_ACTIONS)
+            if job_id is None:
+                self.scheduler.clear()
+                self._journal_keys.clear()
+                if self.journal is not None:
+                    self.journal.record_clear()
+            elif not self.scheduler.cancel(job_id):
                 return False
+            else:
+                self._journal_cancel(job_id)
+
+            # Solo hay que tocar el sistema si se retiró la acción más próxima
+            # o si se cancela todo sin conocer ninguna acción local
+            removed_primary = primary is not None and not primary.pending
+            if removed_primary or (job_id is None and primary is None):
+                if not self._cancel_os_schedule():
+                    return False
 
-            self.scheduled_action = None
-            self.scheduled_time = None
-            self.action_type = None
             self.logger.info("Acción programada cancelada")
             return True
         except Exception as e:
             self.logger.error(f"Error al cancelar acción programada: {str(e)}")
             return False
 
-    def get_remaining_time(self):
+    def cancel_foreign_action(self):
+        """Cancela en el sistema una acción programada fuera de la aplicación.
+
+        A diferencia de cancel_scheduled_action, las tareas locales se
+        conservan: tras la cancelación se vuelve a programar en el sistema la
+        acción local más próxima, si la hay.
+
+        Returns:
+            bool: True si se encolaron los comandos, False en caso contrario
+        """
+        try:
+            return self._cancel_os_schedule()
+        except Exception as e:
+            self.logger.error(f"Error al cancelar la acción externa: {str(e)}")
+            return False
+
+    def _cancel_os_schedule(self):
+        """Encola la cancelación en el sistema y reprograma la acción más próxima.
+
+        Returns:
+            bool: True si se encolaron los comandos, False en caso contrario
+        """
+        if not self.backend.is_supported():
+            self.logger.error(f"Sistema operativo no soportado: {self.os_type}")
+            return False
+        self.scheduled_action = self.executor.submit('cancel', self.backend.cancel)
+        if self.scheduled_action is None:
+            return False
+        self._os_pending = False
+
+        # Volver a programar la siguiente acción del sistema, si la hay
+        following = self.scheduler.peek(SYSTEM_ACTIONS)
+        if following is not None:
+            return self._apply_os_schedule(following) is not None
+        return True
+
+    def get_remaining_time(self, job_id=None):
         """Obtiene el tiempo restante hasta la acción programada.
 
+        Args:
+            job_id (int, optional): Tarea a consultar. Por defecto, la próxima
+                acción del sistema.
+
         Returns:
             int: Segundos restantes o None si no hay acción programada
         """
-        if self.scheduled_time is None:
+        self.time_source.check()
+        if job_id is None:
+            job = self.scheduler.peek(SYSTEM_ACTIONS)
+        else:
+            job = self.scheduler.get(job_id)
+        if job is None:
             return None
 
-        remaining = (self.scheduled_time - datetime.now()).total_seconds()
-        return max(0, int(remaining))
+        return int(self.scheduler.remaining(job))
 
-    def get_scheduled_info(self):
+    def get_scheduled_info(self, job_id=None):
         """Obtiene información sobre la acción programada.
 
+        Args:
+            job_id (int, optional): Tarea a consultar. Por defecto, la próxima
+                acción del sistema.
+
         Returns:
             dict: Información de la acción programada o None si no hay
         """
-        if self.scheduled_time is None:
+        self.time_source.check()
+        if job_id is None:
+            job = self.scheduler.peek(SYSTEM_ACTIONS)
+        else:
+            job = self.scheduler.get(job_id)
+        if job is None:
             return None
 
         return {
-            'action_type': self.action_type,
-            'scheduled_time': self.scheduled_time,
-            'remaining_seconds': self.get_remaining_time()
-        }
\ No newline at end of file
+            'job_id': job.job_id,
+            'action_type': job.action_type,
+            'scheduled_time': job.wall_time,
+            'remaining_seconds': int(self.scheduler.remaining(job)),
+            'original_seconds': job.duration,
+            'deadline': job.deadline,  # En el reloj de time_source
+            'pending_jobs': len(self.scheduler)
+        }
+
+    def get_pending_jobs(self):
+        """Obtiene información de todas las tareas pendientes.
+
+        Returns:
+            list: Lista de diccionarios ordenada por fecha límite
+        """
+        return [self.get_scheduled_info(job.job_id) for job in self.scheduler.jobs()]
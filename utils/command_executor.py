@@ -0,0 +1,158 @@
+"""
+Ejecutor asíncrono de comandos del sistema.
+
+Este módulo ejecuta los comandos del sistema operativo (shutdown, etc.) en
+un pool de hilos con cola acotada y tiempo límite, de modo que el hilo de la
+interfaz nunca espera a que termine un proceso. Los procesos hijos siempre
+se recogen (incluso al expirar el tiempo límite) y el resultado se notifica
+a los listeners registrados.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Tiempo límite por defecto para un comando del sistema (segundos)
+DEFAULT_TIMEOUT = 15
+# Número máximo de comandos en cola o en ejecución
+DEFAULT_MAX_PENDING = 16
+
+
+def run_command(args, timeout=DEFAULT_TIMEOUT):
+    """Ejecuta un comando de forma bloqueante y recoge el proceso hijo.
+
+    Args:
+        args (list): Comando y argumentos
+        timeout (float): Segundos máximos de ejecución
+
+    Returns:
+        dict: Resultado con 'ok', 'returncode', 'output' y 'error'
+    """
+    try:
+        # subprocess.run mata y recoge el hijo si se supera el tiempo límite
+        completed = subprocess.run(
+            args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            stdin=subprocess.DEVNULL, timeout=timeout
+        )
+        output = completed.stdout.decode(errors='replace').strip()
+        error = completed.stderr.decode(errors='replace').strip()
+        return {
+            'ok': completed.returncode == 0,
+            'returncode': completed.returncode,
+            'output': output,
+            'error': error
+        }
+    except subprocess.TimeoutExpired:
+        return {
+            'ok': False,
+            'returncode': None,
+            'output': '',
+            'error': f"Tiempo límite de {timeout} s superado"
+        }
+
+
+class CommandExecutor:
+    """Pool de hilos acotado para ejecutar comandos fuera del hilo de la interfaz.
+
+    Con un único hilo de trabajo (por defecto) los comandos se ejecutan en el
+    orden en que se encolan, de modo que un 'cancel' seguido de un
+    'schedule' llega al sistema en ese mismo orden.
+    """
+
+    def __init__(self, max_workers=1, max_pending=DEFAULT_MAX_PENDING,
+                 timeout=DEFAULT_TIMEOUT):
+        """Inicializa el ejecutor.
+
+        Args:
+            max_workers (int): Hilos de trabajo; con más de uno no se
+                garantiza el orden de ejecución
+            max_pending (int): Comandos máximos en cola o en ejecución
+            timeout (float): Tiempo límite por defecto de cada comando
+        """
+        self.logger = logging.getLogger(__name__)
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='energypy-cmd'
+        )
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._listeners = []
+
+    def add_listener(self, callback):
+        """Registra un callback(result) que recibe cada resultado.
+
+        El callback se invoca desde el hilo de trabajo; las vistas Qt deben
+        reenviarlo mediante una señal.
+
+        Args:
+            callback (callable): Función que recibe el diccionario de resultado
+        """
+        self._listeners.append(callback)
+
+    def submit(self, label, func, *args, context=None):
+        """Encola una función bloqueante.
+
+        Args:
+            label (str): Etiqueta de la operación (por ejemplo 'schedule')
+            func (callable): Función que devuelve un dict de resultado
+            *args: Argumentos de la función
+            context (any, optional): Datos que se devuelven con el resultado
+
+        Returns:
+            Future: Futuro de la operación o None si la cola está llena
+        """
+        if not self._slots.acquire(blocking=False):
+            self.logger.error(f"Cola de comandos llena, se descarta '{label}'")
+            return None
+        try:
+            return self._pool.submit(self._run, label, func, args, context)
+        except RuntimeError as e:
+            self._slots.release()
+            self.logger.error(f"No se pudo encolar '{label}': {str(e)}")
+            return None
+
+    def run_command(self, label, args, timeout=None, context=None):
+        """Encola un comando del sistema.
+
+        Args:
+            label (str): Etiqueta de la operación
+            args (list): Comando y argumentos
+            timeout (float, optional): Tiempo límite en segundos
+            context (any, optional): Datos que se devuelven con el resultado
+
+        Returns:
+            Future: Futuro de la operación o None si la cola está llena
+        """
+        return self.submit(
+            label, run_command, args, timeout or self.timeout, context=context
+        )
+
+    def shutdown(self, wait=True):
+        """Detiene el pool, esperando por defecto a los comandos en curso."""
+        self._pool.shutdown(wait=wait)
+
+    def _run(self, label, func, args, context):
+        """Ejecuta la operación en un hilo de trabajo y notifica el resultado."""
+        start = time.monotonic()
+        try:
+            result = func(*args)
+        except Exception as e:
+            result = {'ok': False, 'returncode': None, 'output': '', 'error': str(e)}
+        finally:
+            self._slots.release()
+
+        result['label'] = label
+        result['context'] = context
+        result['elapsed'] = time.monotonic() - start
+        if result['ok']:
+            self.logger.info(f"Comando '{label}' completado en {result['elapsed']:.3f} s")
+        else:
+            self.logger.error(f"Comando '{label}' fallido: {result['error']}")
+
+        for callback in self._listeners:
+            try:
+                callback(result)
+            except Exception as e:
+                self.logger.error(f"Error en el listener de comandos: {str(e)}")
+        return result
@@ -0,0 +1,165 @@
+"""
+Bucle de eventos mínimo basado en selectors.
+
+Este módulo ofrece un bucle de eventos ligero para el modo sin interfaz
+gráfica: temporizadores, lectores de sockets y llamadas seguras desde otros
+hilos. Evita importar asyncio (que arrastra ssl y varios megabytes de
+memoria residual) manteniendo una interfaz parecida.
+"""
+
+import collections
+import heapq
+import itertools
+import logging
+import selectors
+import signal
+import socket
+import threading
+import time
+
+
+class EventLoop:
+    """Bucle de eventos de un solo hilo con temporizadores y lectores."""
+
+    def __init__(self):
+        """Inicializa el bucle."""
+        self.logger = logging.getLogger(__name__)
+        self._selector = selectors.DefaultSelector()
+        self._timers = []
+        self._seq = itertools.count()
+        self._ready = []
+        self._ready_lock = threading.Lock()
+        # Señales recibidas: el manejador no puede tomar _ready_lock (el hilo
+        # del bucle podría tenerlo al llegar la señal), así que usa una deque,
+        # cuyo append es atómico
+        self._signals = collections.deque()
+        self._signal_callbacks = {}
+        self._running = False
+
+        # Par de sockets para despertar el bucle desde otros hilos o señales
+        self._wake_reader, self._wake_writer = socket.socketpair()
+        self._wake_reader.setblocking(False)
+        self._wake_writer.setblocking(False)
+        self._selector.register(self._wake_reader, selectors.EVENT_READ, self._drain_wakeup)
+
+    def call_soon_threadsafe(self, callback, *args):
+        """Encola una llamada desde cualquier hilo.
+
+        Args:
+            callback (callable): Función a ejecutar en el bucle
+            *args: Argumentos de la función
+        """
+        with self._ready_lock:
+            self._ready.append((callback, args))
+        self._wakeup()
+
+    def call_later(self, delay, callback, *args):
+        """Programa una llamada tras un retardo (solo desde el hilo del bucle).
+
+        Args:
+            delay (float): Segundos de espera
+            callback (callable): Función a ejecutar
+            *args: Argumentos de la función
+
+        Returns:
+            list: Entrada del temporizador; cancel_timer() la anula
+        """
+        entry = [time.monotonic() + delay, next(self._seq), callback, args]
+        heapq.heappush(self._timers, entry)
+        return entry
+
+    @staticmethod
+    def cancel_timer(entry):
+        """Anula un temporizador devuelto por call_later()."""
+        entry[2] = None
+
+    def add_reader(self, fileobj, callback):
+        """Ejecuta callback(fileobj) cuando el objeto tenga datos para leer."""
+        self._selector.register(fileobj, selectors.EVENT_READ, callback)
+
+    def remove_reader(self, fileobj):
+        """Deja de vigilar un objeto registrado con add_reader()."""
+        try:
+            self._selector.unregister(fileobj)
+        except (KeyError, ValueError):
+            pass
+
+    def add_signal_handler(self, sig, callback):
+        """Ejecuta callback en el bucle al recibir la señal indicada."""
+        self._signal_callbacks[sig] = callback
+        signal.signal(sig, self._on_signal)
+
+    def run_forever(self):
+        """Ejecuta el bucle hasta que se llame a stop()."""
+        self._running = True
+        try:
+            while self._running:
+                self._run_once()
+        finally:
+            self._running = False
+
+    def stop(self):
+        """Detiene el bucle (seguro desde cualquier hilo)."""
+        self.call_soon_threadsafe(self._request_stop)
+
+    def close(self):
+        """Libera el selector y los sockets internos."""
+        self._selector.close()
+        self._wake_reader.close()
+        self._wake_writer.close()
+
+    def _on_signal(self, sig, frame):
+        # Manejador de señal: sin cerrojos, solo anota la señal y despierta
+        self._signals.append(sig)
+        self._wakeup()
+
+    def _request_stop(self):
+        self._running = False
+
+    def _wakeup(self):
+        try:
+            self._wake_writer.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass
+
+    def _drain_wakeup(self, sock):
+        try:
+            while sock.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _run_once(self):
+        """Espera eventos hasta el próximo temporizador y los despacha."""
+        timeout = None
+        with self._ready_lock:
+            has_ready = bool(self._ready)
+        if has_ready or self._signals:
+            timeout = 0
+        elif self._timers:
+            timeout = max(0.0, self._timers[0][0] - time.monotonic())
+
+        for key, _ in self._selector.select(timeout):
+            self._dispatch(key.data, key.fileobj)
+
+        while self._signals:
+            callback = self._signal_callbacks.get(self._signals.popleft())
+            if callback is not None:
+                self._dispatch(callback)
+
+        now = time.monotonic()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, callback, args = heapq.heappop(self._timers)
+            if callback is not None:
+                self._dispatch(callback, *args)
+
+        with self._ready_lock:
+            ready, self._ready = self._ready, []
+        for callback, args in ready:
+            self._dispatch(callback, *args)
+
+    def _dispatch(self, callback, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            self.logger.error(f"Error en el bucle de eventos: {str(e)}")
@@ -0,0 +1,154 @@
+"""
+Vigilancia de cambios de un archivo.
+
+En Linux se usa inotify (mediante ctypes, sin dependencias) sobre el
+directorio del archivo, de modo que también se detectan las sustituciones
+atómicas por renombrado; el descriptor se integra en el bucle de eventos de
+quien lo use (QSocketNotifier, selectors...). En el resto de sistemas, o si
+inotify no está disponible, se compara el estado del archivo (mtime, tamaño
+e inodo) con un intervalo que se duplica mientras no hay cambios y vuelve al
+mínimo en cuanto cambia.
+"""
+
+import logging
+import os
+import struct
+
+# Eventos de inotify: archivo cerrado tras escribir y archivo movido al directorio
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+# Opciones de inotify_init1
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+# Cabecera de cada evento: wd, mask, cookie, len
+_EVENT = struct.Struct('iIII')
+
+# Intervalos (segundos) del sondeo de respaldo
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 30.0
+
+
+class FileWatcher:
+    """Detecta los cambios de un archivo con inotify o, si no, por sondeo."""
+
+    def __init__(self, path, min_interval=DEFAULT_MIN_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL, use_inotify=True):
+        """Inicializa la vigilancia.
+
+        Args:
+            path (str): Archivo a vigilar (puede no existir todavía)
+            min_interval (float): Intervalo inicial del sondeo
+            max_interval (float): Intervalo máximo del sondeo
+            use_inotify (bool): Intentar usar inotify antes que el sondeo
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = os.path.abspath(path)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._name = os.fsencode(os.path.basename(self.path))
+        self._fd = None
+        if use_inotify:
+            self._fd = self._init_inotify()
+        self._signature = self._stat()
+
+    @property
+    def backend(self):
+        """Mecanismo en uso: 'inotify' o 'polling'."""
+        return 'inotify' if self._fd is not None else 'polling'
+
+    def fileno(self):
+        """Descriptor que pasa a ser legible cuando hay eventos.
+
+        Returns:
+            int: Descriptor de inotify, o None si se usa el sondeo
+        """
+        return self._fd
+
+    def next_interval(self):
+        """Segundos hasta la siguiente comprobación por sondeo.
+
+        Returns:
+            float: Intervalo actual, o None si se usa inotify
+        """
+        return None if self._fd is not None else self.interval
+
+    def check(self):
+        """Comprueba si el archivo ha cambiado desde la última comprobación.
+
+        Con inotify consume los eventos pendientes; con el sondeo compara el
+        estado del archivo y ajusta el intervalo.
+
+        Returns:
+            bool: True si el archivo ha cambiado
+        """
+        if self._fd is not None:
+            return self._read_events()
+
+        signature = self._stat()
+        if signature != self._signature:
+            self._signature = signature
+            self.interval = self.min_interval
+            return True
+        self.interval = min(self.interval * 2, self.max_interval)
+        return False
+
+    def close(self):
+        """Deja de vigilar y libera el descriptor de inotify."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _init_inotify(self):
+        """Crea la vigilancia de inotify del directorio, o None si no es posible."""
+        # ctypes.util es costoso de importar; solo hace falta al crear la vigilancia
+        import ctypes
+        import ctypes.util
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except (OSError, AttributeError, TypeError):
+            return None
+
+        fd = inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            self.logger.warning(f"inotify no disponible: {os.strerror(ctypes.get_errno())}")
+            return None
+        directory = os.fsencode(os.path.dirname(self.path))
+        if inotify_add_watch(fd, directory, IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            self.logger.warning(f"No se pudo vigilar {self.path}: {os.strerror(ctypes.get_errno())}")
+            os.close(fd)
+            return None
+        return fd
+
+    def _read_events(self):
+        """Vacía la cola de inotify e indica si algún evento es del archivo."""
+        changed = False
+        while True:
+            try:
+                data = os.read(self._fd, 4096)
+            except BlockingIOError:
+                return changed
+            except OSError as e:
+                self.logger.error(f"Error al leer los eventos de inotify: {str(e)}")
+                return changed
+            if not data:
+                return changed
+            offset = 0
+            while offset + _EVENT.size <= len(data):
+                _, _, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if name == self._name:
+                    changed = True
+
+    def _stat(self):
+        """Estado del archivo para el sondeo (None si no existe)."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
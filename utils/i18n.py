@@ -3,73 +3,360 @@ Utilidades para la internacionalización (i18n) de la aplicación.
 
 Este módulo proporciona funciones para cargar y gestionar
 las traducciones en diferentes idiomas.
+
+Al arrancar solo se carga el idioma activo; los demás se cargan la primera
+vez que se seleccionan. Cada catálogo interpretado se guarda con marshal en
+el directorio de caché del usuario junto con la fecha de modificación, el
+tamaño y el hash del JSON de origen: mientras el archivo no cambie, se carga
+de la caché sin leer ni interpretar el JSON. Los recursos nunca se
+modifican; si falta una traducción se usan los textos por defecto en memoria.
+
+Los textos con campos de formato se analizan una sola vez por idioma y clave
+(Template) y después solo se rellenan. Un texto puede tener variantes según
+el número (argumento count) o el género (argumento gender), escritas como
+un objeto en el JSON (MessageForms):
+
+    "in_minutes": {"one": "dentro de {count} minuto",
+                   "other": "dentro de {count} minutos"}
+    "welcome": {"female": "Bienvenida", "male": "Bienvenido",
+                "other": "Le damos la bienvenida"}
+
+Las claves "=N" eligen un número exacto ("=0": "ningún minuto") y la
+variante "other" es obligatoria: se usa cuando no hay otra que encaje. Las
+variantes se pueden anidar (por ejemplo, género y dentro número).
 """
 
-import os
+import hashlib
 import json
 import logging
+import marshal
+import os
+import string
+from operator import itemgetter
+
+from utils.paths import get_cache_dir, get_resource_path
+from utils.resources import is_bundled, read_resource
+
+# Idiomas disponibles, en el orden en que se muestran
+LANGUAGES = ('es', 'en')
+# Subdirectorio de las traducciones dentro de resources y de la caché en disco
+TRANSLATIONS_DIR = 'translations'
+# Versión del formato de la caché; al cambiarla se descartan las anteriores
+CACHE_VERSION = 1
+
+# Argumentos que eligen la variante de un texto
+COUNT_ARG = 'count'
+GENDER_ARG = 'gender'
+# Variante que se usa cuando ninguna otra encaja
+OTHER_FORM = 'other'
+
+
+def _plural_one_other(n):
+    """Regla plural con singular solo para 1 (español, inglés...)."""
+    return 'one' if n == 1 else 'other'
+
+
+# Categoría plural de un número según el idioma (reglas de CLDR)
+PLURAL_RULES = {
+    'es': _plural_one_other,
+    'en': _plural_one_other,
+}
+
+
+class Template:
+    """Texto con sus campos de formato ya analizados.
+
+    render(kwargs) equivale a text.format(**kwargs): los textos sin campos
+    se devuelven tal cual, los de uno o dos campos simples ({nombre}) se
+    componen con los literales ya separados en una sola construcción de
+    cadena y el resto se rellena por posición, sin volver a analizar el
+    texto.
+    """
+
+    __slots__ = ('text', 'render')
+
+    def __init__(self, text):
+        """Analiza el texto.
+
+        Args:
+            text (str): Texto con campos de formato ({nombre}, {n:>3}...)
+
+        Raises:
+            ValueError: Si el texto no es un formato válido
+        """
+        self.text = text
+        literals, names, positional = [], [], []
+        # Texto literal entre campos (las llaves escapadas parten los literales)
+        between = ['']
+        simple = plain = True
+        for literal, name, spec, conversion in string.Formatter().parse(text):
+            literals.append(literal)
+            between[-1] += literal
+            positional.append(literal.replace('{', '{{').replace('}', '}}'))
+            if name is None:
+                continue
+            names.append(name)
+            between.append('')
+            # Atributos, índices o especificaciones anidadas: format_map
+            simple = simple and name.isidentifier() and '{' not in (spec or '')
+            plain = plain and not spec and not conversion
+            positional.append('{' + (f'!{conversion}' if conversion else '')
+                              + (f':{spec}' if spec else '') + '}')
+
+        if not names:
+            static = ''.join(literals)
+            self.render = lambda kwargs: static
+        elif not simple:
+            self.render = text.format_map
+        elif plain and len(names) <= 2:
+            # Una f-string formatea cada valor igual que str.format sin
+            # especificación y une los trozos de una vez
+            head, tail = between[0], between[-1]
+            if len(names) == 1:
+                name = names[0]
+                self.render = lambda kwargs: f"{head}{kwargs[name]}{tail}"
+            else:
+                first, middle, second = names[0], between[1], names[1]
+                self.render = lambda kwargs: f"{head}{kwargs[first]}{middle}{kwargs[second]}{tail}"
+        elif len(names) == 1:
+            fill, name = ''.join(positional).format, names[0]
+            self.render = lambda kwargs: fill(kwargs[name])
+        else:
+            fill, values = ''.join(positional).format, itemgetter(*names)
+            self.render = lambda kwargs: fill(*values(kwargs))
+
+
+class MessageForms:
+    """Texto con variantes según el número (count) o el género (gender)."""
+
+    __slots__ = ('forms', 'exact', 'plural', 'default', 'text')
+
+    def __init__(self, forms, language):
+        """Compila las variantes.
+
+        Args:
+            forms (dict): {variante: texto u objeto de variantes}
+            language (str): Idioma, para la regla plural
+
+        Raises:
+            ValueError: Si falta la variante 'other' o un texto no es válido
+        """
+        if OTHER_FORM not in forms:
+            raise ValueError(f"falta la variante '{OTHER_FORM}'")
+        self.forms = {key: compile_message(value, language) for key, value in forms.items()}
+        # Variantes "=N" por número, para no construir la clave en cada uso
+        self.exact = {}
+        for key, form in self.forms.items():
+            if key.startswith('='):
+                try:
+                    self.exact[int(key[1:])] = form
+                except ValueError:
+                    raise ValueError(f"variante no válida: '{key}'")
+        self.plural = PLURAL_RULES.get(language, _plural_one_other)
+        self.default = self.forms[OTHER_FORM]
+        self.text = self.default.text
+
+    def select(self, kwargs):
+        """Elige la variante para los argumentos.
+
+        Args:
+            kwargs (dict): Argumentos del texto
+
+        Returns:
+            Template or MessageForms: Variante elegida
+        """
+        count = kwargs.get(COUNT_ARG)
+        if count is not None:
+            form = self.exact.get(count) if self.exact else None
+            if form is not None:
+                return form
+            category = self.plural(count)
+            # 'other' es también la variante por defecto: antes se mira el género
+            if category != OTHER_FORM:
+                form = self.forms.get(category)
+                if form is not None:
+                    return form
+        gender = kwargs.get(GENDER_ARG)
+        if gender is not None:
+            form = self.forms.get(gender)
+            if form is not None:
+                return form
+        return self.default
+
+    def render(self, kwargs):
+        """Rellena la variante que corresponde a los argumentos.
+
+        Args:
+            kwargs (dict): Argumentos del texto
+
+        Returns:
+            str: Texto formateado
+        """
+        return self.select(kwargs).render(kwargs)
+
+
+def compile_message(message, language):
+    """Compila un texto del catálogo.
+
+    Args:
+        message (str or dict): Texto o variantes del catálogo
+        language (str): Idioma del texto
+
+    Returns:
+        Template or MessageForms: Texto compilado
+
+    Raises:
+        ValueError: Si el texto no es válido
+    """
+    if isinstance(message, dict):
+        return MessageForms(message, language)
+    return Template(str(message))
+
+
+def _default_text(message):
+    """Texto de la variante 'other' (el propio texto si no tiene variantes)."""
+    while isinstance(message, dict):
+        message = message.get(OTHER_FORM, '')
+    return message
 
 
 class I18n:
     """Clase para gestionar la internacionalización de la aplicación."""
 
-    def __init__(self, default_language='es'):
+    def __init__(self, default_language='es', cache_dir=None, disk_cache=True):
         """Inicializa el sistema de internacionalización.
 
         Args:
             default_language (str): Idioma por defecto ('es' o 'en')
+            cache_dir (str, optional): Directorio de la caché de catálogos;
+                por defecto <caché del usuario>/translations
+            disk_cache (bool): Guardar y reutilizar los catálogos en disco
         """
         self.logger = logging.getLogger(__name__)
         self.default_language = default_language
         self.current_language = default_language
+        self.disk_cache = disk_cache
+        self._cache_dir = cache_dir
+        self._cache_ready = False
+        # {idioma: catálogo}, solo de los idiomas ya cargados
         self.translations = {}
-        self._load_translations()
+        # {idioma: {clave: texto sin formatear}} y {idioma: {clave: texto compilado}}
+        self._plain = {}
+        self._compiled = {}
+        # Los del idioma activo, resueltos en set_language
+        self._texts = {}
+        self._templates = {}
+        # Contadores: JSON interpretados y catálogos leídos de la caché
+        self.parsed = 0
+        self.cache_hits = 0
+        if not self.set_language(default_language):
+            self.logger.warning(f"Idioma no disponible: {default_language}")
+            self.set_language(LANGUAGES[0])
+        self.logger.info(f"Traducciones cargadas correctamente ({self.current_language})")
 
-    def _load_translations(self):
-        """Carga los archivos de traducción disponibles."""
-        try:
-            # Directorio de traducciones relativo al directorio actual
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            translations_dir = os.path.join(base_dir, 'resources', 'translations')
-            
-            # Cargar cada archivo de traducción
-            for lang in ['es', 'en']:
-                lang_file = os.path.join(translations_dir, f"{lang}.json")
-                
-                # Si el archivo no existe, crearlo con traducciones básicas
-                if not os.path.exists(lang_file):
-                    self._create_default_translation(lang_file, lang)
-                
-                with open(lang_file, 'r', encoding='utf-8') as f:
-                    self.translations[lang] = json.load(f)
-                    
-            self.logger.info("Traducciones cargadas correctamente")
-        except Exception as e:
-            self.logger.error(f"Error al cargar traducciones: {str(e)}")
-            # Crear traducciones por defecto en memoria
-            self._create_default_translations_in_memory()
-
-    def _create_default_translation(self, file_path, language):
-        """Crea un archivo de traducción por defecto.
+    def _load_translations(self, language):
+        """Carga el catálogo de un idioma desde la caché o desde su JSON.
 
         Args:
-            file_path (str): Ruta del archivo a crear
-            language (str): Idioma ('es' o 'en')
+            language (str): Código del idioma
+
+        Returns:
+            dict: Catálogo del idioma
+        """
+        resource = f"{TRANSLATIONS_DIR}/{language}.json"
+        try:
+            stamp = self._source_stamp(resource)
+            cached = self._read_cache(language)
+            # Mismo archivo que cuando se guardó la caché: no hace falta leerlo
+            if cached is not None and stamp is not None and cached[0] == stamp:
+                self.cache_hits += 1
+                return cached[2]
+
+            data = read_resource(resource)
+            digest = hashlib.sha1(data).hexdigest()
+            if cached is not None and cached[1] == digest:
+                # Contenido igual con otra fecha (reinstalación, copia...)
+                self.cache_hits += 1
+                if stamp is not None:
+                    self._write_cache(language, stamp, digest, cached[2])
+                return cached[2]
+
+            catalog = json.loads(data.decode('utf-8'))
+            if not isinstance(catalog, dict):
+                raise ValueError(f"{resource} no contiene un objeto")
+            self.parsed += 1
+            self._write_cache(language, stamp, digest, catalog)
+            return catalog
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error al cargar la traducción '{language}': {str(e)}")
+            # Textos por defecto en memoria; los recursos no se modifican
+            return self._get_default_translations(language)
+
+    def _source_stamp(self, resource):
+        """Fecha de modificación y tamaño del JSON de origen.
+
+        Returns:
+            tuple: (mtime_ns, tamaño), o None si se lee del módulo compilado
+
+        Raises:
+            OSError: Si el archivo no existe
         """
-        # Asegurar que el directorio existe
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Crear traducciones básicas según el idioma
-        translations = self._get_default_translations(language)
-        
-        # Guardar el archivo
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(translations, f, indent=4, ensure_ascii=False)
-
-    def _create_default_translations_in_memory(self):
-        """Crea traducciones por defecto en memoria si no se pueden cargar los archivos."""
-        for lang in ['es', 'en']:
-            self.translations[lang] = self._get_default_translations(lang)
+        if is_bundled():
+            return None
+        st = os.stat(get_resource_path(resource))
+        return (st.st_mtime_ns, st.st_size)
+
+    def _cache_path(self, language):
+        """Ruta del catálogo en caché, o None si la caché no está disponible."""
+        if not self.disk_cache:
+            return None
+        if self._cache_dir is None:
+            try:
+                self._cache_dir = os.path.join(get_cache_dir(), TRANSLATIONS_DIR)
+            except OSError as e:
+                self.logger.warning(f"Caché de traducciones desactivada: {str(e)}")
+                self.disk_cache = False
+                return None
+        return os.path.join(self._cache_dir, f'{language}.marshal')
+
+    def _read_cache(self, language):
+        """Lee un catálogo de la caché.
+
+        Returns:
+            tuple: (sello del origen, hash del origen, catálogo), o None si no
+                hay caché válida
+        """
+        path = self._cache_path(language)
+        if path is None:
+            return None
+        try:
+            # marshal.load() sobre el archivo lee a trozos; es mucho más lento
+            with open(path, 'rb') as f:
+                entry = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (not isinstance(entry, tuple) or len(entry) != 5
+                or entry[:2] != (CACHE_VERSION, marshal.version)):
+            return None
+        return entry[2:]
+
+    def _write_cache(self, language, stamp, digest, catalog):
+        """Guarda un catálogo en la caché de forma atómica."""
+        path = self._cache_path(language)
+        if path is None:
+            return
+        temporary = f'{path}.{os.getpid()}.tmp'
+        try:
+            if not self._cache_ready:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                self._cache_ready = True
+            with open(temporary, 'wb') as f:
+                f.write(marshal.dumps((CACHE_VERSION, marshal.version, stamp, digest, catalog)))
+            os.replace(temporary, path)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"No se pudo guardar la traducción en caché: {str(e)}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
 
     def _get_default_translations(self, language):
         """Obtiene las traducciones por defecto para un idioma.
@@ -164,45 +451,70 @@ class I18n:
     def set_language(self, language):
         """Establece el idioma actual.
 
+        El catálogo del idioma se carga la primera vez que se selecciona.
+
         Args:
             language (str): Idioma a establecer ('es' o 'en')
 
         Returns:
             bool: True si se cambió correctamente, False en caso contrario
         """
-        if language in self.translations:
-            self.current_language = language
-            return True
-        return False
+        if language not in LANGUAGES:
+            return False
+        if language not in self.translations:
+            catalog = self.translations[language] = self._load_translations(language)
+            if all(isinstance(value, str) for value in catalog.values()):
+                self._plain[language] = catalog
+            else:
+                self._plain[language] = {key: _default_text(value) for key, value in catalog.items()}
+            self._compiled[language] = {}
+        self.current_language = language
+        self._texts = self._plain[language]
+        self._templates = self._compiled[language]
+        return True
 
     def get_text(self, key, **kwargs):
         """Obtiene un texto traducido.
 
         Args:
             key (str): Clave del texto a traducir
-            **kwargs: Variables para formatear en el texto
+            **kwargs: Variables para formatear en el texto; count y gender
+                eligen además la variante de los textos que las tienen
 
         Returns:
             str: Texto traducido
         """
-        # Obtener el diccionario del idioma actual o el predeterminado
-        lang_dict = self.translations.get(
-            self.current_language,
-            self.translations.get(self.default_language, {})
-        )
-        
-        # Obtener el texto o la clave si no existe
-        text = lang_dict.get(key, key)
-        
-        # Formatear el texto si hay variables
-        if kwargs:
-            try:
-                return text.format(**kwargs)
-            except KeyError as e:
-                self.logger.error(f"Error al formatear texto '{key}': {str(e)}")
-                return text
-        
-        return text
+        if not kwargs:
+            # Texto o clave si no existe
+            return self._texts.get(key, key)
+
+        template = self._templates.get(key)
+        if template is None:
+            template = self._compile(key)
+        try:
+            return template.render(kwargs)
+        except (KeyError, IndexError, ValueError) as e:
+            self.logger.error(f"Error al formatear texto '{key}': {str(e)}")
+            return template.text
+
+    def _compile(self, key):
+        """Compila un texto del idioma activo y lo guarda en su caché.
+
+        Args:
+            key (str): Clave del texto
+
+        Returns:
+            Template or MessageForms: Texto compilado
+        """
+        message = self.translations[self.current_language].get(key, key)
+        try:
+            template = compile_message(message, self.current_language)
+        except ValueError as e:
+            self.logger.error(f"Texto mal formado '{key}': {str(e)}")
+            # Se devuelve tal cual, sin formatear
+            template = Template(_default_text(message).replace('{', '{{').replace('}', '}}'))
+        self._templates[key] = template
+        return template
 
     def get_available_languages(self):
         """Obtiene los idiomas disponibles.
@@ -210,7 +522,7 @@ class I18n:
         Returns:
             list: Lista de idiomas disponibles
         """
-        return list(self.translations.keys())
+        return list(LANGUAGES)
 
     def get_language_name(self, language_code):
         """Obtiene el nombre del idioma a partir de su código.
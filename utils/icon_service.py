@@ -0,0 +1,210 @@
+"""
+Servicio de iconos de la aplicación.
+
+Los iconos de resources/icons son SVG. Este módulo rasteriza cada uno una
+sola vez por tamaño y relación de píxeles del dispositivo (DPR) y guarda el
+resultado en una caché compartida por todo el proceso, de modo que las
+vistas no vuelven a interpretar el SVG ni a escalar pixmaps al construirse.
+Opcionalmente, los rásteres se guardan como PNG en el directorio de caché
+del usuario con el hash del contenido del SVG en el nombre: los arranques
+posteriores cargan el PNG sin interpretar el SVG, y un SVG modificado
+genera un nombre nuevo. Los SVG se leen a través de utils/resources, así
+que en la aplicación empaquetada salen del módulo de recursos compilado.
+"""
+
+import hashlib
+import logging
+import os
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap
+from PyQt5.QtSvg import QSvgRenderer
+
+from utils.paths import get_cache_dir
+from utils.resources import read_resource, resource_exists, resource_location
+
+# Subdirectorio de los iconos dentro de resources y de la caché en disco
+ICONS_DIR = 'icons'
+# Tamaños lógicos (px) con los que se construye un QIcon por defecto
+ICON_SIZES = (16,)
+
+
+class IconService:
+    """Rasteriza los iconos SVG con caché en memoria y, opcionalmente, en disco."""
+
+    def __init__(self, cache_dir=None, disk_cache=True):
+        """Inicializa el servicio de iconos.
+
+        Args:
+            cache_dir (str, optional): Directorio de la caché en disco; por
+                defecto <caché del usuario>/icons
+            disk_cache (bool): Guardar y reutilizar los rásteres en disco
+        """
+        self.logger = logging.getLogger(__name__)
+        self.disk_cache = disk_cache
+        self._cache_dir = cache_dir
+        self._cache_ready = False
+        # {(nombre, tamaño, dpr): QPixmap}
+        self._pixmaps = {}
+        # {(nombre, tamaños, dpr): QIcon}
+        self._icons = {}
+        # {nombre: hash del SVG}
+        self._digests = {}
+        # Contadores: SVG rasterizados y rásteres leídos de disco
+        self.rasterized = 0
+        self.disk_hits = 0
+
+    def has_icon(self, name):
+        """Indica si existe un icono en resources/icons.
+
+        Args:
+            name (str): Nombre del archivo, p. ej. 'app_icon.svg'
+
+        Returns:
+            bool: True si existe
+        """
+        return resource_exists(f'{ICONS_DIR}/{name}')
+
+    def device_pixel_ratio(self):
+        """Relación de píxeles del dispositivo de la aplicación (1.0 sin aplicación)."""
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def pixmap(self, name, size, dpr=None):
+        """Obtiene un icono rasterizado a un tamaño lógico.
+
+        Args:
+            name (str): Nombre del archivo SVG
+            size (int): Lado en píxeles lógicos
+            dpr (float, optional): Relación de píxeles; por defecto la de la aplicación
+
+        Returns:
+            QPixmap: Pixmap de size*dpr píxeles con su devicePixelRatio
+        """
+        if dpr is None:
+            dpr = self.device_pixel_ratio()
+        key = (name, size, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(self._load(name, round(size * dpr)))
+            pixmap.setDevicePixelRatio(dpr)
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def icon(self, name, sizes=ICON_SIZES, dpr=None):
+        """Obtiene un QIcon con el icono rasterizado a los tamaños indicados.
+
+        Qt escala el ráster más cercano si se pide otro tamaño, así que
+        conviene indicar los tamaños a los que se muestra el icono.
+
+        Args:
+            name (str): Nombre del archivo SVG
+            sizes (tuple): Tamaños lógicos en píxeles
+            dpr (float, optional): Relación de píxeles; por defecto la de la aplicación
+
+        Returns:
+            QIcon: Icono compartido (no debe modificarse)
+        """
+        if dpr is None:
+            dpr = self.device_pixel_ratio()
+        key = (name, tuple(sizes), dpr)
+        icon = self._icons.get(key)
+        if icon is None:
+            icon = QIcon()
+            for size in sizes:
+                icon.addPixmap(self.pixmap(name, size, dpr))
+            self._icons[key] = icon
+        return icon
+
+    def clear_cache(self):
+        """Vacía la caché en memoria (la de disco se invalida sola por hash)."""
+        self._pixmaps.clear()
+        self._icons.clear()
+        self._digests.clear()
+
+    def _load(self, name, pixels):
+        """Ráster de pixels x pixels desde la caché en disco o desde el SVG."""
+        try:
+            digest = self._digest(name)
+        except OSError as e:
+            self.logger.warning(f"No se pudo cargar el icono {name}: {str(e)}")
+            image = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.transparent)
+            return image
+
+        cached = self._disk_path(name, digest, pixels)
+        if cached is not None and os.path.exists(cached):
+            image = QImage(cached)
+            if not image.isNull():
+                self.disk_hits += 1
+                return image
+
+        image = self._rasterize(name, pixels)
+        if cached is not None:
+            self._save(image, cached)
+        return image
+
+    def _digest(self, name):
+        """Hash del contenido del SVG, calculado una sola vez por icono."""
+        digest = self._digests.get(name)
+        if digest is None:
+            data = read_resource(f'{ICONS_DIR}/{name}')
+            digest = self._digests[name] = hashlib.sha1(data).hexdigest()[:16]
+        return digest
+
+    def _rasterize(self, name, pixels):
+        """Dibuja el SVG centrado y sin deformar en una imagen transparente."""
+        image = QImage(pixels, pixels, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        # Desde su ubicación, para resolver las imágenes que enlaza el SVG
+        renderer = QSvgRenderer(resource_location(f'{ICONS_DIR}/{name}'))
+        if not renderer.isValid():
+            self.logger.warning(f"No se pudo interpretar el icono: {name}")
+            return image
+
+        width, height = renderer.defaultSize().width(), renderer.defaultSize().height()
+        scale = pixels / max(width, height, 1)
+        target = QRectF(
+            (pixels - width * scale) / 2, (pixels - height * scale) / 2,
+            width * scale, height * scale
+        )
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        renderer.render(painter, target)
+        painter.end()
+        self.rasterized += 1
+        return image
+
+    def _disk_path(self, name, digest, pixels):
+        """Ruta del ráster en disco, o None si la caché en disco no está disponible."""
+        if not self.disk_cache:
+            return None
+        try:
+            if not self._cache_ready:
+                if self._cache_dir is None:
+                    self._cache_dir = os.path.join(get_cache_dir(), ICONS_DIR)
+                os.makedirs(self._cache_dir, exist_ok=True)
+                self._cache_ready = True
+        except OSError as e:
+            self.logger.warning(f"Caché de iconos en disco desactivada: {str(e)}")
+            self.disk_cache = False
+            return None
+        stem = os.path.splitext(name)[0]
+        return os.path.join(self._cache_dir, f'{stem}-{digest}-{pixels}.png')
+
+    def _save(self, image, cached):
+        """Guarda un ráster de forma atómica para no dejar PNG a medias."""
+        temporary = f'{cached}.{os.getpid()}.tmp'
+        try:
+            if not image.save(temporary, 'PNG'):
+                raise OSError(f"no se pudo escribir {temporary}")
+            os.replace(temporary, cached)
+        except OSError as e:
+            self.logger.debug(f"No se pudo guardar el icono en caché: {str(e)}")
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+
+# Servicio compartido por todo el proceso
+icon_service = IconService()
@@ -0,0 +1,405 @@
+"""
+Comunicación entre procesos para mantener una única instancia de EnergyPy.
+
+La instancia en ejecución (interfaz gráfica o daemon) escucha en un socket
+local; los lanzamientos posteriores y la CLI le envían sus órdenes en lugar
+de crear un segundo planificador. En Linux/macOS se usa un socket AF_UNIX
+en el directorio de configuración del usuario; en Windows, TCP en 127.0.0.1
+con el puerto y un token aleatorio guardados en un archivo del usuario.
+
+Protocolo: una petición por conexión, como una línea JSON:
+    {"command": "status", "args": {}}
+La respuesta es otra línea JSON:
+    {"ok": true, "result": {...}}  o  {"ok": false, "error": "..."}
+"""
+
+# json y logging se importan al usarse: `cli.py status` sin instancia en
+# ejecución solo necesita comprobar que no hay nadie escuchando
+import os
+import socket
+import time
+
+# Segundos máximos de espera de una petición o respuesta
+DEFAULT_TIMEOUT = 2.0
+# Tamaño máximo (bytes) de una línea del protocolo
+MAX_MESSAGE_SIZE = 65536
+# Conexiones aceptadas que pueden esperar a la vez a completar su petición
+MAX_CLIENTS = 8
+
+USE_UNIX_SOCKET = hasattr(socket, 'AF_UNIX')
+
+
+def ipc_path(config_dir):
+    """Ruta del socket (AF_UNIX) o del archivo de conexión (TCP).
+
+    Args:
+        config_dir (str): Directorio de configuración del usuario
+
+    Returns:
+        str: Ruta a utilizar
+    """
+    if USE_UNIX_SOCKET:
+        return os.path.join(config_dir, 'energypy.sock')
+    return os.path.join(config_dir, 'energypy.ipc')
+
+
+def _decode_line(data):
+    """Decodifica una línea del protocolo.
+
+    Returns:
+        dict: Mensaje decodificado o None si no hay datos
+
+    Raises:
+        ValueError: Si el mensaje no es JSON válido
+    """
+    if not data:
+        return None
+    import json
+
+    return json.loads(data.decode('utf-8'))
+
+
+def _read_line(conn):
+    """Lee una línea del protocolo de una conexión bloqueante.
+
+    Returns:
+        dict: Mensaje decodificado o None si la conexión se cerró sin datos
+
+    Raises:
+        ValueError: Si el mensaje es demasiado grande o no es JSON válido
+        OSError: Si la conexión falla o vence el tiempo de espera
+    """
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(4096)
+        if not chunk:
+            break
+        data += chunk
+        if len(data) > MAX_MESSAGE_SIZE:
+            raise ValueError("Mensaje demasiado grande")
+    return _decode_line(data)
+
+
+def _write_line(conn, message):
+    """Envía un mensaje del protocolo por una conexión."""
+    import json
+
+    conn.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def _connect(path, timeout):
+    """Conecta con la instancia en ejecución.
+
+    Returns:
+        tuple: (socket, token) o (None, None) si no hay ninguna instancia
+    """
+    try:
+        if USE_UNIX_SOCKET:
+            conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            token = None
+            address = path
+        else:
+            import json
+
+            with open(path, 'r', encoding='utf-8') as f:
+                info = json.load(f)
+            conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            token = info['token']
+            address = ('127.0.0.1', info['port'])
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+    conn.settimeout(timeout)
+    try:
+        conn.connect(address)
+    except OSError:
+        conn.close()
+        return None, None
+    return conn, token
+
+
+def send_command(config_dir, command, args=None, timeout=DEFAULT_TIMEOUT):
+    """Envía una orden a la instancia en ejecución.
+
+    Args:
+        config_dir (str): Directorio de configuración del usuario
+        command (str): Orden ('show', 'schedule', 'cancel' o 'status')
+        args (dict, optional): Argumentos de la orden
+        timeout (float): Segundos máximos de espera
+
+    Returns:
+        dict: Respuesta de la instancia o None si no hay ninguna en ejecución
+    """
+    conn, token = _connect(ipc_path(config_dir), timeout)
+    if conn is None:
+        return None
+
+    try:
+        request = {'command': command, 'args': args or {}}
+        if token is not None:
+            request['token'] = token
+        _write_line(conn, request)
+        response = _read_line(conn)
+        if response is None:
+            raise ValueError("conexión cerrada")
+        return response
+    except (OSError, ValueError) as e:
+        return {'ok': False, 'error': f"Sin respuesta de la instancia en ejecución: {str(e)}"}
+    finally:
+        conn.close()
+
+
+class IpcServer:
+    """Servidor local de órdenes de la instancia en ejecución."""
+
+    def __init__(self, config_dir, handler=None, timeout=DEFAULT_TIMEOUT):
+        """Inicializa el servidor.
+
+        Args:
+            config_dir (str): Directorio de configuración del usuario
+            handler (callable, optional): handler(command, args) -> dict de respuesta
+            timeout (float): Segundos máximos de espera de cada petición
+        """
+        import logging
+
+        self.logger = logging.getLogger(__name__)
+        self.path = ipc_path(config_dir)
+        self.handler = handler
+        self.timeout = timeout
+        self.sock = None
+        self._token = None
+        # Conexiones aceptadas pendientes de su petición: {socket: [datos, fecha límite]}
+        self._clients = {}
+        self._add_reader = None
+        self._remove_reader = None
+
+    def listen(self):
+        """Empieza a escuchar si no hay otra instancia en ejecución.
+
+        Returns:
+            bool: True si esta es la única instancia, False si ya hay otra
+        """
+        if USE_UNIX_SOCKET:
+            return self._listen_unix()
+        return self._listen_tcp()
+
+    def _socket_lock(self):
+        """Cerrojo (flock) que serializa la creación y el borrado del socket.
+
+        Sin él, un lanzamiento simultáneo podría tomar por huérfano el
+        socket que otro acaba de crear y borrarlo antes de que escuche.
+
+        Returns:
+            file: Archivo de cerrojo bloqueado; se libera al cerrarlo
+        """
+        import fcntl
+
+        lock = open(f"{self.path}.lock", 'a')
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        except OSError:
+            lock.close()
+            raise
+        return lock
+
+    def _listen_unix(self):
+        with self._socket_lock():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.bind(self.path)
+            except OSError:
+                # El socket existe: o bien hay una instancia viva, o bien quedó
+                # huérfano tras un cierre inesperado
+                conn, _ = _connect(self.path, self.timeout)
+                if conn is not None:
+                    conn.close()
+                    sock.close()
+                    return False
+                try:
+                    os.unlink(self.path)
+                except FileNotFoundError:
+                    pass
+                try:
+                    sock.bind(self.path)
+                except OSError as e:
+                    self.logger.error(f"No se pudo crear el socket {self.path}: {str(e)}")
+                    sock.close()
+                    return False
+            os.chmod(self.path, 0o600)
+            # Escuchar antes de soltar el cerrojo: quien compruebe después
+            # encontrará una instancia viva
+            self._start(sock)
+        return True
+
+    def _listen_tcp(self):
+        import json
+
+        conn, _ = _connect(self.path, self.timeout)
+        if conn is not None:
+            conn.close()
+            return False
+
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(('127.0.0.1', 0))
+        self._token = os.urandom(16).hex()
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'port': sock.getsockname()[1], 'token': self._token, 'pid': os.getpid()}, f)
+        self._start(sock)
+        return True
+
+    def _start(self, sock):
+        sock.listen(8)
+        sock.setblocking(False)
+        self.sock = sock
+        self.logger.info(f"Escuchando órdenes en {self.path}")
+
+    def fileno(self):
+        """Descriptor del socket, para integrarlo en un bucle de eventos."""
+        return self.sock.fileno()
+
+    def attach(self, add_reader, remove_reader):
+        """Integra el servidor en el bucle de eventos de la instancia.
+
+        El socket de escucha y cada conexión aceptada se vigilan por
+        separado, de modo que un cliente lento nunca bloquea el bucle
+        (QSocketNotifier en la interfaz, EventLoop en el daemon).
+
+        Args:
+            add_reader (callable): add_reader(sock, callback) invoca
+                callback(sock) cada vez que sock es legible
+            remove_reader (callable): remove_reader(sock) deja de vigilarlo
+        """
+        self._add_reader = add_reader
+        self._remove_reader = remove_reader
+        add_reader(self.sock, lambda sock: self.process_pending())
+
+    def process_pending(self):
+        """Acepta todas las conexiones pendientes sin esperar sus peticiones.
+
+        Cada conexión se lee cuando el bucle indica que es legible; las que
+        superan el tiempo de espera o exceden MAX_CLIENTS se cierran.
+
+        Returns:
+            int: Número de conexiones aceptadas
+        """
+        accepted = 0
+        while self.sock is not None:
+            try:
+                conn, _ = self.sock.accept()
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                self.logger.error(f"Error al aceptar una conexión: {str(e)}")
+                break
+            accepted += 1
+            conn.setblocking(False)
+            self._clients[conn] = [b'', time.monotonic() + self.timeout]
+            if self._add_reader is not None:
+                self._add_reader(conn, self._on_client_readable)
+            # Lo habitual es que la petición ya haya llegado
+            self._on_client_readable(conn)
+
+        self._expire_clients()
+        return accepted
+
+    def _expire_clients(self):
+        """Cierra las conexiones vencidas y las más antiguas si sobran."""
+        now = time.monotonic()
+        for conn, (_, deadline) in list(self._clients.items()):
+            if deadline <= now:
+                self.logger.warning("Petición incompleta: tiempo de espera agotado")
+                self._drop_client(conn)
+        while len(self._clients) > MAX_CLIENTS:
+            self.logger.warning("Demasiadas conexiones pendientes, se cierra la más antigua")
+            self._drop_client(next(iter(self._clients)))
+
+    def _release_client(self, conn):
+        """Deja de vigilar una conexión aceptada."""
+        if self._clients.pop(conn, None) is not None and self._remove_reader is not None:
+            self._remove_reader(conn)
+
+    def _drop_client(self, conn):
+        """Deja de vigilar una conexión y la cierra."""
+        self._release_client(conn)
+        conn.close()
+
+    def _on_client_readable(self, conn):
+        """Lee lo disponible de una conexión y la atiende al completar la línea."""
+        state = self._clients.get(conn)
+        if state is None:
+            return
+        try:
+            chunk = conn.recv(4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            self.logger.warning(f"Petición inválida: {str(e)}")
+            self._drop_client(conn)
+            return
+
+        if chunk:
+            state[0] += chunk
+            if len(state[0]) > MAX_MESSAGE_SIZE:
+                self.logger.warning("Petición inválida: Mensaje demasiado grande")
+                self._drop_client(conn)
+                return
+            if not state[0].endswith(b'\n'):
+                return
+
+        data = state[0]
+        self._release_client(conn)
+        with conn:
+            self._serve(conn, data)
+
+    def _serve(self, conn, data):
+        """Despacha una petición completa y envía la respuesta."""
+        try:
+            request = _decode_line(data)
+        except ValueError as e:
+            self.logger.warning(f"Petición inválida: {str(e)}")
+            return
+        if request is None:
+            # Comprobación de instancia viva: se conecta y cierra sin datos
+            return
+
+        if self._token is not None and request.get('token') != self._token:
+            response = {'ok': False, 'error': "Token inválido"}
+        elif self.handler is None:
+            response = {'ok': False, 'error': "La instancia aún se está iniciando"}
+        else:
+            try:
+                response = self.handler(request.get('command'), request.get('args') or {})
+            except Exception as e:
+                self.logger.error(f"Error al atender la orden {request.get('command')}: {str(e)}")
+                response = {'ok': False, 'error': str(e)}
+
+        # La respuesta cabe en el búfer del socket: el envío no espera al cliente
+        conn.settimeout(self.timeout)
+        try:
+            _write_line(conn, response)
+        except OSError as e:
+            self.logger.warning(f"No se pudo enviar la respuesta: {str(e)}")
+
+    def close(self):
+        """Deja de escuchar y elimina el socket o el archivo de conexión."""
+        if self.sock is None:
+            return
+        for conn in list(self._clients):
+            self._drop_client(conn)
+        if self._remove_reader is not None:
+            self._remove_reader(self.sock)
+        if USE_UNIX_SOCKET:
+            # Bajo el cerrojo, para no borrar el socket de una instancia nueva
+            with self._socket_lock():
+                self._unlink()
+        else:
+            self._unlink()
+
+    def _unlink(self):
+        """Cierra el socket de escucha y elimina su ruta."""
+        self.sock.close()
+        self.sock = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
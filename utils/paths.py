@@ -2,7 +2,6 @@
 
 import os
 import sys
-import platform
 
 def get_app_dir():
     """
@@ -13,10 +12,37 @@ def get_app_dir():
         return os.path.dirname(sys.executable)
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+def get_user_config_dir(create=True):
+    """
+    Obtiene el directorio de configuración del usuario (config.json, diario
+    de acciones y socket de instancia única).
+    
+    No carga la configuración, de modo que la CLI puede localizar el diario
+    y el socket sin el coste de construir ConfigModel.
+    
+    Args:
+        create: Si es True, crea el directorio cuando no existe
+        
+    Returns:
+        Ruta del directorio
+    """
+    home = os.path.expanduser('~')
+    
+    if os.name == 'nt':  # Windows
+        config_dir = os.path.join(home, 'AppData', 'Local', 'EnergyPy')
+    else:  # Linux/macOS
+        config_dir = os.path.join(home, '.config', 'energypy')
+    
+    if create:
+        os.makedirs(config_dir, exist_ok=True)
+    return config_dir
+
 def get_config_dir():
     """
     Obtiene el directorio de configuración específico de la plataforma.
     """
+    import platform
+
     system = platform.system()
     app_name = "EnergyPy"
     
@@ -30,6 +56,30 @@ def get_config_dir():
     os.makedirs(base_dir, exist_ok=True)
     return base_dir
 
+def get_cache_dir():
+    """
+    Obtiene el directorio de caché específico de la plataforma.
+    
+    Los archivos de este directorio se pueden regenerar en cualquier momento.
+    """
+    import platform
+
+    system = platform.system()
+    app_name = "EnergyPy"
+    
+    if system == "Windows":
+        base_dir = os.path.join(
+            os.environ.get("LOCALAPPDATA") or os.environ["APPDATA"], app_name, "Cache"
+        )
+    elif system == "Darwin":
+        base_dir = os.path.expanduser(f"~/Library/Caches/{app_name}")
+    else:  # Linux y otros
+        xdg_cache = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+        base_dir = os.path.join(xdg_cache, app_name)
+    
+    os.makedirs(base_dir, exist_ok=True)
+    return base_dir
+
 def get_resource_path(relative_path):
     """
     Obtiene la ruta absoluta a un recurso, funcionando tanto en desarrollo como en producción.
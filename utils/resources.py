@@ -0,0 +1,246 @@
+"""
+Acceso a los recursos de la aplicación.
+
+Los iconos, hojas de estilo y traducciones se empaquetan en tiempo de
+construcción (python build.py --resources) en un archivo binario de recursos
+de Qt, resources.rcc, que se registra una sola vez con
+QResource.registerResource: Qt lo proyecta en memoria y solo lee las páginas
+de los recursos que se usan, sin importar ni ejecutar código Python. En la
+aplicación empaquetada no se abre un archivo suelto del directorio temporal
+de PyInstaller por cada recurso. En desarrollo (o si falta el archivo) se
+leen los archivos sueltos de resources/.
+
+Las rutas son relativas a resources/, como en get_resource_path. La
+variable de entorno ENERGYPY_RESOURCES fuerza el origen ('bundle' o
+'files').
+"""
+
+import logging
+import os
+import platform
+import struct
+import sys
+import tempfile
+
+from utils.paths import get_app_dir, get_resource_path
+
+# Archivo binario de recursos generado por build.py
+RESOURCE_FILE = 'resources.rcc'
+# Versión del formato rcc que se escribe (la 2 incluye fechas de modificación)
+RCC_FORMAT_VERSION = 2
+# Subdirectorios de resources que se leen al ejecutar y se empaquetan
+BUNDLED_DIRS = ('icons', 'styles', 'translations')
+# Archivos sueltos que también se empaquetan (app_icon.svg enlaza icon.png)
+BUNDLED_FILES = ('icon.png',)
+# Variable de entorno que fuerza el origen de los recursos
+SOURCE_ENV = 'ENERGYPY_RESOURCES'
+
+logger = logging.getLogger(__name__)
+
+# None hasta la primera consulta; después, si se usa el módulo compilado
+_bundled = None
+
+
+def is_bundled():
+    """Indica si los recursos se leen del módulo compilado.
+
+    Se usa en la aplicación empaquetada (o con ENERGYPY_RESOURCES=bundle)
+    siempre que el archivo de recursos esté disponible.
+
+    Returns:
+        bool: True si se lee del archivo compilado, False si de los sueltos
+    """
+    global _bundled
+    if _bundled is None:
+        source = os.environ.get(SOURCE_ENV)
+        wanted = source == 'bundle' or (source != 'files' and getattr(sys, 'frozen', False))
+        _bundled = False
+        if wanted:
+            from PyQt5.QtCore import QResource
+            path = resource_file()
+            if QResource.registerResource(path):
+                _bundled = True
+            else:
+                logger.warning(f"No se pudo registrar {path}; se usan los archivos de resources/")
+    return _bundled
+
+
+def resource_file():
+    """Ruta del archivo binario de recursos.
+
+    Returns:
+        str: Junto a los datos de PyInstaller en la aplicación empaquetada o
+            en el directorio de la aplicación en desarrollo
+    """
+    return os.path.join(getattr(sys, '_MEIPASS', get_app_dir()), RESOURCE_FILE)
+
+
+def window_icon_file():
+    """Nombre del icono de la ventana para la plataforma actual.
+
+    Returns:
+        str: 'icon.ico' en Windows, 'icon.icns' en macOS e 'icon.png' en el resto
+    """
+    system = platform.system()
+    if system == "Windows":
+        return "icon.ico"
+    if system == "Darwin":  # macOS
+        return "icon.icns"
+    return "icon.png"  # Linux y otros
+
+
+def resource_location(relative_path):
+    """Ubicación de un recurso entendible por Qt (QSS, QIcon, QImage...).
+
+    Args:
+        relative_path (str): Ruta relativa a resources/
+
+    Returns:
+        str: ':/<ruta>' con el módulo compilado o la ruta absoluta al archivo
+    """
+    if is_bundled():
+        return ':/' + relative_path.replace(os.sep, '/')
+    return get_resource_path(relative_path)
+
+
+def read_resource(relative_path):
+    """Lee el contenido de un recurso.
+
+    Args:
+        relative_path (str): Ruta relativa a resources/
+
+    Returns:
+        bytes: Contenido del recurso
+
+    Raises:
+        OSError: Si el recurso no existe o no se puede leer
+    """
+    if is_bundled():
+        from PyQt5.QtCore import QFile, QIODevice
+        resource = QFile(resource_location(relative_path))
+        if not resource.open(QIODevice.ReadOnly):
+            raise FileNotFoundError(f"Recurso no encontrado: {relative_path}")
+        try:
+            return bytes(resource.readAll())
+        finally:
+            resource.close()
+    with open(get_resource_path(relative_path), 'rb') as f:
+        return f.read()
+
+
+def read_text(relative_path):
+    """Lee un recurso de texto en UTF-8.
+
+    Args:
+        relative_path (str): Ruta relativa a resources/
+
+    Returns:
+        str: Contenido del recurso
+
+    Raises:
+        OSError: Si el recurso no existe o no se puede leer
+    """
+    return read_resource(relative_path).decode('utf-8')
+
+
+def resource_exists(relative_path):
+    """Indica si existe un recurso.
+
+    Args:
+        relative_path (str): Ruta relativa a resources/
+
+    Returns:
+        bool: True si existe
+    """
+    if is_bundled():
+        from PyQt5.QtCore import QFile
+        return QFile.exists(resource_location(relative_path))
+    return os.path.exists(get_resource_path(relative_path))
+
+
+def list_resources(relative_dir):
+    """Nombres de los archivos de un directorio de recursos.
+
+    Args:
+        relative_dir (str): Directorio relativo a resources/
+
+    Returns:
+        list: Nombres de archivo (vacía si el directorio no existe)
+    """
+    if is_bundled():
+        from PyQt5.QtCore import QDir
+        return sorted(QDir(resource_location(relative_dir)).entryList(QDir.Files))
+    directory = get_resource_path(relative_dir)
+    try:
+        return sorted(name for name in os.listdir(directory)
+                      if os.path.isfile(os.path.join(directory, name)))
+    except OSError:
+        return []
+
+
+def compile_resources(output=None, resources_dir=None):
+    """Empaqueta los recursos en un archivo binario de Qt (paso de construcción).
+
+    PyQt5 no incluye la herramienta rcc de Qt, que es la que genera el
+    formato binario: se genera el módulo Python con pyrcc y sus tres bloques
+    (datos, nombres y árbol) se escriben con la cabecera del formato binario.
+
+    Args:
+        output (str, optional): Archivo a generar; por defecto resources.rcc
+            en el directorio de la aplicación
+        resources_dir (str, optional): Directorio de recursos; por defecto resources/
+
+    Returns:
+        tuple: (ruta del archivo generado, número de archivos empaquetados)
+
+    Raises:
+        OSError: Si no se puede generar el archivo
+    """
+    import ast
+    from xml.sax.saxutils import escape
+
+    from PyQt5 import pyrcc_main
+
+    output = output or os.path.join(get_app_dir(), RESOURCE_FILE)
+    resources_dir = resources_dir or get_resource_path('')
+    files = sorted({window_icon_file(), *BUNDLED_FILES})
+    for subdir in BUNDLED_DIRS:
+        for root, _, names in os.walk(os.path.join(resources_dir, subdir)):
+            for name in sorted(names):
+                path = os.path.relpath(os.path.join(root, name), resources_dir)
+                files.append(path.replace(os.sep, '/'))
+
+    # El .qrc temporal va en resources/ porque sus rutas son relativas a él
+    entries = ''.join(f'    <file>{escape(path)}</file>\n' for path in sorted(files))
+    descriptor, qrc_path = tempfile.mkstemp(suffix='.qrc', dir=resources_dir)
+    module_path = f'{qrc_path[:-4]}.py'
+    try:
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            f.write(f'<RCC>\n  <qresource prefix="/">\n{entries}  </qresource>\n</RCC>\n')
+        if not pyrcc_main.processResourceFile([qrc_path], module_path, False):
+            raise OSError(f"No se pudo generar {output}")
+        with open(module_path, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+    finally:
+        os.remove(qrc_path)
+        if os.path.exists(module_path):
+            os.remove(module_path)
+
+    blobs = {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in tree.body
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+        and node.targets[0].id.startswith('qt_resource_')
+    }
+    data = blobs['qt_resource_data']
+    names = blobs['qt_resource_name']
+    structure = blobs[f'qt_resource_struct_v{RCC_FORMAT_VERSION}']
+    # Cabecera: 'qres', versión y desplazamientos del árbol, los datos y los
+    # nombres (big-endian); después, los datos, los nombres y el árbol
+    data_offset = 20
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b'qres' + struct.pack('>IIII', RCC_FORMAT_VERSION, tree_offset, data_offset, names_offset)
+    with open(output, 'wb') as f:
+        f.write(header + data + names + structure)
+    return output, len(files)
@@ -0,0 +1,245 @@
+"""
+Perfilador del arranque de la aplicación.
+
+Este módulo registra, cuando se lanza con --profile-startup, una línea de
+tiempo de las fases del arranque (importaciones, configuración, i18n,
+construcción de la vista, tema, primer pintado y las etapas diferidas
+posteriores, como la bandeja) y el tiempo de importación de cada módulo.
+Desactivado no añade coste: las fases devuelven un gestor de contexto vacío
+compartido. Solo usa la biblioteca estándar para poder activarse antes de
+importar PyQt5.
+"""
+
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+
+# Argumento de línea de comandos que activa el perfilado
+PROFILE_FLAG = '--profile-startup'
+# Módulos más costosos que se muestran en el informe
+TOP_MODULES = 12
+
+_NULL_PHASE = nullcontext()
+
+
+class _TimedLoader:
+    """Envuelve un cargador para medir cuánto tarda en cargar su módulo."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        # En los módulos de extensión la carga de la biblioteca ocurre aquí
+        with self._profiler._timed_import(spec.name):
+            return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler._timed_import(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _ImportTimer:
+    """Buscador de módulos que envuelve los cargadores del resto de buscadores."""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler)
+                return spec
+        return None
+
+
+class StartupProfiler:
+    """Línea de tiempo del arranque y desglose del tiempo de importación."""
+
+    def __init__(self):
+        """Inicializa el perfilador desactivado."""
+        self.enabled = False
+        # Salir de la aplicación tras el informe (--profile-startup=exit)
+        self.exit_after_report = False
+        self.origin = None
+        # Fases: [nombre, inicio, fin, profundidad]; los hitos tienen fin None
+        self.events = []
+        # Tiempo de importación por módulo: {nombre: [propio, acumulado]}
+        self.imports = {}
+        self._depth = 0
+        self._import_stack = []
+        self._finder = None
+        self.reported = False
+
+    def enable_from_argv(self, argv):
+        """Activa el perfilado si argv contiene la opción y la retira de argv.
+
+        Args:
+            argv (list): Argumentos del proceso (se modifica en el sitio)
+
+        Returns:
+            bool: True si el perfilado quedó activado
+        """
+        for arg in list(argv[1:]):
+            if arg == PROFILE_FLAG or arg == f'{PROFILE_FLAG}=exit':
+                argv.remove(arg)
+                self.enable(exit_after_report=arg.endswith('=exit'))
+        return self.enabled
+
+    def enable(self, exit_after_report=False):
+        """Empieza a registrar fases e importaciones.
+
+        Args:
+            exit_after_report (bool): Cerrar la aplicación tras el informe
+        """
+        if self.enabled:
+            return
+        self.enabled = True
+        self.exit_after_report = exit_after_report
+        self.origin = time.perf_counter()
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def disable(self):
+        """Deja de medir las importaciones."""
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def phase(self, name):
+        """Gestor de contexto que mide una fase del arranque.
+
+        Args:
+            name (str): Nombre de la fase
+
+        Returns:
+            Gestor de contexto (vacío si el perfilado está desactivado)
+        """
+        if not self.enabled:
+            return _NULL_PHASE
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name):
+        event = [name, time.perf_counter(), None, self._depth]
+        self.events.append(event)
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            event[2] = time.perf_counter()
+
+    def mark(self, name):
+        """Registra un hito instantáneo.
+
+        Args:
+            name (str): Nombre del hito
+        """
+        if self.enabled:
+            self.events.append([name, time.perf_counter(), None, self._depth])
+
+    def elapsed_ms(self, name):
+        """Milisegundos desde el inicio del perfilado hasta un hito o fase.
+
+        Args:
+            name (str): Nombre del hito o fase
+
+        Returns:
+            float: Milisegundos, o None si no se ha registrado
+        """
+        for event in self.events:
+            if event[0] == name:
+                return ((event[2] or event[1]) - self.origin) * 1000
+        return None
+
+    @contextmanager
+    def _timed_import(self, name):
+        start = time.perf_counter()
+        self._import_stack.append(0.0)
+        try:
+            yield
+        finally:
+            total = time.perf_counter() - start
+            children = self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1] += total
+            entry = self.imports.setdefault(name, [0.0, 0.0])
+            entry[0] += total - children
+            entry[1] += total
+
+    def first_paint(self, stream=None):
+        """Registra el primer pintado de la ventana principal y lo anuncia.
+
+        La línea se escribe en el acto, sin esperar al informe completo,
+        para que las herramientas externas midan el primer pintado.
+
+        Args:
+            stream (file, optional): Destino; por defecto sys.stderr
+        """
+        if not self.enabled:
+            return
+        self.mark('primer pintado')
+        print(f"tiempo hasta el primer pintado: {self.elapsed_ms('primer pintado'):.1f} ms",
+              file=stream or sys.stderr, flush=True)
+
+    def finish(self):
+        """Fin del arranque: emite el informe y, si se pidió, cierra la aplicación."""
+        if not self.enabled or self.reported:
+            return
+        self.mark('arranque completo')
+        self.report()
+        if self.exit_after_report:
+            from PyQt5.QtWidgets import QApplication
+            QApplication.instance().quit()
+
+    def report(self, stream=None):
+        """Escribe la línea de tiempo y el desglose de importaciones.
+
+        Args:
+            stream (file, optional): Destino; por defecto sys.stderr
+        """
+        if self.reported:
+            return
+        self.reported = True
+        self.disable()
+        stream = stream or sys.stderr
+        lines = ["Perfil de arranque (ms desde el inicio del perfilado)"]
+        for name, start, end, depth in self.events:
+            offset = (start - self.origin) * 1000
+            indent = '  ' * depth
+            if end is None:
+                lines.append(f"{offset:9.1f}            {indent}{name}")
+            else:
+                lines.append(f"{offset:9.1f} +{(end - start) * 1000:8.1f}  {indent}{name}")
+
+        # Tiempo propio de importación agrupado por paquete de primer nivel
+        packages = {}
+        for module, (own, _) in self.imports.items():
+            package = module.split('.')[0]
+            packages[package] = packages.get(package, 0.0) + own
+        total = sum(packages.values())
+        lines.append(f"Importaciones: {len(self.imports)} módulos, {total * 1000:.1f} ms")
+        for package, own in sorted(packages.items(), key=lambda item: -item[1])[:TOP_MODULES]:
+            lines.append(f"  {package:<28}{own * 1000:8.1f} ms")
+        lines.append("Módulos más costosos (propio / acumulado):")
+        ranking = sorted(self.imports.items(), key=lambda item: -item[1][0])[:TOP_MODULES]
+        for module, (own, cumulative) in ranking:
+            lines.append(f"  {module:<28}{own * 1000:8.1f} {cumulative * 1000:8.1f} ms")
+
+        first_paint = self.elapsed_ms('primer pintado')
+        if first_paint is not None:
+            lines.append(f"primer pintado: {first_paint:.1f} ms, arranque completo: "
+                         f"{self.elapsed_ms('arranque completo'):.1f} ms")
+        print('\n'.join(lines), file=stream, flush=True)
+
+
+# Perfilador compartido por todo el proceso
+profiler = StartupProfiler()
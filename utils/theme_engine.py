@@ -0,0 +1,322 @@
+"""
+Motor de temas de la aplicación.
+
+Los temas se generan a partir de una única plantilla QSS
+(resources/styles/template.qss) y de una paleta por tema
+(resources/styles/themes/<tema>.json) que da valor a cada @token. Los temas
+incluidos se precompilan en tiempo de construcción a <tema>.qss
+(python build.py --themes), así que al arrancar no se procesa ninguna
+plantilla; los temas del usuario (<config>/themes/<tema>.json, que pueden
+heredar de otro con "base") se generan al usarlos.
+
+Este módulo carga cada hoja de estilo una sola vez por tema, la procesa
+(sin comentarios ni espacios sobrantes y con las rutas de url() resueltas
+de forma absoluta) y guarda el resultado en caché. El primer tema se aplica
+a nivel de QApplication; los cambios posteriores se aplican a cada ventana
+raíz, cuya hoja prevalece sobre la de la aplicación y solo repule su propio
+árbol de widgets. Cambiar al tema que ya está aplicado no hace nada. En la aplicación empaquetada los estilos incluidos se leen del
+módulo de recursos compilado (utils/resources).
+"""
+
+import json
+import logging
+import os
+import re
+
+from utils.paths import get_resource_path
+from utils.resources import is_bundled, list_resources, read_text, resource_location
+
+# Plantilla común de todos los temas
+TEMPLATE_FILE = 'template.qss'
+# Subdirectorio de las paletas (de los temas incluidos y de los del usuario)
+THEMES_DIR = 'themes'
+# Cabecera de las hojas de estilo precompiladas
+COMPILED_HEADER = "/* Generado por build.py a partir de template.qss y themes/{theme}.json; no editar */\n"
+
+# Tokens de la plantilla: @nombre
+_TOKEN = re.compile(r'@([A-Za-z_][A-Za-z0-9_]*)')
+
+# Comentarios /* ... */ de QSS
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+# Espacios alrededor de los separadores de QSS
+_SEPARATOR_SPACE = re.compile(r'\s*([{};,])\s*')
+# url(...) relativas a la raíz del proyecto, p. ej. url(resources/icons/x.svg)
+_RESOURCE_URL = re.compile(r'url\(\s*["\']?resources/([^)"\']+)["\']?\s*\)')
+
+
+def process_stylesheet(text):
+    """Prepara una hoja de estilo para pasarla a Qt.
+
+    Elimina comentarios y espacios sobrantes y resuelve las url() de
+    recursos a rutas absolutas, de modo que no dependan del directorio de
+    trabajo.
+
+    Args:
+        text (str): Contenido QSS original
+
+    Returns:
+        str: Hoja de estilo procesada
+    """
+    text = _COMMENT.sub('', text)
+    text = _RESOURCE_URL.sub(
+        lambda match: f"url({resource_location(match.group(1)).replace(os.sep, '/')})",
+        text
+    )
+    text = _SEPARATOR_SPACE.sub(r'\1', text)
+    return ' '.join(text.split())
+
+
+def render_template(template, palette):
+    """Sustituye los @tokens de la plantilla por los valores de la paleta.
+
+    Los comentarios de la plantilla no se copian al resultado.
+
+    Args:
+        template (str): Plantilla QSS
+        palette (dict): Valor de cada token
+
+    Returns:
+        str: Hoja de estilo del tema
+
+    Raises:
+        ValueError: Si la plantilla usa un token que la paleta no define
+    """
+    template = _COMMENT.sub('', template)
+    missing = sorted({name for name in _TOKEN.findall(template) if name not in palette})
+    if missing:
+        raise ValueError(f"Faltan tokens en la paleta: {', '.join(missing)}")
+    style = _TOKEN.sub(lambda match: palette[match.group(1)], template)
+    # Sin las líneas en blanco que dejan los comentarios eliminados
+    return re.sub(r'\n\s*\n(\s*\n)+', '\n\n', style).strip() + '\n'
+
+
+def compile_themes(styles_dir=None):
+    """Precompila los temas incluidos a <tema>.qss (paso de construcción).
+
+    Args:
+        styles_dir (str, optional): Directorio de estilos; por defecto el de recursos
+
+    Returns:
+        list: Rutas de las hojas de estilo generadas
+    """
+    # Siempre desde los archivos de resources/, nunca desde el módulo compilado
+    engine = ThemeEngine(styles_dir or get_resource_path('styles'))
+    template = engine._get_template()
+    written = []
+    for theme in engine.builtin_themes():
+        style = render_template(template, engine.palette(theme))
+        path = engine.compiled_path(theme)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(COMPILED_HEADER.format(theme=theme) + style)
+        written.append(path)
+    return written
+
+
+class ThemeEngine:
+    """Carga, genera, procesa y aplica los temas con caché por tema."""
+
+    def __init__(self, styles_dir=None, user_themes_dir=None):
+        """Inicializa el motor de temas.
+
+        Args:
+            styles_dir (str, optional): Directorio de la plantilla, las paletas
+                y las hojas de estilo precompiladas; por defecto los estilos de
+                los recursos (del módulo compilado si está disponible)
+            user_themes_dir (str, optional): Directorio de las paletas del usuario
+        """
+        self.logger = logging.getLogger(__name__)
+        # Los estilos incluidos se leen del módulo de recursos compilado
+        self._bundled = styles_dir is None and is_bundled()
+        self.styles_dir = styles_dir or get_resource_path('styles')
+        self.template_path = os.path.join(self.styles_dir, TEMPLATE_FILE)
+        self.user_themes_dir = user_themes_dir
+        self.current_theme = None
+        self._cache = {}
+        self._template = None
+
+    def builtin_themes(self):
+        """Nombres de los temas incluidos con la aplicación.
+
+        Returns:
+            list: Temas con paleta en resources/styles/themes
+        """
+        if self._bundled:
+            names = list_resources(f'styles/{THEMES_DIR}')
+            return sorted(name[:-5] for name in names if name.endswith('.json'))
+        return self._list_palettes(os.path.join(self.styles_dir, THEMES_DIR))
+
+    def user_themes(self):
+        """Nombres de los temas definidos por el usuario.
+
+        Returns:
+            list: Temas con paleta en el directorio de temas del usuario
+        """
+        if not self.user_themes_dir:
+            return []
+        return self._list_palettes(self.user_themes_dir)
+
+    def palette_path(self, theme):
+        """Ruta de la paleta de un tema; las del usuario tienen prioridad.
+
+        Args:
+            theme (str): Nombre del tema
+
+        Returns:
+            str: Ruta al archivo JSON de la paleta
+        """
+        if self.user_themes_dir:
+            user_path = os.path.join(self.user_themes_dir, f'{theme}.json')
+            if os.path.exists(user_path):
+                return user_path
+        return os.path.join(self.styles_dir, THEMES_DIR, f'{theme}.json')
+
+    def compiled_path(self, theme):
+        """Ruta de la hoja de estilo precompilada de un tema incluido."""
+        return os.path.join(self.styles_dir, f'{theme}.qss')
+
+    def palette(self, theme, _seen=None):
+        """Obtiene la paleta completa de un tema, resolviendo su tema base.
+
+        Args:
+            theme (str): Nombre del tema
+
+        Returns:
+            dict: Valor de cada token
+
+        Raises:
+            OSError: Si no existe la paleta
+            ValueError: Si la paleta no es válida o la herencia es circular
+        """
+        seen = _seen or set()
+        if theme in seen:
+            raise ValueError(f"Herencia circular entre temas: {theme}")
+        seen.add(theme)
+        data = json.loads(self._read(self.palette_path(theme)))
+        if not isinstance(data.get('palette'), dict):
+            raise ValueError(f"La paleta del tema {theme} no es válida")
+        palette = {}
+        if data.get('base'):
+            palette.update(self.palette(data['base'], seen))
+        palette.update(data['palette'])
+        return palette
+
+    def stylesheet(self, theme):
+        """Obtiene la hoja de estilo procesada de un tema.
+
+        Los temas incluidos se leen de su hoja precompilada si está al día;
+        los demás (o si la plantilla o la paleta son más recientes) se
+        generan a partir de la plantilla. En ambos casos solo la primera vez.
+
+        Args:
+            theme (str): Nombre del tema ('light', 'dark' o uno del usuario)
+
+        Returns:
+            str: Hoja de estilo procesada
+
+        Raises:
+            OSError: Si no se puede leer el tema
+            ValueError: Si la paleta del tema no es válida
+        """
+        style = self._cache.get(theme)
+        if style is None:
+            if self._is_compiled(theme):
+                source = self._read(self.compiled_path(theme))
+            else:
+                self.logger.debug(f"Generando el tema {theme} desde la plantilla")
+                source = render_template(self._get_template(), self.palette(theme))
+            style = process_stylesheet(source)
+            self._cache[theme] = style
+        return style
+
+    def preload(self, themes):
+        """Carga de antemano varios temas en la caché.
+
+        Args:
+            themes (iterable): Nombres de los temas
+        """
+        for theme in themes:
+            try:
+                self.stylesheet(theme)
+            except (OSError, ValueError) as e:
+                self.logger.error(f"Error al precargar el tema {theme}: {str(e)}")
+
+    def apply(self, theme, app=None):
+        """Aplica un tema a toda la aplicación.
+
+        Cambiar la hoja de QApplication repule todos los widgets de todas las
+        ventanas, incluidas las ocultas (y varias veces los anidados), así
+        que solo se usa la primera vez. Después, la hoja se aplica a cada
+        ventana sin padre: prevalece sobre la de la aplicación, la heredan
+        sus diálogos y menús, y el cambio cuesta menos de la mitad. Las
+        ventanas deben crearse con padre para seguir los cambios de tema.
+
+        Args:
+            theme (str): Nombre del tema
+            app (QApplication, optional): Aplicación; por defecto la instancia actual
+
+        Returns:
+            bool: True si se aplicó, False si ya estaba aplicado o hubo un error
+        """
+        if theme == self.current_theme:
+            return False
+        try:
+            style = self.stylesheet(theme)
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error al cargar el tema: {str(e)}")
+            return False
+
+        if app is None:
+            from PyQt5.QtWidgets import QApplication
+            app = QApplication.instance()
+        if self.current_theme is None:
+            app.setStyleSheet(style)
+        else:
+            for window in app.topLevelWidgets():
+                if window.parentWidget() is None:
+                    window.setStyleSheet(style)
+        self.current_theme = theme
+        self.logger.info(f"Tema aplicado: {theme}")
+        return True
+
+    def clear_cache(self):
+        """Vacía la caché (por ejemplo, tras editar los archivos de tema)."""
+        self._cache.clear()
+        self._template = None
+
+    def _is_compiled(self, theme):
+        """Indica si un tema tiene una hoja precompilada al día."""
+        compiled = self.compiled_path(theme)
+        palette = self.palette_path(theme)
+        if os.path.dirname(palette) == self.user_themes_dir:
+            return False
+        if self._bundled:
+            # El módulo de recursos se genera después de precompilar los temas
+            return theme in self.builtin_themes()
+        if not os.path.exists(compiled):
+            return False
+        try:
+            built = os.path.getmtime(compiled)
+            return built >= os.path.getmtime(palette) and built >= os.path.getmtime(self.template_path)
+        except OSError:
+            # Sin plantilla ni paleta (p. ej. distribución mínima): usar la precompilada
+            return True
+
+    def _get_template(self):
+        if self._template is None:
+            self._template = self._read(self.template_path)
+        return self._template
+
+    def _read(self, path):
+        """Lee un archivo de estilos; los incluidos, del módulo de recursos si procede."""
+        if self._bundled and os.path.dirname(path) != self.user_themes_dir:
+            relative = os.path.relpath(path, self.styles_dir).replace(os.sep, '/')
+            return read_text(f'styles/{relative}')
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def _list_palettes(self, directory):
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith('.json'))
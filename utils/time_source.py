@@ -0,0 +1,178 @@
+"""
+Fuente de tiempo monotónica para las fechas límite de EnergyPy.
+
+Este módulo mide las fechas límite sobre un reloj que sigue avanzando
+durante la suspensión (CLOCK_BOOTTIME en Linux, mach_continuous_time en
+macOS, GetTickCount64 en Windows) y detecta saltos del reloj de pared (NTP,
+cambios de horario, ajustes manuales) y periodos de suspensión, para que la
+cuenta regresiva y la programación del sistema puedan resincronizarse.
+"""
+
+import functools
+import logging
+import sys
+import threading
+import time
+
+# Diferencia mínima (segundos) entre relojes para considerar que hubo un salto
+DEFAULT_JUMP_THRESHOLD = 2.0
+
+
+def _sleep_aware_clocks():
+    """Busca un reloj que avance durante la suspensión y otro que no.
+
+    La diferencia entre ambos es el tiempo que el equipo estuvo suspendido;
+    sin esa pareja no se puede distinguir una suspensión de un cambio manual
+    del reloj de pared.
+
+    Returns:
+        tuple: (nombre, reloj con suspensión, reloj sin suspensión) o None
+    """
+    boottime = getattr(time, 'CLOCK_BOOTTIME', None)
+    if boottime is not None:
+        try:
+            time.clock_gettime(boottime)
+            return 'boottime', functools.partial(time.clock_gettime, boottime), time.monotonic
+        except OSError:
+            pass
+
+    if sys.platform == 'darwin':
+        # CLOCK_MONOTONIC es mach_continuous_time (cuenta la suspensión);
+        # time.monotonic usa mach_absolute_time, que se detiene
+        continuous = getattr(time, 'CLOCK_MONOTONIC', None)
+        if continuous is not None:
+            try:
+                time.clock_gettime(continuous)
+                return ('continuous', functools.partial(time.clock_gettime, continuous),
+                        time.monotonic)
+            except OSError:
+                pass
+
+    if sys.platform == 'win32':
+        try:
+            import ctypes
+
+            kernel32 = ctypes.windll.kernel32
+            kernel32.GetTickCount64.restype = ctypes.c_ulonglong
+            unbiased = ctypes.c_ulonglong()
+
+            def tick_count():
+                # Milisegundos desde el arranque, incluida la suspensión
+                return kernel32.GetTickCount64() / 1000
+
+            def interrupt_time():
+                # Unidades de 100 ns sin contar la suspensión
+                kernel32.QueryUnbiasedInterruptTime(ctypes.byref(unbiased))
+                return unbiased.value / 10_000_000
+
+            interrupt_time()
+            return 'tickcount', tick_count, interrupt_time
+        except (AttributeError, OSError):
+            pass
+    return None
+
+
+class TimeSource:
+    """Reloj monotónico con detección de saltos y suspensiones."""
+
+    def __init__(self, jump_threshold=DEFAULT_JUMP_THRESHOLD):
+        """Inicializa la fuente de tiempo.
+
+        Args:
+            jump_threshold (float): Segundos de desviación que se consideran salto
+        """
+        self.logger = logging.getLogger(__name__)
+        self.jump_threshold = jump_threshold
+        self.jump_count = 0
+        self.suspend_count = 0
+        self._listeners = []
+        # check() se llama desde la interfaz y desde el temporizador del planificador
+        self._lock = threading.Lock()
+
+        clocks = _sleep_aware_clocks()
+        if clocks is not None:
+            self.clock_name, self._clock, self._awake = clocks
+        else:
+            # Sin reloj que cuente la suspensión, esta no se distingue de un
+            # cambio manual del reloj de pared: ambos se notifican como salto
+            self.clock_name = 'monotonic'
+            self._clock = self._awake = time.monotonic
+
+        self._last_now = self.now()
+        self._last_awake = self._awake()
+        self._last_wall = time.time()
+
+    def now(self):
+        """Obtiene el instante actual en segundos, incluyendo las suspensiones.
+
+        Returns:
+            float: Segundos en el reloj de la fuente
+        """
+        return self._clock()
+
+    def add_listener(self, callback):
+        """Registra un callback(kind, offset) para saltos y suspensiones.
+
+        Args:
+            callback (callable): Recibe 'jump' o 'suspend' y el desfase en segundos
+        """
+        self._listeners.append(callback)
+
+    def check(self):
+        """Compara los relojes desde la última comprobación.
+
+        Es barato (tres lecturas de reloj), por lo que puede llamarse en cada
+        consulta de tiempo restante; el temporizador del planificador lo
+        llama además periódicamente mientras hay tareas pendientes.
+
+        Returns:
+            list: Eventos detectados como tuplas (kind, offset)
+        """
+        with self._lock:
+            now = self.now()
+            awake = self._awake()
+            wall = time.time()
+            elapsed = now - self._last_now
+            events = []
+
+            # El reloj con suspensión avanza más que el otro solo si el
+            # equipo estuvo suspendido
+            suspended = elapsed - (awake - self._last_awake)
+            if suspended > self.jump_threshold:
+                events.append(('suspend', suspended))
+
+            skew = (wall - self._last_wall) - elapsed
+            if abs(skew) > self.jump_threshold:
+                events.append(('jump', skew))
+
+            self._last_now = now
+            self._last_awake = awake
+            self._last_wall = wall
+
+            for kind, offset in events:
+                if kind == 'jump':
+                    self.jump_count += 1
+                    self.logger.warning(f"Salto del reloj del sistema detectado: {offset:+.1f} s")
+                else:
+                    self.suspend_count += 1
+                    self.logger.info(f"Reanudación tras suspensión detectada: {offset:.1f} s")
+
+        for kind, offset in events:
+            for callback in self._listeners:
+                try:
+                    callback(kind, offset)
+                except Exception as e:
+                    self.logger.error(f"Error en el listener de la fuente de tiempo: {str(e)}")
+        return events
+
+    def get_diagnostics(self):
+        """Obtiene contadores de diagnóstico.
+
+        Returns:
+            dict: Reloj usado y número de saltos y suspensiones detectados
+        """
+        return {
+            'clock': self.clock_name,
+            'jump_count': self.jump_count,
+            'suspend_count': self.suspend_count
+        }
@@ -90,6 +90,38 @@ def convert_to_seconds(value, unit='seconds'):
         raise ValueError(f"Unidad de tiempo no reconocida: {unit}")
 
 
+def parse_duration(text):
+    """Convierte una duración como '90m', '1h30m', '45s' o '3600' a segundos.
+
+    Los números sin sufijo se interpretan como segundos. El resultado se
+    valida con validate_time_input (máximo 24 horas).
+
+    Args:
+        text (str): Duración a convertir
+
+    Returns:
+        int: Duración en segundos
+
+    Raises:
+        ValueError: Si el formato no es válido o la duración está fuera de rango
+    """
+    text = text.strip().lower()
+    if text.isdigit():
+        seconds = int(text)
+    else:
+        match = re.fullmatch(r'(?:(\d+)h)?(?:(\d+)m)?(?:(\d+)s)?', text)
+        if not text or match is None:
+            raise ValueError(f"Duración inválida: '{text}'. Use por ejemplo 90m, 1h30m o 45s")
+        hours, minutes, secs = (int(part) if part else 0 for part in match.groups())
+        seconds = (convert_to_seconds(hours, 'hours') + convert_to_seconds(minutes, 'minutes')
+                   + secs)
+
+    valid, error = validate_time_input(seconds, 'seconds')
+    if not valid:
+        raise ValueError(error)
+    return seconds
+
+
 def format_time_remaining(seconds):
     """Formatea el tiempo restante en un formato legible.
 
@@ -13,6 +13,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QPixmap, QIcon
 
+from utils.icon_service import icon_service
+
 
 class AboutView(QDialog):
     """Vista de acerca de la aplicación."""
@@ -41,14 +43,9 @@ class AboutView(QDialog):
         
         # Logo de la aplicación
         logo_label = QLabel()
-        logo_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'app_icon.svg'
-        )
         
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            logo_label.setPixmap(pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if icon_service.has_icon('app_icon.svg'):
+            logo_label.setPixmap(icon_service.pixmap('app_icon.svg', 64))
             logo_label.setAlignment(Qt.AlignCenter)
             main_layout.addWidget(logo_label)
         
@@ -0,0 +1,116 @@
+"""
+Modelo de vista de la cuenta regresiva de la ventana principal.
+
+Este módulo calcula una sola vez por tick el estado que muestra la ventana
+(texto del tiempo restante, progreso y controles habilitados) y envía a los
+widgets únicamente las propiedades que han cambiado. Los textos HH:MM:SS se
+construyen a partir de fragmentos preformateados y memorizados.
+"""
+
+from functools import lru_cache
+
+from utils.time_utils import format_time_remaining
+
+# Segundos preformateados '00'..'59' (y hasta '99' por seguridad)
+_TWO_DIGITS = tuple(f"{value:02d}" for value in range(100))
+
+# Texto sin ninguna acción programada
+IDLE_TEXT = format_time_remaining(None)
+
+
+@lru_cache(maxsize=1024)
+def _minute_prefix(total_minutes):
+    """Prefijo 'HH:MM:' memorizado; solo cambia una vez por minuto."""
+    hours, minutes = divmod(total_minutes, 60)
+    return f"{hours:02d}:{_TWO_DIGITS[minutes]}:"
+
+
+def format_countdown(seconds):
+    """Formatea el tiempo restante como HH:MM:SS usando la caché.
+
+    Produce el mismo texto que utils.time_utils.format_time_remaining.
+
+    Args:
+        seconds (int): Segundos restantes o None
+
+    Returns:
+        str: Tiempo formateado
+    """
+    if seconds is None:
+        return IDLE_TEXT
+    total_minutes, seconds = divmod(seconds, 60)
+    return _minute_prefix(total_minutes) + _TWO_DIGITS[seconds]
+
+
+class CountdownViewModel:
+    """Calcula el estado de la cuenta regresiva y lo aplica a la vista."""
+
+    def __init__(self, view):
+        """Inicializa el modelo de vista.
+
+        Args:
+            view (MainView): Vista principal, recién construida (sin acción)
+        """
+        self.view = view
+        # Estado mostrado actualmente por la vista
+        self.scheduled = False
+        self.remaining_text = IDLE_TEXT
+        self.progress = 0
+        # Llamadas a widgets realizadas (para diagnóstico y benchmarks)
+        self.widget_updates = 0
+
+    def update(self, info):
+        """Calcula el estado a partir de la acción pendiente y lo aplica.
+
+        Args:
+            info (dict): Resultado de SystemModel.get_scheduled_info() o None
+        """
+        if info is None:
+            self.apply(False, IDLE_TEXT, 0)
+            return
+
+        remaining = info['remaining_seconds']
+        total = info['original_seconds']
+        # Progreso como porcentaje del tiempo transcurrido
+        progress = (total - remaining) * 100 // total if total > 0 else 0
+        # Con el tiempo agotado se restablecen los controles
+        self.apply(remaining > 0, format_countdown(remaining), progress)
+
+    def set_scheduled(self, scheduled):
+        """Habilita los controles según haya o no una acción programada.
+
+        Args:
+            scheduled (bool): True si hay una acción programada
+        """
+        self.apply(scheduled, self.remaining_text, self.progress)
+
+    def reset(self):
+        """Restablece la vista al estado sin acciones programadas."""
+        self.apply(False, IDLE_TEXT, 0)
+
+    def apply(self, scheduled, remaining_text, progress):
+        """Envía a los widgets solo las propiedades que han cambiado.
+
+        Args:
+            scheduled (bool): True si los controles deben reflejar una acción
+            remaining_text (str): Texto del tiempo restante
+            progress (int): Porcentaje de la barra de progreso
+        """
+        view = self.view
+        if scheduled != self.scheduled:
+            self.scheduled = scheduled
+            view.schedule_button.setEnabled(not scheduled)
+            view.cancel_button.setEnabled(scheduled)
+            view.tab_widget.setEnabled(not scheduled)
+            # Los radio buttons se habilitan individualmente
+            view.shutdown_radio.setEnabled(not scheduled)
+            view.restart_radio.setEnabled(not scheduled)
+            self.widget_updates += 5
+        if remaining_text != self.remaining_text:
+            self.remaining_text = remaining_text
+            view.remaining_time_label.setText(remaining_text)
+            self.widget_updates += 1
+        if progress != self.progress:
+            self.progress = progress
+            view.progress_bar.setValue(progress)
+            self.widget_updates += 1
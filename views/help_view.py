@@ -13,6 +13,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon, QPixmap
 
+from utils.icon_service import icon_service
+
 
 class HelpView(QDialog):
     """Vista de ayuda de la aplicación."""
@@ -26,29 +28,38 @@ class HelpView(QDialog):
         """
         super().__init__(parent)
         self.i18n = i18n
+        # Idioma del contenido mostrado (None hasta el primer refresh)
+        self._language = None
         self._init_ui()
+        self.refresh()
 
     def _init_ui(self):
         """Inicializa la interfaz de usuario."""
         # Configuración de la ventana
-        self.setWindowTitle(self.i18n.get_text("help"))
         self.setMinimumSize(500, 400)
         
         # Layout principal
         main_layout = QVBoxLayout(self)
         
         # Contenido de ayuda
-        help_browser = QTextBrowser()
-        help_browser.setOpenExternalLinks(True)
-        help_browser.setHtml(self.i18n.get_text("help_content"))
+        self.help_browser = QTextBrowser()
+        self.help_browser.setOpenExternalLinks(True)
         
-        main_layout.addWidget(help_browser)
+        main_layout.addWidget(self.help_browser)
         
         # Botón de cerrar
         button_box = QDialogButtonBox(QDialogButtonBox.Close)
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
 
+    def refresh(self):
+        """Actualiza los textos; el HTML solo se vuelve a cargar si cambió el idioma."""
+        if self._language == self.i18n.current_language:
+            return
+        self._language = self.i18n.current_language
+        self.setWindowTitle(self.i18n.get_text("help"))
+        self.help_browser.setHtml(self.i18n.get_text("help_content"))
+
 
 class AboutView(QDialog):
     """Vista de acerca de la aplicación."""
@@ -62,12 +73,14 @@ class AboutView(QDialog):
         """
         super().__init__(parent)
         self.i18n = i18n
+        # Idioma del contenido mostrado (None hasta el primer refresh)
+        self._language = None
         self._init_ui()
+        self.refresh()
 
     def _init_ui(self):
         """Inicializa la interfaz de usuario."""
         # Configuración de la ventana
-        self.setWindowTitle(self.i18n.get_text("about"))
         self.setMinimumSize(400, 300)
         
         # Layout principal
@@ -76,15 +89,8 @@ class AboutView(QDialog):
         # Icono de la aplicación
         icon_layout = QHBoxLayout()
         
-        app_icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'app_icon.svg'
-        )
-        
         icon_label = QLabel()
-        icon_label.setPixmap(QPixmap(app_icon_path).scaled(
-            64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        icon_label.setPixmap(icon_service.pixmap('app_icon.svg', 64))
         icon_layout.addStretch()
         icon_layout.addWidget(icon_label)
         icon_layout.addStretch()
@@ -92,13 +98,20 @@ class AboutView(QDialog):
         main_layout.addLayout(icon_layout)
         
         # Contenido de acerca de
-        about_browser = QTextBrowser()
-        about_browser.setOpenExternalLinks(True)
-        about_browser.setHtml(self.i18n.get_text("about_content"))
+        self.about_browser = QTextBrowser()
+        self.about_browser.setOpenExternalLinks(True)
         
-        main_layout.addWidget(about_browser)
+        main_layout.addWidget(self.about_browser)
         
         # Botón de cerrar
         button_box = QDialogButtonBox(QDialogButtonBox.Close)
         button_box.rejected.connect(self.reject)
-        main_layout.addWidget(button_box)
\ No newline at end of file
+        main_layout.addWidget(button_box)
+
+    def refresh(self):
+        """Actualiza los textos; el HTML solo se vuelve a cargar si cambió el idioma."""
+        if self._language == self.i18n.current_language:
+            return
+        self._language = self.i18n.current_language
+        self.setWindowTitle(self.i18n.get_text("about"))
+        self.about_browser.setHtml(self.i18n.get_text("about_content"))
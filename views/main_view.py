@@ -15,11 +15,11 @@ from PyQt5.QtWidgets import (
     QComboBox, QTimeEdit, QProgressBar, QCheckBox, QSystemTrayIcon,
     QMenu, QAction, QMessageBox, QGroupBox, QFormLayout, QApplication
 )
-from PyQt5.QtCore import Qt, QTime, QTimer, QSize
+from PyQt5.QtCore import Qt, QTime, QSize
 from PyQt5.QtGui import QIcon, QPixmap
 
-# Importar get_resource_path al inicio del archivo
-from utils.paths import get_resource_path
+from utils.icon_service import icon_service
+from views.tray_renderer import TRAY_ICON_SIZE, TrayCountdownRenderer
 
 
 class MainView(QMainWindow):
@@ -35,14 +35,15 @@ class MainView(QMainWindow):
         super().__init__()
         self.controller = controller
         self.i18n = i18n
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_countdown)
         
         # Inicializar la interfaz
         self._init_ui()
         
-        # Configurar el icono de la bandeja del sistema
-        self._setup_tray_icon()
+        # El icono de la bandeja se configura después del primer pintado
+        # (ver MainController._setup_tray)
+        self.tray_icon = None
+        self.tray_renderer = None
+        self.tray_countdown_enabled = False
         
         # Configurar atajos de teclado
         self._setup_shortcuts()
@@ -53,9 +54,8 @@ class MainView(QMainWindow):
         self.setWindowTitle(self.i18n.get_text("app_title"))
         self.setMinimumSize(500, 400)
         
-        # Cargar el icono de la aplicación usando get_resource_path
-        app_icon_path = get_resource_path(os.path.join('icons', 'app_icon.svg'))
-        self.setWindowIcon(QIcon(app_icon_path))
+        # Icono de la aplicación (también la base del icono de la bandeja)
+        self.setWindowIcon(icon_service.icon('app_icon.svg', (16, 32, TRAY_ICON_SIZE)))
         
         # Widget central
         central_widget = QWidget()
@@ -135,18 +135,9 @@ class MainView(QMainWindow):
         self.shutdown_radio = QRadioButton(self.i18n.get_text("action_shutdown"))
         self.restart_radio = QRadioButton(self.i18n.get_text("action_restart"))
         
-        # Cargar iconos para los radio buttons
-        shutdown_icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'shutdown_icon.svg'
-        )
-        restart_icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'restart_icon.svg'
-        )
-        
-        self.shutdown_radio.setIcon(QIcon(shutdown_icon_path))
-        self.restart_radio.setIcon(QIcon(restart_icon_path))
+        # Iconos de los radio buttons
+        self.shutdown_radio.setIcon(icon_service.icon('shutdown_icon.svg'))
+        self.restart_radio.setIcon(icon_service.icon('restart_icon.svg'))
         
         self.action_group.addButton(self.shutdown_radio)
         self.action_group.addButton(self.restart_radio)
@@ -178,29 +169,17 @@ class MainView(QMainWindow):
         main_layout.addWidget(self.progress_bar)
         
         # Botón de cancelar
-        cancel_icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'cancel_icon.svg'
-        )
-        
         self.cancel_button = QPushButton(self.i18n.get_text("cancel_button"))
         self.cancel_button.setObjectName("cancelButton")
-        self.cancel_button.setIcon(QIcon(cancel_icon_path))
+        self.cancel_button.setIcon(icon_service.icon('cancel_icon.svg'))
         self.cancel_button.setEnabled(False)  # Inicialmente deshabilitado
         main_layout.addWidget(self.cancel_button)
         
         # Switch de tema claro/oscuro
         theme_layout = QHBoxLayout()
         
-        theme_icon_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'icons', 'theme_icon.svg'
-        )
-        
         theme_label = QLabel()
-        theme_label.setPixmap(QPixmap(theme_icon_path).scaled(
-            24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        theme_label.setPixmap(icon_service.pixmap('theme_icon.svg', 24))
         theme_layout.addWidget(theme_label)
         
         self.theme_switch = QCheckBox()
@@ -216,25 +195,58 @@ class MainView(QMainWindow):
         self.tray_icon.setIcon(self.windowIcon())
         self.tray_icon.setToolTip(self.i18n.get_text("tray_tooltip"))
         
+        # Cuenta regresiva dibujada en el icono (solo si hay bandeja disponible)
+        self.tray_renderer = TrayCountdownRenderer(self.windowIcon())
+        self.tray_countdown_enabled = QSystemTrayIcon.isSystemTrayAvailable()
+        
         # Menú de la bandeja del sistema
-        tray_menu = QMenu()
+        # Con padre, para que herede el tema de la ventana (ver utils.theme_engine)
+        self.tray_menu = QMenu(self)
         
-        show_action = QAction(self.i18n.get_text("tray_show"), self)
-        show_action.triggered.connect(self.show)
-        tray_menu.addAction(show_action)
+        self.tray_show_action = QAction(self.i18n.get_text("tray_show"), self)
+        self.tray_show_action.triggered.connect(self.show)
+        self.tray_menu.addAction(self.tray_show_action)
         
-        tray_menu.addSeparator()
+        self.tray_menu.addSeparator()
         
-        exit_action = QAction(self.i18n.get_text("tray_exit"), self)
-        exit_action.triggered.connect(self.close)
-        tray_menu.addAction(exit_action)
+        self.tray_exit_action = QAction(self.i18n.get_text("tray_exit"), self)
+        self.tray_exit_action.triggered.connect(self.close)
+        self.tray_menu.addAction(self.tray_exit_action)
         
-        self.tray_icon.setContextMenu(tray_menu)
+        self.tray_icon.setContextMenu(self.tray_menu)
         self.tray_icon.activated.connect(self._tray_icon_activated)
         
         # Mostrar el icono en la bandeja
         self.tray_icon.show()
 
+    def retranslate_tray(self):
+        """Actualiza los textos de la bandeja tras un cambio de idioma.
+
+        El icono y el menú existentes se conservan; no se crea otra bandeja.
+        """
+        if self.tray_icon is None:
+            return
+        self.tray_icon.setToolTip(self.i18n.get_text("tray_tooltip"))
+        self.tray_show_action.setText(self.i18n.get_text("tray_show"))
+        self.tray_exit_action.setText(self.i18n.get_text("tray_exit"))
+
+    def update_tray_countdown(self, info):
+        """Muestra el tiempo restante en el icono de la bandeja.
+
+        El icono solo se sustituye cuando cambia el valor mostrado.
+
+        Args:
+            info (dict): Resultado de SystemModel.get_scheduled_info() o None
+        """
+        if not self.tray_countdown_enabled:
+            return
+        if info is None or info['remaining_seconds'] <= 0:
+            icon = self.tray_renderer.reset()
+        else:
+            icon = self.tray_renderer.render(info['remaining_seconds'], info['original_seconds'])
+        if icon is not None:
+            self.tray_icon.setIcon(icon)
+
     def _setup_shortcuts(self):
         """Configura los atajos de teclado."""
         # Estos atajos se configurarán en el controlador
@@ -265,11 +277,6 @@ class MainView(QMainWindow):
         # Cerrar normalmente
         event.accept()
 
-    def update_countdown(self):
-        """Actualiza la cuenta regresiva en la interfaz."""
-        # Esta función será implementada por el controlador
-        pass
-
     def show_confirmation_dialog(self, action_type, time_str):
         """Muestra un diálogo de confirmación antes de programar una acción.
 
@@ -336,29 +343,19 @@ class MainView(QMainWindow):
             title (str): Título de la notificación
             message (str): Mensaje de la notificación
         """
-        if self.tray_icon.supportsMessages():
+        if self.tray_icon and self.tray_icon.supportsMessages():
             self.tray_icon.showMessage(title, message, QSystemTrayIcon.Information, 5000)
 
     def apply_theme(self, theme):
-        """Aplica un tema a la interfaz.
+        """Refleja el tema activo en la interfaz.
+
+        La hoja de estilo la aplica utils.theme_engine; aquí solo se
+        sincroniza el switch de tema.
 
         Args:
             theme (str): 'light' o 'dark'
         """
-        # Cargar el archivo de estilo correspondiente
-        style_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            'resources', 'styles', f"{theme}.qss"
-        )
-        
-        try:
-            with open(style_path, 'r', encoding='utf-8') as f:
-                self.setStyleSheet(f.read())
-            
-            # Actualizar el estado del switch de tema
-            self.theme_switch.setChecked(theme == 'dark')
-        except Exception as e:
-            print(f"Error al cargar el tema: {str(e)}")
+        self.theme_switch.setChecked(theme == 'dark')
 
     def get_current_action(self):
         """Obtiene la acción seleccionada actualmente.
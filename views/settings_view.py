@@ -32,78 +32,56 @@ class SettingsView(QDialog):
         super().__init__(parent)
         self.i18n = i18n
         self.config_model = config_model
+        # Idioma de los textos mostrados y atajos representados en el formulario
+        self._language = None
+        self._shortcuts = None
         self._init_ui()
+        self.refresh()
 
     def _init_ui(self):
-        """Inicializa la interfaz de usuario."""
+        """Inicializa la interfaz de usuario.
+
+        Solo construye los widgets; los textos y valores se cargan en refresh().
+        """
         # Configuración de la ventana
-        self.setWindowTitle(self.i18n.get_text("settings"))
         self.setMinimumSize(400, 300)
         
         # Layout principal
         main_layout = QVBoxLayout(self)
         
         # Pestañas de configuración
-        tab_widget = QTabWidget()
-        main_layout.addWidget(tab_widget)
+        self.tab_widget = QTabWidget()
+        main_layout.addWidget(self.tab_widget)
         
         # Pestaña de configuración general
         general_tab = QWidget()
         general_layout = QVBoxLayout(general_tab)
         
         # Grupo de idioma
-        language_group = QGroupBox(self.i18n.get_text("language"))
-        language_layout = QVBoxLayout(language_group)
+        self.language_group = QGroupBox()
+        language_layout = QVBoxLayout(self.language_group)
         
         self.language_combo = QComboBox()
-        # Agregar idiomas disponibles
-        for lang_code in self.i18n.get_available_languages():
-            self.language_combo.addItem(
-                self.i18n.get_language_name(lang_code), lang_code
-            )
-        
-        # Seleccionar el idioma actual
-        current_lang = self.config_model.get_language()
-        for i in range(self.language_combo.count()):
-            if self.language_combo.itemData(i) == current_lang:
-                self.language_combo.setCurrentIndex(i)
-                break
-        
         language_layout.addWidget(self.language_combo)
-        general_layout.addWidget(language_group)
+        general_layout.addWidget(self.language_group)
         
         # Grupo de notificaciones
-        notifications_group = QGroupBox(self.i18n.get_text("notifications"))
-        notifications_layout = QVBoxLayout(notifications_group)
+        self.notifications_group = QGroupBox()
+        notifications_layout = QVBoxLayout(self.notifications_group)
         
-        self.show_notifications_check = QCheckBox(
-            self.i18n.get_text("notifications")
-        )
-        self.show_notifications_check.setChecked(
-            self.config_model.get_config("show_notifications")
-        )
+        self.show_notifications_check = QCheckBox()
         notifications_layout.addWidget(self.show_notifications_check)
         
-        general_layout.addWidget(notifications_group)
+        general_layout.addWidget(self.notifications_group)
         
         # Grupo de comportamiento
         behavior_group = QGroupBox("Comportamiento")
         behavior_layout = QVBoxLayout(behavior_group)
         
-        self.minimize_to_tray_check = QCheckBox(
-            self.i18n.get_text("minimize_to_tray")
-        )
-        self.minimize_to_tray_check.setChecked(
-            self.config_model.get_config("minimize_to_tray")
-        )
+        self.minimize_to_tray_check = QCheckBox()
         behavior_layout.addWidget(self.minimize_to_tray_check)
         
-        self.start_minimized_check = QCheckBox(
-            self.i18n.get_text("start_minimized")
-        )
-        self.start_minimized_check.setChecked(
-            self.config_model.get_config("start_minimized")
-        )
+        self.start_minimized_check = QCheckBox()
         behavior_layout.addWidget(self.start_minimized_check)
         
         general_layout.addWidget(behavior_group)
@@ -112,46 +90,109 @@ class SettingsView(QDialog):
         shortcuts_tab = QWidget()
         shortcuts_layout = QVBoxLayout(shortcuts_tab)
         
-        shortcuts_group = QGroupBox(self.i18n.get_text("keyboard_shortcuts"))
-        shortcuts_form = QFormLayout(shortcuts_group)
-        
-        # Mostrar los atajos actuales (solo lectura por ahora)
-        keyboard_shortcuts = self.config_model.get_config("keyboard_shortcuts")
+        self.shortcuts_group = QGroupBox()
+        self.shortcuts_form = QFormLayout(self.shortcuts_group)
         
-        for action, shortcut in keyboard_shortcuts.items():
-            action_label = QLabel(action.capitalize())
-            shortcut_label = QLabel(shortcut)
-            shortcuts_form.addRow(action_label, shortcut_label)
-        
-        shortcuts_layout.addWidget(shortcuts_group)
+        shortcuts_layout.addWidget(self.shortcuts_group)
         
         # Agregar pestañas al widget de pestañas
-        tab_widget.addTab(general_tab, "General")
-        tab_widget.addTab(shortcuts_tab, self.i18n.get_text("keyboard_shortcuts"))
+        self.tab_widget.addTab(general_tab, "General")
+        self.tab_widget.addTab(shortcuts_tab, "")
         
         # Botones de acción
-        button_box = QDialogButtonBox(
+        self.button_box = QDialogButtonBox(
             QDialogButtonBox.Save | QDialogButtonBox.Cancel | QDialogButtonBox.Reset
         )
         
+        self.button_box.accepted.connect(self._on_accept)
+        self.button_box.rejected.connect(self.reject)
+        self.button_box.button(QDialogButtonBox.Reset).clicked.connect(
+            self.reset_settings
+        )
+        
+        main_layout.addWidget(self.button_box)
+
+    def refresh(self):
+        """Carga en el diálogo la configuración actual.
+
+        Los textos solo se traducen de nuevo si cambió el idioma y el
+        formulario de atajos solo se reconstruye si cambiaron los atajos.
+        """
+        if self._language != self.i18n.current_language:
+            self._language = self.i18n.current_language
+            self._retranslate()
+        
+        # Seleccionar el idioma actual
+        self._select_language(self.config_model.get_language())
+        
+        self.show_notifications_check.setChecked(
+            self.config_model.get_config("show_notifications")
+        )
+        self.minimize_to_tray_check.setChecked(
+            self.config_model.get_config("minimize_to_tray")
+        )
+        self.start_minimized_check.setChecked(
+            self.config_model.get_config("start_minimized")
+        )
+        
+        # Las claves bloqueadas por el administrador no se pueden cambiar
+        for key, widget in (("language", self.language_combo),
+                            ("show_notifications", self.show_notifications_check),
+                            ("minimize_to_tray", self.minimize_to_tray_check),
+                            ("start_minimized", self.start_minimized_check)):
+            widget.setEnabled(not self.config_model.is_locked(key))
+        
+        # Mostrar los atajos actuales (solo lectura por ahora)
+        keyboard_shortcuts = self.config_model.get_config("keyboard_shortcuts")
+        if keyboard_shortcuts != self._shortcuts:
+            self._shortcuts = dict(keyboard_shortcuts)
+            while self.shortcuts_form.rowCount():
+                self.shortcuts_form.removeRow(0)
+            for action, shortcut in keyboard_shortcuts.items():
+                action_label = QLabel(action.capitalize())
+                shortcut_label = QLabel(shortcut)
+                self.shortcuts_form.addRow(action_label, shortcut_label)
+
+    def _retranslate(self):
+        """Aplica los textos del idioma actual."""
+        self.setWindowTitle(self.i18n.get_text("settings"))
+        self.language_group.setTitle(self.i18n.get_text("language"))
+        
+        # Agregar idiomas disponibles
+        self.language_combo.clear()
+        for lang_code in self.i18n.get_available_languages():
+            self.language_combo.addItem(
+                self.i18n.get_language_name(lang_code), lang_code
+            )
+        
+        self.notifications_group.setTitle(self.i18n.get_text("notifications"))
+        self.show_notifications_check.setText(self.i18n.get_text("notifications"))
+        self.minimize_to_tray_check.setText(self.i18n.get_text("minimize_to_tray"))
+        self.start_minimized_check.setText(self.i18n.get_text("start_minimized"))
+        self.shortcuts_group.setTitle(self.i18n.get_text("keyboard_shortcuts"))
+        self.tab_widget.setTabText(1, self.i18n.get_text("keyboard_shortcuts"))
+        
         # Traducir los botones
-        button_box.button(QDialogButtonBox.Save).setText(
+        self.button_box.button(QDialogButtonBox.Save).setText(
             self.i18n.get_text("save")
         )
-        button_box.button(QDialogButtonBox.Cancel).setText(
+        self.button_box.button(QDialogButtonBox.Cancel).setText(
             self.i18n.get_text("cancel_button")
         )
-        button_box.button(QDialogButtonBox.Reset).setText(
+        self.button_box.button(QDialogButtonBox.Reset).setText(
             self.i18n.get_text("reset")
         )
-        
-        button_box.accepted.connect(self._on_accept)
-        button_box.rejected.connect(self.reject)
-        button_box.button(QDialogButtonBox.Reset).clicked.connect(
-            self.reset_settings
-        )
-        
-        main_layout.addWidget(button_box)
+
+    def _select_language(self, language):
+        """Selecciona un idioma en el desplegable.
+
+        Args:
+            language (str): Código del idioma
+        """
+        for i in range(self.language_combo.count()):
+            if self.language_combo.itemData(i) == language:
+                self.language_combo.setCurrentIndex(i)
+                break
 
     def _on_accept(self):
         """Maneja el evento de aceptar los cambios."""
@@ -184,11 +225,7 @@ class SettingsView(QDialog):
     def reset_settings(self):
         """Restablece la configuración a los valores predeterminados."""
         # Restablecer idioma
-        default_lang = self.config_model.default_config["language"]
-        for i in range(self.language_combo.count()):
-            if self.language_combo.itemData(i) == default_lang:
-                self.language_combo.setCurrentIndex(i)
-                break
+        self._select_language(self.config_model.default_config["language"])
         
         # Restablecer otras opciones
         self.show_notifications_check.setChecked(
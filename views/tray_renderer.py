@@ -0,0 +1,216 @@
+"""
+Renderizado de la cuenta regresiva en el icono de la bandeja del sistema.
+
+Este módulo dibuja el tiempo restante y un anillo de progreso sobre el icono
+de la aplicación. Los dígitos se rasterizan una sola vez en un atlas de
+glifos y el fondo y cada tramo del anillo se guardan en caché, de modo que
+cada actualización se limita a copiar fragmentos de pixmaps ya rasterizados,
+sin volver a renderizar el SVG ni maquetar texto. El icono solo se regenera
+cuando cambia el valor mostrado.
+"""
+
+from PyQt5.QtCore import QRect, QRectF, Qt
+from PyQt5.QtGui import QColor, QFont, QFontMetrics, QIcon, QPainter, QPen, QPixmap
+
+# Tamaño (px) del icono generado; el sistema lo escala al de la bandeja
+TRAY_ICON_SIZE = 64
+# Tramos del anillo de progreso (uno por cada 1/60 del tiempo total)
+RING_STEPS = 60
+# Caracteres presentes en el atlas de glifos
+GLYPHS = "0123456789:"
+# Texto más ancho que puede mostrarse ('24:00' o '59:59')
+WIDEST_TEXT = "00:00"
+
+# Atlas de glifos compartidos por tamaño de icono: {size: (pixmap, {char: QRect})}
+_atlas_cache = {}
+
+
+def tray_text(remaining):
+    """Texto mostrado en la bandeja para el tiempo restante.
+
+    Con más de una hora pendiente se muestra H:MM (cambia una vez por
+    minuto); por debajo de una hora, MM:SS.
+
+    Args:
+        remaining (int): Segundos restantes
+
+    Returns:
+        str: Texto a mostrar
+    """
+    if remaining >= 3600:
+        hours, remainder = divmod(remaining, 3600)
+        return f"{hours}:{remainder // 60:02d}"
+    minutes, seconds = divmod(remaining, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def update_interval(remaining):
+    """Segundos entre cambios del valor mostrado en la bandeja.
+
+    Args:
+        remaining (float): Segundos restantes
+
+    Returns:
+        int: 60 con más de una hora pendiente, 1 en otro caso
+    """
+    return 60 if remaining >= 3600 else 1
+
+
+def glyph_atlas(size):
+    """Devuelve el atlas de glifos para un tamaño de icono, creándolo si hace falta.
+
+    Args:
+        size (int): Tamaño del icono en píxeles
+
+    Returns:
+        tuple: (QPixmap, dict) - Atlas y rectángulo de cada carácter
+    """
+    atlas = _atlas_cache.get(size)
+    if atlas is not None:
+        return atlas
+
+    # Mayor tamaño de fuente con el que el texto más ancho cabe en el anillo
+    font = QFont()
+    font.setBold(True)
+    pixel_size = int(size * 0.4)
+    while True:
+        font.setPixelSize(pixel_size)
+        metrics = QFontMetrics(font)
+        if metrics.horizontalAdvance(WIDEST_TEXT) <= size * 0.78 or pixel_size <= 6:
+            break
+        pixel_size -= 1
+
+    height = metrics.height()
+    widths = [metrics.horizontalAdvance(char) for char in GLYPHS]
+    pixmap = QPixmap(sum(widths), height)
+    pixmap.fill(Qt.transparent)
+    rects = {}
+    painter = QPainter(pixmap)
+    painter.setFont(font)
+    painter.setPen(QColor(255, 255, 255))
+    x = 0
+    for char, width in zip(GLYPHS, widths):
+        rect = QRect(x, 0, width, height)
+        painter.drawText(rect, Qt.AlignCenter, char)
+        rects[char] = rect
+        x += width
+    painter.end()
+
+    atlas = (pixmap, rects)
+    _atlas_cache[size] = atlas
+    return atlas
+
+
+class TrayCountdownRenderer:
+    """Genera el icono de la bandeja con la cuenta regresiva."""
+
+    def __init__(self, base_icon, size=TRAY_ICON_SIZE):
+        """Inicializa el renderizador.
+
+        Args:
+            base_icon (QIcon): Icono de la aplicación
+            size (int): Tamaño del icono generado en píxeles
+        """
+        self.base_icon = base_icon
+        self.size = size
+        self.atlas, self.glyph_rects = glyph_atlas(size)
+        self._background = None
+        self._rings = {}
+        # Valor mostrado actualmente: None con el icono normal
+        self.displayed = None
+        # Iconos generados (para diagnóstico y benchmarks)
+        self.renders = 0
+
+    def render(self, remaining, total):
+        """Genera el icono si el valor mostrado ha cambiado.
+
+        Args:
+            remaining (int): Segundos restantes
+            total (int): Duración total de la acción en segundos
+
+        Returns:
+            QIcon: Nuevo icono, o None si el mostrado sigue siendo válido
+        """
+        text = tray_text(remaining)
+        # El anillo avanza con el mismo redondeo que el texto, nunca entre medias
+        shown = remaining - remaining % update_interval(remaining)
+        step = (total - shown) * RING_STEPS // total if total > 0 else 0
+        key = (text, step)
+        if key == self.displayed:
+            return None
+        self.displayed = key
+        self.renders += 1
+        return QIcon(self._compose(text, step))
+
+    def reset(self):
+        """Vuelve al icono normal de la aplicación.
+
+        Returns:
+            QIcon: Icono de la aplicación, o None si ya se mostraba
+        """
+        if self.displayed is None:
+            return None
+        self.displayed = None
+        return self.base_icon
+
+    def _compose(self, text, step):
+        """Compone el icono copiando fondo, anillo y glifos ya rasterizados."""
+        pixmap = QPixmap(self._get_background())
+        painter = QPainter(pixmap)
+        if step:
+            painter.drawPixmap(0, 0, self._get_ring(step))
+
+        rects = [self.glyph_rects[char] for char in text]
+        width = sum(rect.width() for rect in rects)
+        x = (self.size - width) // 2
+        y = (self.size - self.atlas.height()) // 2
+        for rect in rects:
+            painter.drawPixmap(x, y, self.atlas, rect.x(), rect.y(), rect.width(), rect.height())
+            x += rect.width()
+        painter.end()
+        return pixmap
+
+    def _get_background(self):
+        """Fondo en caché: icono atenuado bajo un disco oscuro y el anillo vacío."""
+        if self._background is None:
+            size = self.size
+            pixmap = QPixmap(size, size)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setOpacity(0.35)
+            painter.drawPixmap(0, 0, self.base_icon.pixmap(size, size))
+            painter.setOpacity(1.0)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 170))
+            painter.drawEllipse(self._ring_rect())
+            painter.setPen(self._ring_pen(QColor(255, 255, 255, 60)))
+            painter.setBrush(Qt.NoBrush)
+            painter.drawEllipse(self._ring_rect())
+            painter.end()
+            self._background = pixmap
+        return self._background
+
+    def _get_ring(self, step):
+        """Tramo del anillo de progreso en caché para el paso indicado."""
+        ring = self._rings.get(step)
+        if ring is None:
+            ring = QPixmap(self.size, self.size)
+            ring.fill(Qt.transparent)
+            painter = QPainter(ring)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(self._ring_pen(QColor(76, 175, 80)))
+            # Desde las 12 en punto en sentido horario (ángulos en 1/16 de grado)
+            painter.drawArc(self._ring_rect(), 90 * 16, -step * 360 * 16 // RING_STEPS)
+            painter.end()
+            self._rings[step] = ring
+        return ring
+
+    def _ring_rect(self):
+        margin = self.size * 0.06
+        return QRectF(margin, margin, self.size - 2 * margin, self.size - 2 * margin)
+
+    def _ring_pen(self, color):
+        pen = QPen(color, self.size * 0.08)
+        pen.setCapStyle(Qt.FlatCap)
+        return pen